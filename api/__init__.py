@@ -11,11 +11,15 @@ from .reasoning import ReasoningAPI
 from .memory import MemoryAPI
 from .fields import FieldAPI
 from .tools import ToolsAPI
+from .server import ContextEngineApp, AdmissionController, create_app
 
 __all__ = [
     'ContextAPI',
     'ReasoningAPI',
     'MemoryAPI',
     'FieldAPI',
-    'ToolsAPI'
+    'ToolsAPI',
+    'ContextEngineApp',
+    'AdmissionController',
+    'create_app'
 ]
\ No newline at end of file
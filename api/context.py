@@ -7,12 +7,13 @@ access to all context engineering capabilities.
 """
 
 import asyncio
+import time
 from typing import Dict, List, Any, Optional, AsyncGenerator
 from dataclasses import dataclass, asdict
 
 from ..core.engine import ContextualEngine, ContextualRequest, ContextualResponse
 from ..core.config import ContextualConfig
-from ..utils.validation import ValidationUtils, ValidationError
+from ..utils.validation import ValidationUtils, ValidationError, default_context_validator
 from ..utils.logger import ContextualLogger
 
 @dataclass
@@ -59,6 +60,7 @@ class ContextAPI:
         
         try:
             # Validate inputs
+            validation_start = time.perf_counter()
             content_valid, content_errors = ValidationUtils.validate_content_input(content)
             if not content_valid:
                 return APIResponse(
@@ -72,6 +74,7 @@ class ContextAPI:
                     success=False,
                     error=f"Invalid context: {'; '.join(context_errors)}"
                 )
+            validation_time = time.perf_counter() - validation_start
             
             # Process through engine
             result = await self.engine.reason(content, context, **options)
@@ -96,7 +99,8 @@ class ContextAPI:
                 metadata={
                     "request_id": self.request_count,
                     "engine_version": "1.0.0",
-                    "components_used": self._get_active_components()
+                    "components_used": self._get_active_components(),
+                    "validation_time": validation_time
                 }
             )
             
@@ -182,12 +186,14 @@ class ContextAPI:
         
         try:
             # Validate batch inputs
+            validation_start = time.perf_counter()
             batch_valid, batch_errors = ValidationUtils.validate_batch_inputs(contents, contexts)
             if not batch_valid:
                 return APIResponse(
                     success=False,
                     error=f"Invalid batch inputs: {'; '.join(batch_errors)}"
                 )
+            validation_time = time.perf_counter() - validation_start
             
             # Process each item
             results = []
@@ -231,7 +237,8 @@ class ContextAPI:
                 },
                 metadata={
                     "request_id": self.request_count,
-                    "batch_size": len(contents)
+                    "batch_size": len(contents),
+                    "validation_time": validation_time
                 }
             )
             
@@ -258,7 +265,8 @@ class ContextAPI:
                     "field_state": field_state,
                     "memory_state": memory_state,
                     "active_components": self._get_active_components(),
-                    "request_count": self.request_count
+                    "request_count": self.request_count,
+                    "validation_metrics": default_context_validator.get_metrics()
                 },
                 metadata={"timestamp": asyncio.get_event_loop().time()}
             )
@@ -273,22 +281,16 @@ class ContextAPI:
     async def configure_engine(self, config_updates: Dict[str, Any]) -> APIResponse:
         """Update engine configuration."""
         try:
-            # Create new config with updates
-            current_config = self.engine.config
-            new_config = ContextualConfig.from_dict({
-                **current_config.to_dict(),
-                **config_updates
-            })
-            
-            # Validate new configuration
-            # (Add validation logic here if needed)
-            
-            # Apply new configuration
-            self.engine.configure(new_config)
+            # Merge updates into the current config; configure() validates
+            # and applies changed keys to the live components
+            new_config = ContextualConfig.from_dict(
+                self.engine.config_manager.merged_config(config_updates)
+            )
+            changed_keys = self.engine.configure(new_config)
             
             return APIResponse(
                 success=True,
-                data={"message": "Configuration updated successfully"},
+                data={"message": "Configuration updated successfully", "changed_keys": changed_keys},
                 metadata={"config_updates": config_updates}
             )
             
@@ -24,9 +24,14 @@ class FieldAPI:
     resonance measurement, and attractor management.
     """
     
-    def __init__(self, config: Optional[NeuralFieldsConfig] = None):
-        self.config = config or NeuralFieldsConfig()
-        self.neural_fields = NeuralFieldManager(self.config)
+    def __init__(
+        self,
+        config: Optional[NeuralFieldsConfig] = None,
+        neural_fields: Optional[NeuralFieldManager] = None
+    ):
+        # An existing manager, e.g. a ContextualEngine's, is shared rather than copied
+        self.neural_fields = neural_fields or NeuralFieldManager(config or NeuralFieldsConfig())
+        self.config = self.neural_fields.config
         self.logger = ContextualLogger("FieldAPI")
         
         self.logger.info("Field API initialized")
@@ -135,8 +140,8 @@ class FieldAPI:
                 data={
                     "field_state": field_state,
                     "field_summary": {
-                        "total_patterns": len(field_state.get("semantic_field", {}).get("patterns", {})) + 
-                                        len(field_state.get("cognitive_field", {}).get("patterns", {})),
+                        "total_patterns": field_state["semantic_field"]["pattern_count"] + 
+                                        field_state["cognitive_field"]["pattern_count"],
                         "total_attractors": len(field_state.get("attractors", {})),
                         "field_energy": field_state.get("field_energy", 0),
                         "stability": field_state.get("stability", 0),
@@ -272,16 +277,42 @@ class FieldAPI:
                 error=f"Field reset error: {str(e)}"
             )
     
+    async def get_field_patterns(
+        self,
+        field_type: str,
+        offset: int = 0,
+        limit: int = 50
+    ) -> APIResponse:
+        """Get a page of patterns from a neural field."""
+        try:
+            patterns_page = self.neural_fields.get_field_patterns(field_type, offset, limit)
+            
+            return APIResponse(
+                success=True,
+                data={
+                    "field_patterns": patterns_page,
+                    "has_more": offset + limit < patterns_page["pattern_count"]
+                }
+            )
+            
+        except Exception as e:
+            self.logger.error(f"Error getting field patterns: {str(e)}")
+            return APIResponse(
+                success=False,
+                error=f"Field patterns error: {str(e)}"
+            )
+    
     async def get_field_analytics(self) -> APIResponse:
         """Get field analytics and insights."""
         try:
-            field_state = self.neural_fields.get_field_state()
+            # Summaries carry counts and energies, not every pattern string
+            field_summary = self.neural_fields.get_field_summary()
             
             # Calculate analytics
             analytics = {
-                "field_health": self._analyze_field_health(field_state),
-                "pattern_distribution": self._analyze_pattern_distribution(field_state),
-                "attractor_analysis": self._analyze_attractors(field_state),
+                "field_health": self._analyze_field_health(field_summary),
+                "pattern_distribution": self._analyze_pattern_distribution(field_summary),
+                "attractor_analysis": self._analyze_attractors(field_summary),
                 "resonance_patterns": self._analyze_resonance_patterns(),
                 "field_evolution": self._analyze_field_evolution()
             }
@@ -290,7 +321,7 @@ class FieldAPI:
                 success=True,
                 data={
                     "analytics": analytics,
-                    "field_state": field_state,
+                    "field_summary": field_summary,
                     "recommendations": self._generate_field_recommendations(analytics)
                 }
             )
@@ -334,8 +365,8 @@ class FieldAPI:
     
     def _analyze_pattern_distribution(self, field_state: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze pattern distribution across fields."""
-        semantic_patterns = len(field_state.get("semantic_field", {}).get("patterns", {}))
-        cognitive_patterns = len(field_state.get("cognitive_field", {}).get("patterns", {}))
+        semantic_patterns = field_state.get("semantic_field", {}).get("pattern_count", 0)
+        cognitive_patterns = field_state.get("cognitive_field", {}).get("pattern_count", 0)
         total_patterns = semantic_patterns + cognitive_patterns
         
         return {
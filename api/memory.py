@@ -24,9 +24,14 @@ class MemoryAPI:
     memory storage, retrieval, and consolidation operations.
     """
     
-    def __init__(self, config: Optional[MemoryConfig] = None):
-        self.config = config or MemoryConfig()
-        self.memory_manager = MemoryManager(self.config)
+    def __init__(
+        self,
+        config: Optional[MemoryConfig] = None,
+        memory_manager: Optional[MemoryManager] = None
+    ):
+        # An existing manager, e.g. a ContextualEngine's, is shared rather than copied
+        self.memory_manager = memory_manager or MemoryManager(config or MemoryConfig())
+        self.config = self.memory_manager.config
         self.logger = ContextualLogger("MemoryAPI")
         
         self.logger.info("Memory API initialized")
@@ -223,6 +228,35 @@ class MemoryAPI:
                 error=f"Memory analytics error: {str(e)}"
             )
     
+    async def get_efficiency_curve(
+        self,
+        memory_budget: Optional[int] = None,
+        max_points: int = 100
+    ) -> APIResponse:
+        """Get efficiency versus retained memory count for budget planning."""
+        try:
+            if memory_budget is not None and memory_budget <= 0:
+                return APIResponse(
+                    success=False,
+                    error="Memory budget must be positive"
+                )
+            
+            efficiency_curve = self.memory_manager.efficiency_optimizer.get_efficiency_curve(
+                self.memory_manager.memory_items, memory_budget, max_points
+            )
+            
+            return APIResponse(
+                success=True,
+                data={"efficiency_curve": efficiency_curve}
+            )
+            
+        except Exception as e:
+            self.logger.error(f"Error getting efficiency curve: {str(e)}")
+            return APIResponse(
+                success=False,
+                error=f"Efficiency curve error: {str(e)}"
+            )
+    
     async def clear_memories(
         self,
         criteria: Optional[Dict[str, Any]] = None
@@ -271,45 +305,39 @@ class MemoryAPI:
     
     def _analyze_memory_distribution(self) -> Dict[str, Any]:
         """Analyze distribution of memories."""
-        if not hasattr(self.memory_manager, 'memory_items'):
+        if not hasattr(self.memory_manager, 'memory_stats'):
             return {"no_memories": True}
         
-        memories = self.memory_manager.memory_items
+        memory_stats = self.memory_manager.memory_stats
         
-        if not memories:
+        if not memory_stats.count:
             return {"empty_memory": True}
         
-        # Analyze reasoning values distribution
-        reasoning_values = [memory.reasoning_value for memory in memories.values()]
-        
+        # Running statistics keep analytics independent of the memory count
         return {
-            "total_memories": len(memories),
-            "reasoning_value_stats": {
-                "average": sum(reasoning_values) / len(reasoning_values),
-                "min": min(reasoning_values),
-                "max": max(reasoning_values)
-            },
-            "high_value_memories": len([rv for rv in reasoning_values if rv > 0.8]),
-            "low_value_memories": len([rv for rv in reasoning_values if rv < 0.3])
+            "total_memories": memory_stats.count,
+            "reasoning_value_stats": memory_stats.get_reasoning_value_stats(),
+            "reasoning_value_histogram": list(memory_stats.reasoning_value_histogram),
+            "high_value_memories": memory_stats.high_value_count,
+            "low_value_memories": memory_stats.low_value_count
         }
     
     def _analyze_access_patterns(self) -> Dict[str, Any]:
         """Analyze memory access patterns."""
-        if not hasattr(self.memory_manager, 'memory_items'):
+        if not hasattr(self.memory_manager, 'memory_stats'):
             return {"no_data": True}
         
-        memories = self.memory_manager.memory_items
+        memory_stats = self.memory_manager.memory_stats
         
-        if not memories:
+        if not memory_stats.count:
             return {"empty_memory": True}
         
-        access_counts = [memory.access_count for memory in memories.values()]
-        
         return {
-            "total_accesses": sum(access_counts),
-            "average_accesses": sum(access_counts) / len(access_counts),
-            "never_accessed": len([ac for ac in access_counts if ac == 0]),
-            "frequently_accessed": len([ac for ac in access_counts if ac > 5])
+            "total_accesses": memory_stats.total_accesses,
+            "average_accesses": memory_stats.total_accesses / memory_stats.count,
+            "never_accessed": memory_stats.access_counts.get(0, 0),
+            "frequently_accessed": memory_stats.count_accessed_over(5),
+            "access_histogram": memory_stats.get_access_histogram()
         }
     
     def _analyze_efficiency_trends(self) -> Dict[str, Any]:
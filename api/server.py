@@ -0,0 +1,507 @@
+"""
+ASGI Server - HTTP Interface for the Contextual Engine
+======================================================
+
+ASGI application exposing ContextAPI, MemoryAPI and FieldAPI as JSON
+endpoints, plus reasoning streams over server-sent events and WebSocket,
+with admission control in front of the engine and graceful drain on
+shutdown. Every worker process builds its own engine; run it with
+`context-engine serve`. Engine state is per worker, so with several
+workers /v1/configure and /v1/reset are refused: change settings through
+a configuration file served with --watch-config, which every worker reloads.
+"""
+
+import asyncio
+import json
+import os
+import time
+from typing import Dict, List, Any, Optional, Tuple, AsyncIterator
+from urllib.parse import parse_qsl
+
+from ..core.config import ContextualConfig
+from ..utils.config import ConfigManager
+from ..utils.logger import ContextualLogger
+from .context import ContextAPI, APIResponse
+from .memory import MemoryAPI
+from .fields import FieldAPI
+from .streaming import WebSocketSession, stream_sse
+
+MAX_BODY_BYTES = 1024 * 1024  # Larger request bodies are rejected with 413
+
+class HTTPError(Exception):
+    """Error answered with an HTTP status instead of an API response"""
+
+    def __init__(self, status: int, message: str, headers: Optional[List[Tuple[bytes, bytes]]] = None):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+        self.headers = headers or []
+
+class AdmissionRejected(HTTPError):
+    """Request turned away because the worker is saturated or shutting down"""
+
+    def __init__(self, message: str, retry_after: int = 1):
+        super().__init__(503, message, [(b"retry-after", str(retry_after).encode())])
+
+class AdmissionController:
+    """Bounds concurrent engine work and the queue of requests waiting for it"""
+
+    def __init__(self, max_concurrency: int = 8, max_queue: int = 64, queue_timeout: float = 10.0):
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.draining = False
+        self._slots = asyncio.Semaphore(max_concurrency)
+        self._idle = asyncio.Event()
+        self._idle.set()
+
+        # Counters
+        self.in_flight = 0
+        self.queued = 0
+        self.admitted = 0
+        self.rejected = 0
+        self.timed_out = 0
+
+    async def __aenter__(self) -> "AdmissionController":
+        if self.draining:
+            self.rejected += 1
+            raise AdmissionRejected("Server is shutting down")
+
+        if self._slots.locked():
+            # Shed load up front rather than letting the queue grow unbounded
+            if self.queued >= self.max_queue:
+                self.rejected += 1
+                raise AdmissionRejected("Request queue is full")
+
+            self.queued += 1
+            self._idle.clear()
+            try:
+                await asyncio.wait_for(self._slots.acquire(), self.queue_timeout)
+            except asyncio.TimeoutError:
+                self.timed_out += 1
+                raise AdmissionRejected("Timed out waiting in request queue")
+            finally:
+                self.queued -= 1
+                self._update_idle()
+        else:
+            await self._slots.acquire()
+
+        self.in_flight += 1
+        self.admitted += 1
+        self._idle.clear()
+        return self
+
+    async def __aexit__(self, exc_type, exc, traceback):
+        self.in_flight -= 1
+        self._slots.release()
+        self._update_idle()
+
+    def _update_idle(self):
+        """Signal drain waiters once nothing is queued or running"""
+        if not self.in_flight and not self.queued:
+            self._idle.set()
+
+    async def drain(self, timeout: float) -> bool:
+        """Stop admitting requests and wait for admitted ones to finish"""
+        self.draining = True
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get admission counters"""
+        return {
+            "max_concurrency": self.max_concurrency,
+            "max_queue": self.max_queue,
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "timed_out": self.timed_out,
+            "draining": self.draining
+        }
+
+class ContextEngineApp:
+    """ASGI application serving one ContextualEngine per worker process"""
+
+    def __init__(
+        self,
+        config: Optional[ContextualConfig] = None,
+        max_concurrency: int = 8,
+        max_queue: int = 64,
+        queue_timeout: float = 10.0,
+        drain_timeout: float = 30.0,
+        config_path: Optional[str] = None,
+        max_body_bytes: int = MAX_BODY_BYTES,
+        heartbeat_interval: float = 15.0,
+        send_timeout: float = 30.0,
+        max_buffered_events: int = 64,
+        max_streams_per_connection: int = 8,
+        workers: int = 1
+    ):
+        self.config = config
+        self.workers = workers  # Worker processes sharing the listen socket, each with its own engine
+        self.config_path = config_path  # Watched for live reloads when set
+        self.drain_timeout = drain_timeout
+        self.max_body_bytes = max_body_bytes
+        self.heartbeat_interval = heartbeat_interval  # Idle seconds before a stream heartbeat
+        self.send_timeout = send_timeout  # Seconds a stalled client may block a stream
+        self.max_buffered_events = max_buffered_events
+        self.max_streams_per_connection = max_streams_per_connection
+        self.admission = AdmissionController(max_concurrency, max_queue, queue_timeout)
+        self.context_api: Optional[ContextAPI] = None
+        self._memory_api: Optional[MemoryAPI] = None
+        self._field_api: Optional[FieldAPI] = None
+        self.started_at: Optional[float] = None
+        self.logger = ContextualLogger("ContextEngineApp")
+
+        self.routes = {
+            ("GET", "/health"): self._health,
+            ("GET", "/v1/status"): self._status,
+            ("POST", "/v1/process"): self._process,
+            ("POST", "/v1/process/batch"): self._process_batch,
+            ("POST", "/v1/configure"): self._configure,
+            ("POST", "/v1/reset"): self._reset,
+            ("POST", "/v1/memory/store"): self._store_memory,
+            ("POST", "/v1/memory/retrieve"): self._retrieve_memories,
+            ("POST", "/v1/memory/consolidate"): self._consolidate_memories,
+            ("GET", "/v1/memory/state"): self._memory_state,
+            ("GET", "/v1/memory/analytics"): self._memory_analytics,
+            ("POST", "/v1/fields/inject"): self._inject_pattern,
+            ("POST", "/v1/fields/resonance"): self._measure_resonance,
+            ("GET", "/v1/fields/state"): self._field_state,
+            ("GET", "/v1/fields/attractors"): self._field_attractors,
+            ("GET", "/v1/fields/patterns"): self._field_patterns,
+            ("GET", "/v1/fields/analytics"): self._field_analytics
+        }
+        self.unadmitted_routes = {("GET", "/health")}  # Must answer even when saturated
+        self.stream_routes = {("GET", "/v1/process/stream"), ("POST", "/v1/process/stream")}
+        self.websocket_path = "/v1/ws"
+
+    async def __call__(self, scope: Dict[str, Any], receive, send):
+        if scope["type"] == "http":
+            await self._handle_http(scope, receive, send)
+        elif scope["type"] == "lifespan":
+            await self._handle_lifespan(receive, send)
+        elif scope["type"] == "websocket":
+            if scope["path"] != self.websocket_path:
+                await send({"type": "websocket.close", "code": 1008})
+                return
+            await WebSocketSession(
+                receive,
+                send,
+                self.admission,
+                self._open_stream,
+                heartbeat_interval=self.heartbeat_interval,
+                send_timeout=self.send_timeout,
+                max_buffered_events=self.max_buffered_events,
+                max_streams=self.max_streams_per_connection
+            ).run()
+
+    def startup(self):
+        """Build this worker's engine; must run inside the worker's event loop"""
+        if self.context_api is not None:
+            return
+
+        self.context_api = ContextAPI(self.config)
+        if self.config_path:
+            self.context_api.engine.watch_config_file(self.config_path)
+        self.started_at = time.time()
+        self.logger.info(f"Engine ready in worker {os.getpid()}")
+
+    async def shutdown(self):
+        """Stop admitting requests and let in-flight ones finish"""
+        drained = await self.admission.drain(self.drain_timeout)
+        if not drained:
+            self.logger.warning(
+                f"Drain timed out with {self.admission.in_flight} requests in flight"
+            )
+        if self.context_api is not None:
+            self.context_api.engine.stop_config_watch()
+        self.logger.info(f"Worker {os.getpid()} shut down")
+
+    async def _handle_lifespan(self, receive, send):
+        """Run startup and shutdown around the worker's lifetime"""
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                try:
+                    self.startup()
+                except Exception as e:
+                    await send({"type": "lifespan.startup.failed", "message": str(e)})
+                    return
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await self.shutdown()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def _handle_http(self, scope: Dict[str, Any], receive, send):
+        """Route a request, applying admission control to engine work"""
+        route = (scope["method"], scope["path"])
+        handler = self.routes.get(route)
+
+        try:
+            if route in self.stream_routes:
+                await self._handle_sse(scope, receive, send)
+                return
+
+            if handler is None:
+                if any(path == scope["path"] for _, path in [*self.routes, *self.stream_routes]):
+                    raise HTTPError(405, f"Method not allowed: {scope['method']}")
+                raise HTTPError(404, f"Not found: {scope['path']}")
+
+            if scope["method"] == "GET":
+                body = dict(parse_qsl(scope.get("query_string", b"").decode("latin-1")))
+            else:
+                body = await self._read_json(receive)
+
+            if route in self.unadmitted_routes:
+                response = await handler(body)
+            else:
+                async with self.admission:
+                    self.startup()
+                    response = await handler(body)
+        except HTTPError as e:
+            await self._send_json(send, e.status, {"success": False, "error": e.message}, e.headers)
+            return
+        except Exception as e:
+            self.logger.error(f"Unhandled error in {scope['method']} {scope['path']}: {e}")
+            await self._send_json(send, 500, {"success": False, "error": f"Internal error: {e}"})
+            return
+
+        await self._send_json(send, 200 if response.success else 400, {
+            "success": response.success,
+            "data": response.data,
+            "error": response.error,
+            "metadata": response.metadata
+        })
+
+    async def _handle_sse(self, scope: Dict[str, Any], receive, send):
+        """Stream reasoning updates as server-sent events"""
+        if scope["method"] == "GET":
+            # EventSource clients can only send GET requests
+            body = dict(parse_qsl(scope.get("query_string", b"").decode("latin-1")))
+        else:
+            body = await self._read_json(receive)
+
+        async with self.admission:
+            source = self._open_stream(body)
+            completed = await stream_sse(
+                source,
+                receive,
+                send,
+                heartbeat_interval=self.heartbeat_interval,
+                send_timeout=self.send_timeout,
+                extra_headers=[(b"connection", b"close")] if self.admission.draining else None
+            )
+        if not completed:
+            self.logger.info("Stream cancelled: client disconnected or stopped reading")
+
+    def _open_stream(self, body: Dict[str, Any]) -> AsyncIterator[APIResponse]:
+        """Start a ContextAPI.process_stream for a request body"""
+        self.startup()
+        context = body.get("context")
+        if isinstance(context, str):
+            # Query strings carry the context as JSON text
+            try:
+                context = json.loads(context)
+            except ValueError:
+                raise HTTPError(400, "context must be a JSON object")
+        return self.context_api.process_stream(self._require(body, "content"), context, **self._options(body))
+
+    def _options(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        """Get the processing options of a request body"""
+        options = body.get("options", {})
+        if not isinstance(options, dict):
+            raise HTTPError(400, "options must be a JSON object")
+        return options
+
+    def _require_single_worker(self, route: str, alternative: str):
+        """Refuse engine-wide changes that would reach only one of several workers"""
+        if self.workers > 1:
+            raise HTTPError(409, f"{route} would change only one of {self.workers} workers; {alternative}")
+
+    async def _read_json(self, receive) -> Dict[str, Any]:
+        """Read a JSON object request body"""
+        chunks = []
+        size = 0
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                raise HTTPError(400, "Client disconnected")
+            chunk = message.get("body", b"")
+            size += len(chunk)
+            if size > self.max_body_bytes:
+                raise HTTPError(413, f"Request body exceeds {self.max_body_bytes} bytes")
+            chunks.append(chunk)
+            if not message.get("more_body", False):
+                break
+
+        if not size:
+            return {}
+        try:
+            payload = json.loads(b"".join(chunks))
+        except ValueError as e:
+            raise HTTPError(400, f"Invalid JSON body: {e}")
+        if not isinstance(payload, dict):
+            raise HTTPError(400, "Request body must be a JSON object")
+        return payload
+
+    async def _send_json(
+        self,
+        send,
+        status: int,
+        payload: Dict[str, Any],
+        headers: Optional[List[Tuple[bytes, bytes]]] = None
+    ):
+        """Send a complete JSON response"""
+        body = json.dumps(payload, default=str).encode()
+        response_headers = [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode())
+        ]
+        if self.admission.draining:
+            # Keep-alive clients should reconnect to a worker that is not draining
+            response_headers.append((b"connection", b"close"))
+
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": response_headers + (headers or [])
+        })
+        await send({"type": "http.response.body", "body": body})
+
+    def _require(self, body: Dict[str, Any], key: str) -> Any:
+        """Get a required request field"""
+        if key not in body:
+            raise HTTPError(400, f"Missing required field: {key}")
+        return body[key]
+
+    def _int_param(self, body: Dict[str, Any], key: str, default: int) -> int:
+        """Get an integer request field, which query strings carry as text"""
+        try:
+            return int(body.get(key, default))
+        except (TypeError, ValueError):
+            raise HTTPError(400, f"{key} must be an integer")
+
+    def _get_memory_api(self) -> MemoryAPI:
+        """Get a MemoryAPI over the engine's current memory manager"""
+        memory_manager = self.context_api.engine.memory_manager
+        if memory_manager is None:
+            raise HTTPError(404, "Memory system is disabled")
+        if self._memory_api is None or self._memory_api.memory_manager is not memory_manager:
+            self._memory_api = MemoryAPI(memory_manager=memory_manager)
+        return self._memory_api
+
+    def _get_field_api(self) -> FieldAPI:
+        """Get a FieldAPI over the engine's current neural field manager"""
+        neural_fields = self.context_api.engine.neural_fields
+        if neural_fields is None:
+            raise HTTPError(404, "Neural fields are disabled")
+        if self._field_api is None or self._field_api.neural_fields is not neural_fields:
+            self._field_api = FieldAPI(neural_fields=neural_fields)
+        return self._field_api
+
+    async def _health(self, body: Dict[str, Any]) -> APIResponse:
+        return APIResponse(
+            success=True,
+            data={
+                "status": "draining" if self.admission.draining else "ok",
+                "pid": os.getpid(),
+                "uptime": time.time() - self.started_at if self.started_at else 0.0,
+                "admission": self.admission.get_stats()
+            }
+        )
+
+    async def _status(self, body: Dict[str, Any]) -> APIResponse:
+        response = await self.context_api.get_engine_status()
+        if response.success:
+            response.data["admission"] = self.admission.get_stats()
+        return response
+
+    async def _process(self, body: Dict[str, Any]) -> APIResponse:
+        return await self.context_api.process(
+            self._require(body, "content"), body.get("context"), **self._options(body)
+        )
+
+    async def _process_batch(self, body: Dict[str, Any]) -> APIResponse:
+        return await self.context_api.process_batch(
+            self._require(body, "contents"), body.get("contexts"), **self._options(body)
+        )
+
+    async def _configure(self, body: Dict[str, Any]) -> APIResponse:
+        self._require_single_worker(
+            "/v1/configure", "edit the configuration file served with --watch-config instead"
+        )
+        return await self.context_api.configure_engine(body)
+
+    async def _reset(self, body: Dict[str, Any]) -> APIResponse:
+        self._require_single_worker("/v1/reset", "restart the server instead")
+        return await self.context_api.reset_engine()
+
+    async def _store_memory(self, body: Dict[str, Any]) -> APIResponse:
+        return await self._get_memory_api().store_memory(
+            self._require(body, "content"), body.get("context"), body.get("priority", 1.0)
+        )
+
+    async def _retrieve_memories(self, body: Dict[str, Any]) -> APIResponse:
+        return await self._get_memory_api().retrieve_memories(
+            self._require(body, "query"), self._int_param(body, "max_results", 5), body.get("context")
+        )
+
+    async def _consolidate_memories(self, body: Dict[str, Any]) -> APIResponse:
+        return await self._get_memory_api().consolidate_memories()
+
+    async def _memory_state(self, body: Dict[str, Any]) -> APIResponse:
+        return await self._get_memory_api().get_memory_state()
+
+    async def _memory_analytics(self, body: Dict[str, Any]) -> APIResponse:
+        return await self._get_memory_api().get_memory_analytics()
+
+    async def _inject_pattern(self, body: Dict[str, Any]) -> APIResponse:
+        return await self._get_field_api().inject_pattern(
+            self._require(body, "pattern"), body.get("strength", 1.0), body.get("field_type", "both")
+        )
+
+    async def _measure_resonance(self, body: Dict[str, Any]) -> APIResponse:
+        return await self._get_field_api().measure_resonance(
+            self._require(body, "content"), body.get("context")
+        )
+
+    async def _field_state(self, body: Dict[str, Any]) -> APIResponse:
+        return await self._get_field_api().get_field_state()
+
+    async def _field_attractors(self, body: Dict[str, Any]) -> APIResponse:
+        return await self._get_field_api().get_attractors()
+
+    async def _field_patterns(self, body: Dict[str, Any]) -> APIResponse:
+        return await self._get_field_api().get_field_patterns(
+            body.get("field_type", "semantic"),
+            self._int_param(body, "offset", 0),
+            self._int_param(body, "limit", 50)
+        )
+
+    async def _field_analytics(self, body: Dict[str, Any]) -> APIResponse:
+        return await self._get_field_api().get_field_analytics()
+
+def create_app() -> ContextEngineApp:
+    """Build the application from CONTEXT_ENGINE_* environment settings"""
+    config_path = os.environ.get("CONTEXT_ENGINE_CONFIG") or None
+    config = None
+    if config_path:
+        config = ContextualConfig.from_dict(ConfigManager.read_config_file(config_path))
+
+    return ContextEngineApp(
+        config=config,
+        max_concurrency=int(os.environ.get("CONTEXT_ENGINE_MAX_CONCURRENCY", 8)),
+        max_queue=int(os.environ.get("CONTEXT_ENGINE_MAX_QUEUE", 64)),
+        queue_timeout=float(os.environ.get("CONTEXT_ENGINE_QUEUE_TIMEOUT", 10.0)),
+        drain_timeout=float(os.environ.get("CONTEXT_ENGINE_DRAIN_TIMEOUT", 30.0)),
+        config_path=config_path if os.environ.get("CONTEXT_ENGINE_WATCH_CONFIG") == "1" else None,
+        heartbeat_interval=float(os.environ.get("CONTEXT_ENGINE_HEARTBEAT_INTERVAL", 15.0)),
+        max_streams_per_connection=int(os.environ.get("CONTEXT_ENGINE_MAX_STREAMS", 8)),
+        workers=int(os.environ.get("CONTEXT_ENGINE_WORKERS", 1))
+    )
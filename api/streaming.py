@@ -0,0 +1,257 @@
+"""
+Streaming - Server-Sent Events and WebSocket Transports
+=======================================================
+
+Relays ContextAPI.process_stream updates to HTTP clients, either as
+server-sent events or over a WebSocket that multiplexes any number of
+reasoning streams. Both transports send heartbeats while idle, bound the
+output buffered per connection, and cancel reasoning when the client
+goes away.
+"""
+
+import asyncio
+import contextlib
+import json
+import time
+from typing import Dict, List, Any, Optional, AsyncIterator, Callable, Tuple
+
+from .context import APIResponse
+
+HEARTBEAT = object()  # Yielded by with_heartbeats when the source was idle
+SSE_HEARTBEAT = b": heartbeat\n\n"  # Comment line, ignored by EventSource clients
+SSE_HEADERS = [
+    (b"content-type", b"text/event-stream"),
+    (b"cache-control", b"no-cache"),
+    (b"x-accel-buffering", b"no")  # Keep reverse proxies from buffering events
+]
+
+def stream_event(response: APIResponse) -> Tuple[str, Dict[str, Any]]:
+    """Get the event name and payload for a streamed API response"""
+    if not response.success:
+        return "error", {"error": response.error}
+
+    status = response.data.get("status")
+    if status == "processing":
+        return "phase", response.data
+    return status or "update", response.data
+
+def format_sse(event: str, data: Any, event_id: Optional[int] = None) -> bytes:
+    """Encode one server-sent event; JSON data never spans lines"""
+    lines = [] if event_id is None else [f"id: {event_id}"]
+    lines.append(f"event: {event}")
+    lines.append(f"data: {json.dumps(data, default=str)}")
+    return ("\n".join(lines) + "\n\n").encode()
+
+async def with_heartbeats(
+    source: AsyncIterator[Any],
+    interval: float,
+    stop: asyncio.Future
+) -> AsyncIterator[Any]:
+    """Yield events from source, or HEARTBEAT after interval idle seconds, until stop completes"""
+    pending: Optional[asyncio.Future] = None
+    try:
+        while not stop.done():
+            if pending is None:
+                pending = asyncio.ensure_future(source.__anext__())
+
+            done, _ = await asyncio.wait(
+                {pending, stop}, timeout=interval, return_when=asyncio.FIRST_COMPLETED
+            )
+            if pending in done:
+                try:
+                    event = pending.result()
+                except StopAsyncIteration:
+                    return
+                finally:
+                    pending = None
+                yield event
+            elif not done:
+                yield HEARTBEAT
+    finally:
+        if pending is not None:
+            pending.cancel()
+            await asyncio.wait({pending})  # Let the source finish unwinding before it is closed
+
+async def wait_for_disconnect(receive: Callable) -> None:
+    """Return once the HTTP client disconnects"""
+    while True:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            return
+
+async def stream_sse(
+    source: AsyncIterator[APIResponse],
+    receive: Callable,
+    send: Callable,
+    heartbeat_interval: float = 15.0,
+    send_timeout: float = 30.0,
+    extra_headers: Optional[List[Tuple[bytes, bytes]]] = None
+) -> bool:
+    """Send source updates as a server-sent event response; False if the client went away"""
+    disconnected = asyncio.ensure_future(wait_for_disconnect(receive))
+    events = with_heartbeats(source, heartbeat_interval, disconnected)
+    completed = False
+
+    await send({"type": "http.response.start", "status": 200, "headers": SSE_HEADERS + (extra_headers or [])})
+    try:
+        event_id = 0
+        async for event in events:
+            if event is HEARTBEAT:
+                chunk = SSE_HEARTBEAT
+            else:
+                event_id += 1
+                chunk = format_sse(*stream_event(event), event_id)
+
+            # A client that stops reading cannot hold the stream open forever
+            await asyncio.wait_for(
+                send({"type": "http.response.body", "body": chunk, "more_body": True}), send_timeout
+            )
+        completed = not disconnected.done()
+    except asyncio.TimeoutError:
+        pass
+    finally:
+        disconnected.cancel()
+        await events.aclose()
+        await source.aclose()  # Cancels reasoning that is still running
+
+    if completed:
+        await send({"type": "http.response.body", "body": b"", "more_body": False})
+    return completed
+
+class WebSocketSession:
+    """
+    One WebSocket connection carrying concurrent reasoning streams.
+
+    Client messages are JSON objects:
+    - {"type": "reason", "id": "a", "content": "...", "context": {...}, "options": {...}}
+    - {"type": "cancel", "id": "a"}
+    - {"type": "ping"}
+
+    Server messages carry the stream id: "starting", "phase", "completed",
+    "error" and "cancelled", plus connection-level "heartbeat" and "pong".
+    """
+
+    def __init__(
+        self,
+        receive: Callable,
+        send: Callable,
+        admission,
+        open_stream: Callable[[Dict[str, Any]], AsyncIterator[APIResponse]],
+        heartbeat_interval: float = 15.0,
+        send_timeout: float = 30.0,
+        max_buffered_events: int = 64,
+        max_streams: int = 8
+    ):
+        self.receive = receive
+        self.send = send
+        self.admission = admission  # Each stream is admitted like a request
+        self.open_stream = open_stream
+        self.heartbeat_interval = heartbeat_interval
+        self.send_timeout = send_timeout
+        self.max_streams = max_streams
+        self.outgoing: asyncio.Queue = asyncio.Queue(max_buffered_events)
+        self.streams: Dict[str, asyncio.Task] = {}
+
+    async def run(self):
+        """Serve the connection until either side closes it"""
+        message = await self.receive()
+        if message["type"] != "websocket.connect":
+            return
+        await self.send({"type": "websocket.accept"})
+
+        reader = asyncio.ensure_future(self._read())
+        writer = asyncio.ensure_future(self._write())
+        try:
+            # The writer only finishes early when the client stops reading
+            done, _ = await asyncio.wait({reader, writer}, return_when=asyncio.FIRST_COMPLETED)
+            if writer in done:
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(
+                        self.send({"type": "websocket.close", "code": 1008, "reason": "Client too slow"}),
+                        self.send_timeout
+                    )
+        finally:
+            for task in [reader, writer, *self.streams.values()]:
+                task.cancel()
+            await asyncio.gather(reader, writer, *self.streams.values(), return_exceptions=True)
+
+    async def _read(self):
+        """Handle client messages until disconnect"""
+        while True:
+            message = await self.receive()
+            if message["type"] == "websocket.disconnect":
+                return
+            try:
+                request = json.loads(message.get("text") or message.get("bytes") or b"")
+                if not isinstance(request, dict):
+                    raise ValueError("Message must be a JSON object")
+            except ValueError as e:
+                await self.outgoing.put({"type": "error", "id": None, "error": f"Invalid message: {e}"})
+                continue
+            await self._handle(request)
+
+    async def _handle(self, request: Dict[str, Any]):
+        """Dispatch one client message"""
+        message_type = request.get("type")
+        stream_id = str(request.get("id", "0"))
+
+        if message_type == "reason":
+            if stream_id in self.streams:
+                error = f"Stream {stream_id} is already running"
+            elif len(self.streams) >= self.max_streams:
+                error = f"At most {self.max_streams} concurrent streams per connection"
+            else:
+                self.streams[stream_id] = asyncio.ensure_future(self._run_stream(stream_id, request))
+                return
+            await self.outgoing.put({"type": "error", "id": stream_id, "error": error})
+        elif message_type == "cancel":
+            task = self.streams.pop(stream_id, None)
+            if task is not None:
+                task.cancel()
+                await self.outgoing.put({"type": "cancelled", "id": stream_id})
+        elif message_type == "ping":
+            await self.outgoing.put({"type": "pong", "timestamp": time.time()})
+        else:
+            await self.outgoing.put({
+                "type": "error", "id": request.get("id"), "error": f"Unknown message type: {message_type}"
+            })
+
+    async def _run_stream(self, stream_id: str, request: Dict[str, Any]):
+        """Relay one reasoning stream; a full outgoing buffer pauses it"""
+        try:
+            async with self.admission:
+                source = self.open_stream(request)
+                try:
+                    async for response in source:
+                        event, data = stream_event(response)
+                        await self.outgoing.put({"type": event, "id": stream_id, "data": data})
+                finally:
+                    await source.aclose()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            await self.outgoing.put({
+                "type": "error",
+                "id": stream_id,
+                "error": getattr(e, "message", str(e)),
+                "status": getattr(e, "status", 500)
+            })
+        finally:
+            if self.streams.get(stream_id) is asyncio.current_task():
+                del self.streams[stream_id]
+
+    async def _write(self):
+        """Send queued messages, or a heartbeat when idle"""
+        while True:
+            try:
+                message = await asyncio.wait_for(self.outgoing.get(), self.heartbeat_interval)
+            except asyncio.TimeoutError:
+                message = {"type": "heartbeat", "timestamp": time.time(), "streams": len(self.streams)}
+
+            try:
+                await asyncio.wait_for(
+                    self.send({"type": "websocket.send", "text": json.dumps(message, default=str)}),
+                    self.send_timeout
+                )
+            except asyncio.TimeoutError:
+                return
@@ -6,14 +6,20 @@ Context Engineering FastAPI Demo Server
 FastAPI version of the Context Engineering Framework demo for proper ingress compatibility.
 """
 
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import HTMLResponse, JSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
+import sys
 import time
 import json
+from pathlib import Path
 from typing import Dict, Any, Optional
 
+# Shared utilities live at the repository root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from utils.static import StaticAsset
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Context Engineering Framework",
@@ -103,12 +109,8 @@ async def process_reasoning(request: ReasoningRequest):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Processing error: {str(e)}")
 
-@app.get("/", response_class=HTMLResponse)
-@app.get("/api/demo-ui", response_class=HTMLResponse)
-async def serve_demo_page():
-    """Serve the main demo HTML page."""
-    html_content = """
-<!DOCTYPE html>
+# Rendered and compressed once at import; requests only pick a variant
+DEMO_PAGE_HTML = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -391,8 +393,20 @@ Examples:
     </script>
 </body>
 </html>
-    """
-    return HTMLResponse(content=html_content)
+"""
+
+DEMO_PAGE = StaticAsset(DEMO_PAGE_HTML)
+
+@app.api_route("/", methods=["GET", "HEAD"], response_class=HTMLResponse)
+@app.api_route("/api/demo-ui", methods=["GET", "HEAD"], response_class=HTMLResponse)
+async def serve_demo_page(request: Request):
+    """Serve the main demo HTML page."""
+    status, headers, body = DEMO_PAGE.respond(
+        request.method,
+        request.headers.get("accept-encoding"),
+        request.headers.get("if-none-match")
+    )
+    return Response(content=body, status_code=status, headers=dict(headers))
 
 if __name__ == "__main__":
     import uvicorn
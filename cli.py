@@ -0,0 +1,122 @@
+"""
+Command Line Interface - Context Engineering
+============================================
+
+Entry point for the `context-engine` console script.
+
+    context-engine serve --port 8000 --workers 4 --config config.yaml --watch-config
+"""
+
+import argparse
+import os
+import sys
+from typing import List, Optional
+
+SERVER_APP_FACTORY = f"{__package__ or 'context_engineering'}.api.server:create_app"
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser"""
+    parser = argparse.ArgumentParser(
+        prog="context-engine",
+        description="Context Engineering contextual engine"
+    )
+    commands = parser.add_subparsers(dest="command")
+
+    serve = commands.add_parser("serve", help="Serve the engine over HTTP")
+    serve.add_argument("--host", default="127.0.0.1", help="Bind address")
+    serve.add_argument("--port", type=int, default=8000, help="Bind port")
+    serve.add_argument(
+        "--workers", type=int, default=os.cpu_count() or 1,
+        help="Worker processes, each with its own engine; with more than one, "
+             "/v1/configure and /v1/reset are refused in favour of --watch-config"
+    )
+    serve.add_argument("--config", help="JSON or YAML engine configuration file")
+    serve.add_argument(
+        "--watch-config", action="store_true",
+        help="Reload the configuration file into live engines when it changes"
+    )
+    serve.add_argument(
+        "--max-concurrency", type=int, default=8,
+        help="Requests processed concurrently per worker"
+    )
+    serve.add_argument(
+        "--max-queue", type=int, default=64,
+        help="Requests waiting per worker before new ones are rejected with 503"
+    )
+    serve.add_argument(
+        "--queue-timeout", type=float, default=10.0,
+        help="Seconds a request may wait in the queue before a 503"
+    )
+    serve.add_argument(
+        "--max-connections", type=int, default=None,
+        help="Open connections per worker before new ones are refused"
+    )
+    serve.add_argument(
+        "--keep-alive", type=float, default=5.0,
+        help="Seconds an idle keep-alive connection stays open"
+    )
+    serve.add_argument(
+        "--drain-timeout", type=float, default=30.0,
+        help="Seconds in-flight requests get to finish on shutdown"
+    )
+    serve.add_argument(
+        "--heartbeat-interval", type=float, default=15.0,
+        help="Idle seconds before a heartbeat on SSE and WebSocket streams"
+    )
+    serve.add_argument(
+        "--max-streams", type=int, default=8,
+        help="Concurrent reasoning streams per WebSocket connection"
+    )
+    serve.add_argument("--backlog", type=int, default=2048, help="Listen socket backlog")
+    serve.add_argument("--log-level", default="info", help="Server log level")
+
+    return parser
+
+def serve(args: argparse.Namespace) -> int:
+    """Run the ASGI server with one engine per worker process"""
+    try:
+        import uvicorn
+    except ImportError:
+        print("Serving requires uvicorn: pip install 'context-engineering[server]'", file=sys.stderr)
+        return 1
+
+    # Workers build their app from the environment, which they inherit
+    if args.config:
+        os.environ["CONTEXT_ENGINE_CONFIG"] = os.path.abspath(args.config)
+    os.environ["CONTEXT_ENGINE_WATCH_CONFIG"] = "1" if args.watch_config else "0"
+    os.environ["CONTEXT_ENGINE_MAX_CONCURRENCY"] = str(args.max_concurrency)
+    os.environ["CONTEXT_ENGINE_MAX_QUEUE"] = str(args.max_queue)
+    os.environ["CONTEXT_ENGINE_QUEUE_TIMEOUT"] = str(args.queue_timeout)
+    os.environ["CONTEXT_ENGINE_DRAIN_TIMEOUT"] = str(args.drain_timeout)
+    os.environ["CONTEXT_ENGINE_HEARTBEAT_INTERVAL"] = str(args.heartbeat_interval)
+    os.environ["CONTEXT_ENGINE_MAX_STREAMS"] = str(args.max_streams)
+    os.environ["CONTEXT_ENGINE_WORKERS"] = str(args.workers)
+
+    uvicorn.run(
+        SERVER_APP_FACTORY,
+        factory=True,
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        lifespan="on",
+        limit_concurrency=args.max_connections,
+        timeout_keep_alive=args.keep_alive,
+        timeout_graceful_shutdown=args.drain_timeout,
+        backlog=args.backlog,
+        log_level=args.log_level
+    )
+    return 0
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the context-engine command"""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        return serve(args)
+
+    parser.print_help()
+    return 1
+
+if __name__ == "__main__":
+    sys.exit(main())
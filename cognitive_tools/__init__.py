@@ -16,6 +16,19 @@ from .tools import (
     ValidateTool
 )
 from .executor import CognitiveToolExecutor
+from .backends import (
+    ModelBackend,
+    ModelBackendError,
+    ModelRequest,
+    ModelResponse,
+    LocalModelBackend,
+    HTTPModelBackend,
+    create_model_backend
+)
+from .dispatcher import ModelDispatcher
+from .scheduler import ToolScheduler
+from .result_cache import ToolResultCache
+from .templates import PromptTemplate, ContextRenderer, estimate_tokens
 
 __all__ = [
     'CognitiveToolsManager',
@@ -24,5 +37,18 @@ __all__ = [
     'HighlightTool',
     'ApplyTool',
     'ValidateTool',
-    'CognitiveToolExecutor'
+    'CognitiveToolExecutor',
+    'ModelBackend',
+    'ModelBackendError',
+    'ModelRequest',
+    'ModelResponse',
+    'LocalModelBackend',
+    'HTTPModelBackend',
+    'create_model_backend',
+    'ModelDispatcher',
+    'ToolScheduler',
+    'ToolResultCache',
+    'PromptTemplate',
+    'ContextRenderer',
+    'estimate_tokens'
 ]
\ No newline at end of file
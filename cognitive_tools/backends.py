@@ -0,0 +1,265 @@
+"""
+Model Backends - Language Model Interface for Cognitive Tools
+=============================================================
+
+Pluggable model backends used by cognitive tools to execute their
+structured prompt templates, including a deterministic local backend
+and an OpenAI-compatible HTTP backend with connection pooling.
+"""
+
+import asyncio
+import http.client
+import json
+import logging
+import queue
+import urllib.parse
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Any, Callable, Optional
+
+from ..utils.cache import content_digest
+
+DEFAULT_API_BASES = {
+    "openai": "https://api.openai.com/v1"
+}
+
+class ModelBackendError(Exception):
+    """Raised when a model backend call fails"""
+
+    def __init__(self, message: str, retryable: bool = True):
+        super().__init__(message)
+        self.retryable = retryable
+
+@dataclass
+class ModelRequest:
+    """Single prompt submitted to a model backend"""
+    tool: str
+    prompt: str
+    max_tokens: int = 4000
+    temperature: float = 0.7
+    fallback: Optional[str] = None  # Locally rendered result used by the local backend and on failure
+    render_fallback: Optional[Callable[[], str]] = field(default=None, repr=False, compare=False)
+
+    def get_fallback(self) -> Optional[str]:
+        """Get the fallback, rendering it on first use"""
+        if self.fallback is None and self.render_fallback is not None:
+            self.fallback = self.render_fallback()
+            self.render_fallback = None
+        return self.fallback
+
+    def coalesce_key(self) -> str:
+        """Key identifying requests that can share one model call"""
+        return content_digest(self.tool, self.prompt, self.max_tokens, self.temperature)
+
+@dataclass
+class ModelResponse:
+    """Model output for a single request"""
+    text: str
+    model: str
+    degraded: bool = False
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+class ModelBackend(ABC):
+    """Base class for model backends"""
+
+    name = "base"
+    renders_fallback = False  # True when responses are ModelRequest fallbacks
+
+    @abstractmethod
+    async def generate_batch(self, requests: List[ModelRequest]) -> List[ModelResponse]:
+        """Generate responses for a batch of requests, in request order"""
+        pass
+
+    async def generate(self, request: ModelRequest) -> ModelResponse:
+        """Generate a response for a single request"""
+        responses = await self.generate_batch([request])
+        return responses[0]
+
+    async def close(self):
+        """Release backend resources"""
+        pass
+
+class LocalModelBackend(ModelBackend):
+    """
+    Deterministic in-process stand-in for a model server.
+
+    Returns each request's locally rendered result, or a stable echo of the
+    prompt when none is provided. Useful for tests and offline operation.
+    """
+
+    name = "local"
+    renders_fallback = True
+
+    def __init__(self, model_name: str = "local-deterministic", latency: float = 0.0):
+        self.model_name = model_name
+        self.latency = latency  # Simulated per-batch latency in seconds
+        self.batch_count = 0
+
+    async def generate_batch(self, requests: List[ModelRequest]) -> List[ModelResponse]:
+        """Generate deterministic responses for a batch of requests"""
+        self.batch_count += 1
+        if self.latency > 0:
+            await asyncio.sleep(self.latency)
+
+        return [
+            ModelResponse(
+                text=self._render(request),
+                model=self.model_name,
+                metadata={"batch_size": len(requests)}
+            )
+            for request in requests
+        ]
+
+    def _render(self, request: ModelRequest) -> str:
+        """Get the request's fallback, or an echo when it has none"""
+        fallback = request.get_fallback()
+        return fallback if fallback is not None else self._echo(request)
+
+    def _echo(self, request: ModelRequest) -> str:
+        """Build a stable response from the prompt"""
+        digest = content_digest(request.tool, request.prompt)[:12]
+        return f"{request.tool.upper()} RESULT [{digest}]"
+
+class HTTPModelBackend(ModelBackend):
+    """
+    OpenAI-compatible chat completions backend over pooled keep-alive connections.
+
+    Chat completions take one conversation per call and have no batch form,
+    so this backend does not batch: each request in a dispatcher micro-batch
+    is its own call, sent concurrently over the pool. The dispatcher still
+    coalesces identical in-flight requests and bounds concurrent batches.
+    """
+
+    name = "http"
+
+    def __init__(
+        self,
+        api_base: str,
+        api_key: str,
+        model_name: str,
+        pool_size: int = 8,
+        timeout: float = 300.0
+    ):
+        parsed = urllib.parse.urlsplit(api_base)
+        self._scheme = parsed.scheme or "https"
+        self._host = parsed.hostname
+        self._port = parsed.port
+        self._path = parsed.path.rstrip('/') + "/chat/completions"
+
+        self.api_key = api_key
+        self.model_name = model_name
+        self.pool_size = max(1, pool_size)
+        self.timeout = timeout
+
+        # Idle connections are reused by the worker threads
+        self._connections = queue.LifoQueue(maxsize=self.pool_size)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.pool_size, thread_name_prefix="model-backend"
+        )
+        self.logger = logging.getLogger("HTTPModelBackend")
+
+    async def generate_batch(self, requests: List[ModelRequest]) -> List[ModelResponse]:
+        """Send each request as its own call, concurrently over the connection pool"""
+        loop = asyncio.get_running_loop()
+        responses = await asyncio.gather(*(
+            loop.run_in_executor(self._executor, self._post, request)
+            for request in requests
+        ))
+        return list(responses)
+
+    def _post(self, request: ModelRequest) -> ModelResponse:
+        """Send one chat completion request using a pooled connection"""
+        payload = json.dumps({
+            "model": self.model_name,
+            "messages": [{"role": "user", "content": request.prompt}],
+            "max_tokens": request.max_tokens,
+            "temperature": request.temperature
+        })
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+            "Connection": "keep-alive"
+        }
+
+        connection = self._acquire_connection()
+        try:
+            connection.request("POST", self._path, body=payload, headers=headers)
+            response = connection.getresponse()
+            body = response.read()
+        except (OSError, http.client.HTTPException) as e:
+            connection.close()
+            raise ModelBackendError(f"Model request failed: {e}") from e
+
+        if response.will_close:
+            connection.close()
+        else:
+            self._release_connection(connection)
+
+        if response.status == 429 or response.status >= 500:
+            raise ModelBackendError(f"Model server returned {response.status}")
+        if response.status >= 400:
+            raise ModelBackendError(
+                f"Model server rejected request with {response.status}: {body[:200]!r}",
+                retryable=False
+            )
+
+        try:
+            data = json.loads(body)
+            text = data["choices"][0]["message"]["content"]
+        except (ValueError, KeyError, IndexError) as e:
+            raise ModelBackendError(f"Malformed model response: {e}", retryable=False) from e
+
+        return ModelResponse(
+            text=text,
+            model=data.get("model", self.model_name),
+            metadata={"usage": data.get("usage", {})}
+        )
+
+    def _acquire_connection(self) -> http.client.HTTPConnection:
+        """Reuse an idle connection or open a new one"""
+        try:
+            return self._connections.get_nowait()
+        except queue.Empty:
+            connection_class = (
+                http.client.HTTPSConnection if self._scheme == "https"
+                else http.client.HTTPConnection
+            )
+            return connection_class(self._host, self._port, timeout=self.timeout)
+
+    def _release_connection(self, connection: http.client.HTTPConnection):
+        """Return a connection to the idle pool"""
+        try:
+            self._connections.put_nowait(connection)
+        except queue.Full:
+            connection.close()
+
+    async def close(self):
+        """Close pooled connections and worker threads"""
+        while True:
+            try:
+                self._connections.get_nowait().close()
+            except queue.Empty:
+                break
+        self._executor.shutdown(wait=False)
+
+def create_model_backend(engine_config, tools_config) -> ModelBackend:
+    """Create the model backend selected by the engine configuration"""
+    logger = logging.getLogger("ModelBackends")
+    provider = engine_config.model_provider
+
+    if provider == "local":
+        return LocalModelBackend()
+
+    api_base = engine_config.api_base or DEFAULT_API_BASES.get(provider)
+    if not engine_config.api_key or not api_base:
+        logger.info(f"No API credentials for provider '{provider}', using local model backend")
+        return LocalModelBackend()
+
+    return HTTPModelBackend(
+        api_base=api_base,
+        api_key=engine_config.api_key,
+        model_name=engine_config.model_name,
+        pool_size=tools_config.backend_pool_size,
+        timeout=engine_config.timeout
+    )
@@ -0,0 +1,173 @@
+"""
+Model Dispatcher - Micro-Batching for Cognitive Tool Model Calls
+================================================================
+
+Coalesces concurrent model requests from many in-flight reasoning
+requests into micro-batches, with retry and jittered backoff.
+"""
+
+import asyncio
+import logging
+import random
+from typing import Dict, List, Any, Optional, Tuple
+
+from .backends import ModelBackend, ModelBackendError, ModelRequest, ModelResponse
+
+class ModelDispatcher:
+    """
+    Dispatches model requests to a backend in micro-batches.
+
+    Requests are flushed when a batch reaches max_batch_size or when the
+    oldest pending request has waited max_wait_ms. Identical requests that
+    are already in flight share a single model call.
+    """
+
+    def __init__(
+        self,
+        backend: ModelBackend,
+        max_batch_size: int = 16,
+        max_wait_ms: float = 5.0,
+        max_concurrent_batches: int = 8,
+        retry_attempts: int = 3,
+        retry_backoff: float = 0.2,
+        timeout: Optional[float] = None
+    ):
+        self.backend = backend
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait_ms = max_wait_ms
+        self.max_concurrent_batches = max(1, max_concurrent_batches)
+        self.retry_attempts = max(1, retry_attempts)
+        self.retry_backoff = retry_backoff
+        self.timeout = timeout
+
+        self._pending: List[Tuple[ModelRequest, asyncio.Future]] = []
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._batch_tasks = set()
+        self._batch_slots: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # Counters
+        self.request_count = 0
+        self.coalesced_count = 0
+        self.batch_count = 0
+        self.retry_count = 0
+        self.failure_count = 0
+
+        self.logger = logging.getLogger("ModelDispatcher")
+
+    async def submit(self, request: ModelRequest, coalesce: bool = True) -> ModelResponse:
+        """Submit a request and wait for its response"""
+        loop = self._bind_loop()
+        self.request_count += 1
+
+        if coalesce:
+            key = request.coalesce_key()
+            future = self._inflight.get(key)
+            if future is not None and not future.done():
+                self.coalesced_count += 1
+                return await asyncio.shield(future)
+
+        future = loop.create_future()
+        if coalesce:
+            self._inflight[key] = future
+            future.add_done_callback(lambda done, key=key: self._release_inflight(key, done))
+
+        self._pending.append((request, future))
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.max_wait_ms / 1000.0, self._flush)
+
+        # Shield so one cancelled caller does not cancel a shared result
+        return await asyncio.shield(future)
+
+    def _bind_loop(self) -> asyncio.AbstractEventLoop:
+        """Bind loop-specific state to the running event loop"""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._pending = []
+            self._inflight = {}
+            self._flush_handle = None
+            self._batch_slots = asyncio.Semaphore(self.max_concurrent_batches)
+        return loop
+
+    def _release_inflight(self, key: str, future: asyncio.Future):
+        """Stop coalescing onto a completed request"""
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+
+    def _flush(self):
+        """Send all pending requests as one batch"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        if not self._pending:
+            return
+
+        batch, self._pending = self._pending, []
+        task = self._loop.create_task(self._run_batch(batch))
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+
+    async def _run_batch(self, batch: List[Tuple[ModelRequest, asyncio.Future]]):
+        """Execute a batch and resolve its futures"""
+        async with self._batch_slots:
+            self.batch_count += 1
+            requests = [request for request, _ in batch]
+
+            try:
+                responses = await self._generate_with_retry(requests)
+            except Exception as e:
+                self.failure_count += 1
+                self.logger.warning(f"Model batch of {len(batch)} failed: {e}")
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                return
+
+            for (_, future), response in zip(batch, responses):
+                if not future.done():
+                    future.set_result(response)
+
+    async def _generate_with_retry(self, requests: List[ModelRequest]) -> List[ModelResponse]:
+        """Call the backend, retrying transient failures with jittered backoff"""
+        for attempt in range(self.retry_attempts):
+            try:
+                return await asyncio.wait_for(
+                    self.backend.generate_batch(requests), timeout=self.timeout
+                )
+            except (ModelBackendError, asyncio.TimeoutError) as e:
+                retryable = getattr(e, "retryable", True)
+                if not retryable or attempt == self.retry_attempts - 1:
+                    raise
+
+                # Full jitter keeps concurrent retries from synchronizing
+                delay = random.uniform(0, self.retry_backoff * (2 ** attempt))
+                self.retry_count += 1
+                self.logger.debug(f"Retrying model batch in {delay:.3f}s after: {e}")
+                await asyncio.sleep(delay)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get dispatcher batching and retry metrics"""
+        dispatched = self.request_count - self.coalesced_count
+        return {
+            "backend": self.backend.name,
+            "requests": self.request_count,
+            "coalesced_requests": self.coalesced_count,
+            "batches": self.batch_count,
+            "average_batch_size": dispatched / self.batch_count if self.batch_count > 0 else 0.0,
+            "retries": self.retry_count,
+            "failed_batches": self.failure_count,
+            "pending": len(self._pending)
+        }
+
+    async def close(self):
+        """Flush pending requests, wait for in-flight batches and close the backend"""
+        if self._pending:
+            self._flush()
+        if self._batch_tasks:
+            await asyncio.gather(*self._batch_tasks, return_exceptions=True)
+        await self.backend.close()
@@ -3,55 +3,206 @@ Cognitive Tool Executor - Execution Engine for Cognitive Tools
 =============================================================
 
 Handles the execution of cognitive tools with proper error handling,
-timeout management, and result processing.
+deadline-based timeout management, hedged execution and result processing.
 """
 
 import asyncio
 import logging
-from typing import Dict, Any
+from collections import deque
+from typing import Dict, Any, Optional
 from ..core.base import ProcessingResult
+from .result_cache import ToolResultCache
 
 class CognitiveToolExecutor:
     """Executes cognitive tools with proper orchestration and error handling"""
-    
-    def __init__(self):
+
+    def __init__(
+        self,
+        tool_timeout: float = 30.0,
+        hedge_enabled: bool = True,
+        hedge_percentile: float = 0.95,
+        hedge_min_samples: int = 20,
+        result_cache: Optional[ToolResultCache] = None
+    ):
+        self.tool_timeout = tool_timeout  # Upper bound for a single tool call in seconds
+        self.hedge_enabled = hedge_enabled
+        self.hedge_percentile = hedge_percentile
+        self.hedge_min_samples = hedge_min_samples
+        self.result_cache = result_cache  # Memoizes results of successful tool calls
+
+        self.tool_stats: Dict[str, Dict[str, Any]] = {}
         self.logger = logging.getLogger("CognitiveToolExecutor")
-    
+
     async def execute_tool(
         self,
         tool,
         content: str,
-        parameters: Dict[str, Any]
+        parameters: Dict[str, Any],
+        deadline: Optional[float] = None
     ) -> ProcessingResult:
-        """Execute a cognitive tool with error handling and timeout"""
+        """Execute a cognitive tool within its timeout and the request deadline"""
         self.logger.debug(f"Executing cognitive tool: {tool.name}")
-        
-        try:
-            # Execute tool with timeout
-            result = await asyncio.wait_for(
-                tool.execute(content, parameters),
-                timeout=30.0  # 30 second timeout
+
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        timeout = self.tool_timeout
+        if deadline is not None:
+            timeout = max(0.0, min(timeout, deadline - start_time))
+
+        stats = self._get_stats(tool.name)
+        stats["calls"] += 1
+
+        cache_key = None
+        if self.result_cache is not None:
+            context = parameters.get("context", {})
+            build_request = getattr(tool, "build_request", None)
+            request = build_request(content, context) if build_request is not None else None
+            if request is not None:
+                # The built request is reused by the call and any hedge of it
+                parameters = {**parameters, "model_request": request}
+
+            backend = getattr(getattr(tool, "dispatcher", None), "backend", None)
+            cache_key = self.result_cache.make_key(
+                tool, content, context, request,
+                include_fallback=getattr(backend, "renders_fallback", False)
             )
-            
+            cached_result = self.result_cache.get(cache_key)
+            if cached_result is not None:
+                stats["cache_hits"] += 1
+                return cached_result
+
+        try:
+            result = await self._execute_with_hedge(tool, content, parameters, timeout, stats)
+
+            stats["durations"].append(loop.time() - start_time)
+            if cache_key is not None and not result.metadata.get("degraded"):
+                self.result_cache.put(cache_key, tool.name, result)
             self.logger.debug(f"✓ Tool {tool.name} executed successfully")
             return result
-            
+
         except asyncio.TimeoutError:
-            self.logger.error(f"Tool {tool.name} execution timed out")
+            elapsed = loop.time() - start_time
+            stats["timeouts"] += 1
+            self.logger.error(f"Tool {tool.name} execution timed out after {elapsed:.3f}s")
             return ProcessingResult(
                 content=f"Tool {tool.name} execution timed out",
                 confidence=0.0,
-                processing_time=30.0,
-                metadata={"error": "timeout", "tool": tool.name},
+                processing_time=elapsed,
+                metadata={"error": "timeout", "tool": tool.name, "timeout": timeout},
                 reasoning_trace=[{"error": "timeout"}]
             )
-            
+
         except Exception as e:
+            stats["errors"] += 1
             self.logger.error(f"Error executing tool {tool.name}: {str(e)}")
             return ProcessingResult(
                 content=f"Error in tool {tool.name}: {str(e)}",
                 confidence=0.0,
-                processing_time=0.0,
+                processing_time=loop.time() - start_time,
                 metadata={"error": str(e), "tool": tool.name},
                 reasoning_trace=[{"error": str(e)}]
-            )
\ No newline at end of file
+            )
+
+    async def _execute_with_hedge(
+        self,
+        tool,
+        content: str,
+        parameters: Dict[str, Any],
+        timeout: float,
+        stats: Dict[str, Any]
+    ) -> ProcessingResult:
+        """Run a tool, firing a duplicate call if it outlives the hedge delay"""
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        primary = asyncio.ensure_future(tool.execute(content, parameters))
+        tasks = {primary}
+
+        try:
+            hedge_delay = self._get_hedge_delay(stats)
+            if hedge_delay is not None and hedge_delay < timeout:
+                done, _ = await asyncio.wait(tasks, timeout=hedge_delay)
+                if not done:
+                    # Hedged calls bypass request coalescing so they reach the backend
+                    stats["hedges"] += 1
+                    tasks.add(asyncio.ensure_future(
+                        tool.execute(content, {**parameters, "hedge": True})
+                    ))
+
+            pending = set(tasks)
+            while pending:
+                remaining = timeout - (loop.time() - start_time)
+                done, pending = await asyncio.wait(
+                    pending, timeout=max(0.0, remaining), return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    raise asyncio.TimeoutError()
+
+                # A failed call loses to any call still running within the budget;
+                # prefer the primary call when both succeeded together
+                succeeded = [task for task in done if not task.cancelled() and task.exception() is None]
+                if succeeded:
+                    winner = primary if primary in succeeded else succeeded[0]
+                    if winner is not primary:
+                        stats["hedge_wins"] += 1
+                    return winner.result()
+
+            # Every call failed: report the primary's error
+            return primary.result()
+
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    def _get_hedge_delay(self, stats: Dict[str, Any]) -> Optional[float]:
+        """Get the hedge delay from the tool's recent duration percentile"""
+        durations = stats["durations"]
+        if not self.hedge_enabled or len(durations) < self.hedge_min_samples:
+            return None
+
+        ordered = sorted(durations)
+        index = min(len(ordered) - 1, int(self.hedge_percentile * len(ordered)))
+        return ordered[index]
+
+    def _get_stats(self, tool_name: str) -> Dict[str, Any]:
+        """Get execution statistics for a tool"""
+        if tool_name not in self.tool_stats:
+            self.tool_stats[tool_name] = {
+                "calls": 0,
+                "timeouts": 0,
+                "errors": 0,
+                "hedges": 0,
+                "hedge_wins": 0,
+                "cache_hits": 0,
+                "durations": deque(maxlen=200)  # Recent successful durations
+            }
+        return self.tool_stats[tool_name]
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get measured execution metrics per tool"""
+        metrics = {}
+        for tool_name, stats in self.tool_stats.items():
+            ordered = sorted(stats["durations"])
+            metrics[tool_name] = {
+                "calls": stats["calls"],
+                "timeouts": stats["timeouts"],
+                "errors": stats["errors"],
+                "hedges": stats["hedges"],
+                "hedge_wins": stats["hedge_wins"],
+                "cache_hits": stats["cache_hits"],
+                "average_duration": sum(ordered) / len(ordered) if ordered else 0.0,
+                "p50_duration": ordered[len(ordered) // 2] if ordered else 0.0,
+                "p95_duration": ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))] if ordered else 0.0,
+                "max_duration": ordered[-1] if ordered else 0.0
+            }
+        return metrics
+
+    def get_cache_metrics(self) -> Optional[Dict[str, Any]]:
+        """Get result cache statistics, if caching is enabled"""
+        return self.result_cache.get_stats() if self.result_cache is not None else None
+
+    def reset(self):
+        """Reset execution statistics and cached results"""
+        self.tool_stats = {}
+        if self.result_cache is not None:
+            self.result_cache.clear()
@@ -11,8 +11,14 @@ from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
 
 from ..core.base import BaseToolProcessor, ProcessingResult
+from ..core.config import EngineConfig
 from .tools import UnderstandTool, ExtractTool, HighlightTool, ApplyTool, ValidateTool
 from .executor import CognitiveToolExecutor
+from .backends import create_model_backend
+from .dispatcher import ModelDispatcher
+from .scheduler import ToolScheduler
+from .result_cache import ToolResultCache
+from .templates import ContextRenderer
 
 @dataclass
 class CognitiveReasoningResult:
@@ -35,24 +41,67 @@ class CognitiveToolsManager(BaseToolProcessor):
     - Validate: Verify reasoning steps and conclusions
     """
     
-    def __init__(self, config):
+    # Tools skipped per complexity level when tool_selection is "adaptive"
+    ADAPTIVE_SKIPPED_TOOLS = {
+        "atom": ("extract", "highlight", "validate"),
+        "molecule": ("highlight",)
+    }
+    
+    # Fields read per request; the rest configure the tools, scheduler and backend
+    LIVE_CONFIG_KEYS = frozenset({
+        "tool_selection", "verification_enabled", "available_tools",
+        "max_tool_depth", "parallel_processing"
+    })
+    
+    def __init__(self, config, engine_config: Optional[EngineConfig] = None):
         super().__init__(config)
-        self.executor = CognitiveToolExecutor()
+        self.engine_config = engine_config or EngineConfig()
+        self.logger = logging.getLogger("CognitiveToolsManager")
+        self.executor = CognitiveToolExecutor(
+            tool_timeout=config.tool_timeout,
+            hedge_enabled=config.hedged_execution,
+            hedge_percentile=config.hedge_percentile,
+            hedge_min_samples=config.hedge_min_samples,
+            result_cache=ToolResultCache(
+                max_size=config.result_cache_size,
+                max_bytes=config.result_cache_max_bytes,
+                path=config.result_cache_path
+            ) if config.result_cache_enabled else None
+        )
+        
+        # Shared dispatcher batching model calls from all tools and requests
+        self.dispatcher = ModelDispatcher(
+            create_model_backend(self.engine_config, config),
+            max_batch_size=config.batch_max_size,
+            max_wait_ms=config.batch_max_wait_ms,
+            max_concurrent_batches=config.max_concurrent_batches,
+            retry_attempts=self.engine_config.retry_attempts,
+            retry_backoff=config.retry_backoff,
+            timeout=self.engine_config.timeout
+        )
         
         # Initialize cognitive tools
         self._initialize_tools()
+        self.scheduler = ToolScheduler(self.available_tools, config.max_parallel_tools)
         
-        self.logger = logging.getLogger("CognitiveToolsManager")
         self.logger.info("IBM Zurich Cognitive Tools framework initialized")
     
     def _initialize_tools(self):
         """Initialize all cognitive tools"""
+        # Tools share one renderer so context fragments are reused across the sequence
+        tool_options = {
+            "max_tokens": self.engine_config.max_tokens,
+            "temperature": self.engine_config.temperature,
+            "max_prompt_tokens": self.config.prompt_max_tokens,
+            "context_renderer": ContextRenderer(self.config.prompt_max_field_chars)
+        }
+        
         # Register core cognitive tools
-        self.register_tool("understand", UnderstandTool())
-        self.register_tool("extract", ExtractTool())
-        self.register_tool("highlight", HighlightTool())
-        self.register_tool("apply", ApplyTool())
-        self.register_tool("validate", ValidateTool())
+        self.register_tool("understand", UnderstandTool(self.dispatcher, **tool_options))
+        self.register_tool("extract", ExtractTool(self.dispatcher, **tool_options))
+        self.register_tool("highlight", HighlightTool(self.dispatcher, **tool_options))
+        self.register_tool("apply", ApplyTool(self.dispatcher, **tool_options))
+        self.register_tool("validate", ValidateTool(self.dispatcher, **tool_options))
         
         self.logger.info(f"Registered {len(self.available_tools)} cognitive tools")
     
@@ -80,7 +129,8 @@ class CognitiveToolsManager(BaseToolProcessor):
         self,
         query: str,
         context: Dict[str, Any],
-        complexity: str = "neural_system"
+        complexity: str = "neural_system",
+        deadline: Optional[float] = None
     ) -> CognitiveReasoningResult:
         """
         Execute structured reasoning sequence using cognitive tools.
@@ -89,6 +139,8 @@ class CognitiveToolsManager(BaseToolProcessor):
             query: The query or problem to reason about
             context: Contextual information
             complexity: Target complexity level
+            deadline: Event loop time by which the sequence must finish,
+                defaults to now plus the engine timeout
             
         Returns:
             CognitiveReasoningResult with reasoning trace
@@ -97,75 +149,57 @@ class CognitiveToolsManager(BaseToolProcessor):
         
         reasoning_trace = []
         tools_used = []
+        tool_results = {}
         cumulative_context = context.copy()
         cumulative_context["original_query"] = query
         
-        # Phase 1: Understand
-        understand_result = await self.execute_tool(
-            "understand", query, {"context": cumulative_context}
-        )
-        reasoning_trace.append({
-            "tool": "understand",
-            "input": query,
-            "output": understand_result.content,
-            "confidence": understand_result.confidence
-        })
-        tools_used.append("understand")
-        cumulative_context["understanding"] = understand_result.content
-        
-        # Phase 2: Extract
-        extract_result = await self.execute_tool(
-            "extract", query, {"context": cumulative_context}
-        )
-        reasoning_trace.append({
-            "tool": "extract", 
-            "input": query,
-            "output": extract_result.content,
-            "confidence": extract_result.confidence
-        })
-        tools_used.append("extract")
-        cumulative_context["extracted_info"] = extract_result.content
-        
-        # Phase 3: Highlight
-        highlight_result = await self.execute_tool(
-            "highlight", query, {"context": cumulative_context}
-        )
-        reasoning_trace.append({
-            "tool": "highlight",
-            "input": query, 
-            "output": highlight_result.content,
-            "confidence": highlight_result.confidence
-        })
-        tools_used.append("highlight")
-        cumulative_context["key_insights"] = highlight_result.content
-        
-        # Phase 4: Apply
-        apply_result = await self.execute_tool(
-            "apply", query, {"context": cumulative_context}
+        # Plan tools and group independent ones into concurrent layers
+        tool_plan = self._select_tools(complexity)
+        layers = self.scheduler.build_layers(
+            tool_plan, parallel=self.config.parallel_processing
         )
-        reasoning_trace.append({
-            "tool": "apply",
-            "input": query,
-            "output": apply_result.content, 
-            "confidence": apply_result.confidence
-        })
-        tools_used.append("apply")
-        cumulative_context["reasoning_result"] = apply_result.content
-        
-        # Phase 5: Validate (if enabled)
-        verification_passed = True
-        if self.config.verification_enabled:
-            validate_result = await self.execute_tool(
-                "validate", apply_result.content, {"context": cumulative_context}
+        
+        loop = asyncio.get_running_loop()
+        if deadline is None:
+            deadline = loop.time() + self.engine_config.timeout
+        
+        for layer_index, layer in enumerate(layers):
+            # Split the remaining budget evenly across the remaining layers
+            remaining_budget = max(0.0, deadline - loop.time())
+            layer_deadline = loop.time() + remaining_budget / (len(layers) - layer_index)
+            
+            # Tools in a layer see the same context; outputs are merged afterwards
+            tool_inputs = {
+                name: self._get_tool_input(name, query, cumulative_context) for name in layer
+            }
+            layer_results = await self.scheduler.run_layer(
+                layer,
+                lambda name: self.execute_tool(
+                    name, tool_inputs[name], {"context": cumulative_context},
+                    deadline=layer_deadline
+                )
             )
-            reasoning_trace.append({
-                "tool": "validate",
-                "input": apply_result.content,
-                "output": validate_result.content,
-                "confidence": validate_result.confidence
-            })
-            tools_used.append("validate")
-            verification_passed = validate_result.confidence > 0.7
+            
+            # Record results in plan order so the trace is deterministic
+            for name, result in zip(layer, layer_results):
+                reasoning_trace.append({
+                    "tool": name,
+                    "input": tool_inputs[name],
+                    "output": result.content,
+                    "confidence": result.confidence
+                })
+                tools_used.append(name)
+                tool_results[name] = result
+                
+                for key in getattr(self.available_tools[name], "writes", ()):
+                    cumulative_context[key] = result.content
+        
+        # Validation gates verification only when it ran
+        verification_passed = True
+        if "validate" in tool_results:
+            verification_passed = tool_results["validate"].confidence > 0.7
+        
+        final_result = tool_results.get("apply") or tool_results[tools_used[-1]]
         
         # Calculate overall confidence
         confidence_scores = [step["confidence"] for step in reasoning_trace]
@@ -174,18 +208,47 @@ class CognitiveToolsManager(BaseToolProcessor):
         self.logger.info(f"✓ Cognitive reasoning completed. Tools used: {', '.join(tools_used)}")
         
         return CognitiveReasoningResult(
-            result=apply_result.content,
+            result=final_result.content,
             reasoning_trace=reasoning_trace,
             tools_used=tools_used,
             verification_passed=verification_passed,
             confidence_score=overall_confidence
         )
     
+    def _select_tools(self, complexity: str) -> List[str]:
+        """Select the ordered tool sequence for a target complexity"""
+        tool_plan = [
+            name for name in self.config.available_tools 
+            if name in self.available_tools
+        ]
+        
+        if not self.config.verification_enabled:
+            tool_plan = [name for name in tool_plan if name != "validate"]
+        
+        # Adaptive selection skips tools that low complexity targets do not need
+        if self.config.tool_selection == "adaptive":
+            skipped_tools = self.ADAPTIVE_SKIPPED_TOOLS.get(complexity, ())
+            tool_plan = [name for name in tool_plan if name not in skipped_tools]
+        
+        # Apply produces the final result, so an empty plan falls back to it
+        if not tool_plan:
+            tool_plan = ["apply"]
+        
+        return tool_plan[:max(1, self.config.max_tool_depth)]
+    
+    def _get_tool_input(self, tool_name: str, query: str, context: Dict[str, Any]) -> str:
+        """Get the input content for a tool, defaulting to the query"""
+        input_key = getattr(self.available_tools[tool_name], "input_key", None)
+        if input_key and input_key in context:
+            return context[input_key]
+        return query
+    
     async def execute_tool(
         self,
         tool_name: str,
         content: str,
-        parameters: Dict[str, Any]
+        parameters: Dict[str, Any],
+        deadline: Optional[float] = None
     ) -> ProcessingResult:
         """Execute a specific cognitive tool"""
         if tool_name not in self.available_tools:
@@ -195,13 +258,33 @@ class CognitiveToolsManager(BaseToolProcessor):
         self.tool_usage_count[tool_name] += 1
         
         # Execute tool through executor
-        result = await self.executor.execute_tool(tool, content, parameters)
+        result = await self.executor.execute_tool(tool, content, parameters, deadline)
+        
+        if self.executor.result_cache is not None:
+            self._record_tool_cache_lookup(tool_name, result.metadata.get("cache_hit", False))
         
         return result
     
+    def get_tool_metrics(self) -> Dict[str, Any]:
+        """Get tool usage, model dispatch and execution metrics"""
+        metrics = super().get_tool_metrics()
+        metrics["model_dispatch"] = self.dispatcher.get_metrics()
+        metrics["execution"] = self.executor.get_metrics()
+        metrics["result_cache"] = self.executor.get_cache_metrics()
+        return metrics
+    
+    async def close(self):
+        """Flush pending model requests and release backend and cache resources"""
+        await self.dispatcher.close()
+        if self.executor.result_cache is not None:
+            self.executor.result_cache.close()
+    
     def reset(self):
         """Reset cognitive tools manager state"""
         self.tool_usage_count = {tool: 0 for tool in self.available_tools.keys()}
+        self.tool_cache_lookups = {}
+        self.tool_cache_hits = {}
+        self.executor.reset()
         self.processing_count = 0
         self.total_processing_time = 0.0
         self.last_processing_time = 0.0
@@ -0,0 +1,196 @@
+"""
+Tool Result Cache - Memoization for Cognitive Tool Outputs
+==========================================================
+
+Caches cognitive tool results keyed by the model request a tool sends,
+that is its final prompt and sampling parameters, with an in-memory LRU tier bounded by entry
+count and bytes and an optional SQLite tier that survives restarts. Disk
+writes are batched and committed off the event loop thread.
+"""
+
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import asdict, replace
+from typing import Dict, List, Any, Optional, Tuple
+
+from ..core.base import ProcessingResult
+from ..utils.cache import LRUCache, content_digest
+from .backends import ModelRequest
+
+def _result_size(result: ProcessingResult) -> int:
+    """Approximate the memory footprint of a cached result in bytes"""
+    return (
+        len(result.content.encode("utf-8", "surrogatepass"))
+        + len(str(result.metadata))
+        + len(str(result.reasoning_trace))
+    )
+
+class ToolResultCache:
+    """Two-tier cache for cognitive tool results"""
+
+    def __init__(
+        self,
+        max_size: int = 512,
+        max_bytes: Optional[int] = 16 * 1024 * 1024,
+        path: Optional[str] = None,
+        write_batch_size: int = 32,
+        write_interval: float = 1.0
+    ):
+        self.memory = LRUCache(max_size, max_bytes=max_bytes, sizeof=_result_size)
+        self.path = path
+        self.write_batch_size = write_batch_size
+        self.write_interval = write_interval  # Seconds a pending write may wait for its batch
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+        self._pending_lock = threading.Lock()  # Held only to swap pending rows, never across a commit
+        self._pending: Dict[str, Tuple[str, str, str, float]] = {}  # key -> row awaiting commit
+        self._oldest_pending = 0.0
+        self._flush_scheduled = False
+        self.disk_hits = 0
+        self.logger = logging.getLogger("ToolResultCache")
+
+        if path:
+            try:
+                self._db = sqlite3.connect(path, check_same_thread=False)
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS tool_results "
+                    "(key TEXT PRIMARY KEY, tool TEXT, result TEXT, created REAL)"
+                )
+                self._db.commit()
+            except sqlite3.Error as e:
+                self.logger.warning(f"Tool result cache persistence disabled: {e}")
+                self._db = None
+
+    def make_key(
+        self,
+        tool,
+        content: str,
+        context: Dict[str, Any],
+        request: Optional[ModelRequest] = None,
+        include_fallback: bool = False
+    ) -> str:
+        """Build a cache key from exactly what determines the tool's output"""
+        if request is None:
+            # Without the rendered request any context value may reach the output
+            context_parts = [content_digest(key, repr(context[key])) for key in sorted(context)]
+            return content_digest(tool.name, content, *context_parts)
+
+        parts = [request.prompt, request.max_tokens, request.temperature]
+        if include_fallback:
+            # Local fallbacks are rendered from the full content and context, not the prompt
+            parts.append(request.get_fallback())
+        return content_digest(request.tool, *parts)
+
+    def get(self, key: str) -> Optional[ProcessingResult]:
+        """Get a cached result, promoting disk entries into memory"""
+        result = self.memory.get(key)
+        if result is None and self._db is not None:
+            result = self._load(key)
+            if result is not None:
+                self.disk_hits += 1
+                self.memory.put(key, result)
+
+        if result is None:
+            return None
+        return self._copy_result(result, cache_hit=True)
+
+    def put(self, key: str, tool_name: str, result: ProcessingResult):
+        """Store a result in memory and, when configured, on disk"""
+        result = self._copy_result(result)
+        self.memory.put(key, result)
+
+        if self._db is not None:
+            now = time.time()
+            row = (key, tool_name, json.dumps(asdict(result), default=str), now)
+            with self._pending_lock:
+                if not self._pending:
+                    self._oldest_pending = now
+                self._pending[key] = row
+            if (len(self._pending) >= self.write_batch_size
+                    or now - self._oldest_pending >= self.write_interval):
+                self._schedule_flush()
+
+    def _schedule_flush(self):
+        """Commit pending writes in a worker thread, or inline without an event loop"""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.flush()
+            return
+
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            loop.run_in_executor(None, self.flush)
+
+    def flush(self):
+        """Commit pending writes to the disk tier in one transaction"""
+        with self._pending_lock:
+            self._flush_scheduled = False
+            rows: List[Tuple[str, str, str, float]] = list(self._pending.values())
+            self._pending = {}
+        if not rows or self._db is None:
+            return
+
+        with self._db_lock:
+            try:
+                self._db.executemany("INSERT OR REPLACE INTO tool_results VALUES (?, ?, ?, ?)", rows)
+                self._db.commit()
+            except sqlite3.Error as e:
+                self.logger.warning(f"Failed to persist {len(rows)} tool results: {e}")
+
+    def _load(self, key: str) -> Optional[ProcessingResult]:
+        """Load a result from pending writes or the disk tier"""
+        pending = self._pending.get(key)
+        if pending is not None:
+            return ProcessingResult(**json.loads(pending[2]))
+
+        with self._db_lock:
+            try:
+                row = self._db.execute(
+                    "SELECT result FROM tool_results WHERE key = ?", (key,)
+                ).fetchone()
+            except sqlite3.Error as e:
+                self.logger.warning(f"Failed to read persisted tool result: {e}")
+                return None
+        return ProcessingResult(**json.loads(row[0])) if row else None
+
+    def _copy_result(self, result: ProcessingResult, cache_hit: bool = False) -> ProcessingResult:
+        """Copy a result so callers cannot mutate cache entries"""
+        metadata = dict(result.metadata)
+        if cache_hit:
+            metadata["cache_hit"] = True
+        return replace(
+            result,
+            metadata=metadata,
+            reasoning_trace=[dict(step) for step in result.reasoning_trace]
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics for both tiers"""
+        stats = self.memory.get_stats()
+        stats["disk_enabled"] = self._db is not None
+        stats["disk_hits"] = self.disk_hits
+        stats["disk_pending_writes"] = len(self._pending)
+        return stats
+
+    def clear(self):
+        """Clear the memory tier and any persisted results"""
+        self.memory.clear()
+        self.disk_hits = 0
+        self._pending = {}
+        if self._db is not None:
+            with self._db_lock:
+                self._db.execute("DELETE FROM tool_results")
+                self._db.commit()
+
+    def close(self):
+        """Commit pending writes and close the disk tier"""
+        if self._db is not None:
+            self.flush()
+            with self._db_lock:
+                self._db.close()
+            self._db = None
@@ -0,0 +1,68 @@
+"""
+Tool Scheduler - Dependency-Aware Cognitive Tool Scheduling
+===========================================================
+
+Groups cognitive tools into dependency layers based on the context keys
+they read and write, so that independent tools can run concurrently.
+"""
+
+import asyncio
+from typing import Dict, List, Any, Awaitable, Callable, Sequence
+
+class ToolScheduler:
+    """Schedules cognitive tools into layers of mutually independent tools"""
+
+    def __init__(self, tools: Dict[str, Any], max_parallel: int = 4):
+        self.tools = tools
+        self.max_parallel = max(1, max_parallel)
+
+    def build_layers(self, tool_names: Sequence[str], parallel: bool = True) -> List[List[str]]:
+        """
+        Build execution layers preserving the order of tool_names.
+
+        A tool is placed after every earlier tool that writes a key it reads,
+        reads a key it writes, or writes the same key. Without parallelism
+        each tool gets its own layer.
+        """
+        layers: List[List[str]] = []
+        layer_of: Dict[str, int] = {}
+
+        for position, name in enumerate(tool_names):
+            if not parallel:
+                level = len(layers)
+            else:
+                reads, writes = self._get_keys(name)
+                level = 0
+                for earlier in tool_names[:position]:
+                    earlier_reads, earlier_writes = self._get_keys(earlier)
+                    if (reads & earlier_writes) or (writes & earlier_reads) or (writes & earlier_writes):
+                        level = max(level, layer_of[earlier] + 1)
+
+            if level == len(layers):
+                layers.append([])
+            layers[level].append(name)
+            layer_of[name] = level
+
+        return layers
+
+    async def run_layer(
+        self,
+        layer: List[str],
+        execute: Callable[[str], Awaitable[Any]]
+    ) -> List[Any]:
+        """Execute the tools of one layer concurrently, returning results in layer order"""
+        if len(layer) == 1:
+            return [await execute(layer[0])]
+
+        slots = asyncio.Semaphore(self.max_parallel)
+
+        async def execute_with_slot(name: str) -> Any:
+            async with slots:
+                return await execute(name)
+
+        return list(await asyncio.gather(*(execute_with_slot(name) for name in layer)))
+
+    def _get_keys(self, name: str):
+        """Get the context keys a tool reads and writes"""
+        tool = self.tools[name]
+        return set(getattr(tool, "reads", ())), set(getattr(tool, "writes", ()))
@@ -0,0 +1,129 @@
+"""
+Prompt Templates - Compiled Prompt Rendering for Cognitive Tools
+================================================================
+
+Prompt templates parsed once into literal and field segments, and a
+context renderer that renders selected context fields with size caps,
+reusing rendered fragments for repeated immutable context values.
+"""
+
+import reprlib
+from string import Formatter
+from typing import Dict, List, Any, Iterable, Optional, Tuple
+
+from ..utils.cache import LRUCache
+
+CHARS_PER_TOKEN = 4  # Rough average for English text
+IMMUTABLE_TYPES = (str, bytes, int, float, bool, type(None))
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of a text"""
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+class PromptTemplate:
+    """Template compiled into literal segments and named fields"""
+
+    def __init__(self, template: str):
+        self.segments: List[Tuple[str, Optional[str]]] = []  # (literal, field name)
+        for literal, field_name, _, _ in Formatter().parse(template):
+            self.segments.append((literal, field_name))
+        self.fields = {field_name for _, field_name in self.segments if field_name is not None}
+        self.static_length = sum(len(literal) for literal, _ in self.segments)
+
+    def partial(self, **values: str) -> 'PromptTemplate':
+        """Pre-render some fields, returning a template with the remaining ones"""
+        compiled = PromptTemplate.__new__(PromptTemplate)
+        compiled.segments = []
+        for literal, field_name in self.segments:
+            if field_name in values:
+                literal, field_name = literal + values[field_name], None
+
+            # Merge adjacent literals so rendering joins fewer parts
+            if compiled.segments and compiled.segments[-1][1] is None:
+                previous_literal, _ = compiled.segments.pop()
+                literal = previous_literal + literal
+            compiled.segments.append((literal, field_name))
+
+        compiled.fields = {field_name for _, field_name in compiled.segments if field_name is not None}
+        compiled.static_length = sum(len(literal) for literal, _ in compiled.segments)
+        return compiled
+
+    def render(self, **values: str) -> str:
+        """Render the template with values for every remaining field"""
+        parts = []
+        for literal, field_name in self.segments:
+            parts.append(literal)
+            if field_name is not None:
+                parts.append(values[field_name])
+        return "".join(parts)
+
+class ContextRenderer:
+    """
+    Renders context fields selectively within character budgets.
+
+    Fragments of immutable values are cached by key and content hash, so
+    fields that repeat across a tool sequence are rendered only once.
+    Mutable containers are always re-rendered, bounded by reprlib.
+    """
+
+    def __init__(self, max_field_chars: int = 1000, cache_size: int = 1024):
+        self.max_field_chars = max_field_chars
+        self._repr = reprlib.Repr()
+        self._repr.maxstring = max_field_chars
+        self._repr.maxother = max_field_chars
+        self._repr.maxlist = self._repr.maxtuple = self._repr.maxdict = 8
+        self._fragments = LRUCache(cache_size)  # (key, type, hash) of an immutable value -> fragment
+
+    def render(
+        self,
+        context: Dict[str, Any],
+        priority_keys: Iterable[str] = (),
+        max_chars: Optional[int] = None,
+        exclude: Iterable[str] = ()
+    ) -> str:
+        """Render priority keys first, then remaining keys, within max_chars"""
+        excluded = set(exclude)
+        ordered_keys = [key for key in priority_keys if key in context and key not in excluded]
+        seen = set(ordered_keys)
+        ordered_keys.extend(key for key in context if key not in seen and key not in excluded)
+
+        lines = []
+        used_chars = 0
+        for position, key in enumerate(ordered_keys):
+            fragment = self._render_field(key, context[key])
+            if max_chars is not None and used_chars + len(fragment) > max_chars:
+                lines.append(f"    ... {len(ordered_keys) - position} more fields omitted")
+                break
+            lines.append(fragment)
+            used_chars += len(fragment) + 1
+
+        return "{\n" + "\n".join(lines) + "\n}" if lines else "{}"
+
+    def _render_field(self, key: str, value: Any) -> str:
+        """Render one context field, reusing the fragment for a repeated immutable value"""
+        cache_key = None
+        if self._is_immutable(value):
+            cache_key = (key, type(value).__name__, hash(value))
+            cached = self._fragments.get(cache_key)
+            if cached is not None:
+                return cached
+
+        # reprlib bounds the work for large containers before the final cap
+        text = value if isinstance(value, str) else self._repr.repr(value)
+        if len(text) > self.max_field_chars:
+            text = text[:self.max_field_chars] + "..."
+        fragment = f"    {key}: {text}"
+
+        if cache_key is not None:
+            self._fragments.put(cache_key, fragment)
+        return fragment
+
+    def _is_immutable(self, value: Any) -> bool:
+        """Check for a scalar, string, or tuple of them"""
+        if isinstance(value, tuple):
+            return all(type(item) in IMMUTABLE_TYPES for item in value)
+        return type(value) in IMMUTABLE_TYPES
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get fragment cache statistics"""
+        return self._fragments.get_stats()
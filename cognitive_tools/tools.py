@@ -6,43 +6,149 @@ Individual cognitive tool implementations based on IBM Zurich research.
 Each tool represents a specific cognitive operation with structured templates.
 """
 
-import asyncio
-from typing import Dict, List, Any
+import time
+from typing import Dict, List, Any, Optional, Tuple
 from abc import ABC, abstractmethod
 
 from ..core.base import ProcessingResult
-
-class CognitiveTool(ABC):
-    """Base class for cognitive tools"""
-    
-    def __init__(self, name: str, description: str):
-        self.name = name
-        self.description = description
-    
-    @abstractmethod
-    async def execute(self, content: str, parameters: Dict[str, Any]) -> ProcessingResult:
-        """Execute the cognitive tool"""
-        pass
-    
-    def _create_prompt_template(self, content: str, context: Dict[str, Any]) -> str:
-        """Create structured prompt template for this tool"""
-        return f"""
-/{self.name}{{
-    intent="{self.description}",
+from .backends import LocalModelBackend, ModelRequest, ModelResponse
+from .dispatcher import ModelDispatcher
+from .templates import CHARS_PER_TOKEN, ContextRenderer, PromptTemplate, estimate_tokens
+
+# Structured prompt shared by all tools, compiled once at import
+TOOL_PROMPT_TEMPLATE = PromptTemplate("""
+/{name}{{
+    intent="{description}",
     content="{content}",
     context={context},
     
     process=[
-        {self._get_process_steps()}
+        {process_steps}
     ],
     
     output={{
-        result="Specific output from {self.name} operation",
+        result="Specific output from {name} operation",
         reasoning="Step-by-step reasoning process",
         confidence="Confidence score for the result"
     }}
 }}
-        """
+        """)
+
+class CognitiveTool(ABC):
+    """Base class for cognitive tools"""
+    
+    # Result attributes overridden by each tool
+    base_confidence = 0.8
+    trace_step = "tool_execution"
+    trace_result = "Executed cognitive operation"
+    result_metadata: Dict[str, Any] = {}
+    
+    # Context keys used for dependency scheduling
+    reads: Tuple[str, ...] = ("original_query",)
+    writes: Tuple[str, ...] = ()
+    input_key: Optional[str] = None  # Context key used as input instead of the query
+    
+    def __init__(
+        self, 
+        name: str, 
+        description: str,
+        dispatcher: Optional[ModelDispatcher] = None,
+        max_tokens: int = 4000,
+        temperature: float = 0.7,
+        max_prompt_tokens: int = 2000,
+        context_renderer: Optional[ContextRenderer] = None
+    ):
+        self.name = name
+        self.description = description
+        self.dispatcher = dispatcher or ModelDispatcher(LocalModelBackend())
+        self.max_tokens = max_tokens
+        self.temperature = temperature
+        self.max_prompt_tokens = max_prompt_tokens
+        self.context_renderer = context_renderer or ContextRenderer()
+        
+        # Tool-specific parts of the prompt are rendered once
+        self._prompt_template = TOOL_PROMPT_TEMPLATE.partial(
+            name=self.name,
+            description=self.description,
+            process_steps=self._get_process_steps()
+        )
+    
+    async def execute(self, content: str, parameters: Dict[str, Any]) -> ProcessingResult:
+        """Execute the cognitive tool through the model dispatcher"""
+        context = parameters.get("context", {})
+        start_time = time.perf_counter()
+        
+        request = parameters.get("model_request") or self.build_request(content, context)
+        
+        try:
+            # Hedged duplicates must not coalesce onto the call they are hedging
+            response = await self.dispatcher.submit(
+                request, coalesce=not parameters.get("hedge", False)
+            )
+        except Exception as e:
+            # Degrade to the locally rendered result when the model is unavailable
+            response = ModelResponse(
+                text=request.get_fallback(),
+                model="local-fallback",
+                degraded=True,
+                metadata={"error": str(e)}
+            )
+        
+        confidence = self.base_confidence * (0.5 if response.degraded else 1.0)
+        
+        return ProcessingResult(
+            content=response.text,
+            confidence=confidence,
+            processing_time=time.perf_counter() - start_time,
+            metadata={
+                "tool": self.name,
+                **self.result_metadata,
+                "model": response.model,
+                "degraded": response.degraded,
+                "prompt_tokens": estimate_tokens(request.prompt)
+            },
+            reasoning_trace=[{
+                "step": self.trace_step,
+                "result": self.trace_result
+            }]
+        )
+    
+    @abstractmethod
+    def _render_local_result(self, content: str, context: Dict[str, Any]) -> str:
+        """Render this tool's result locally without a model"""
+        pass
+    
+    def build_request(self, content: str, context: Dict[str, Any]) -> ModelRequest:
+        """Build the model request this tool sends for the given content and context"""
+        return ModelRequest(
+            tool=self.name,
+            prompt=self._create_prompt_template(content, context),
+            max_tokens=self.max_tokens,
+            temperature=self.temperature,
+            # Rendered only if the local backend or a failure needs it
+            render_fallback=lambda: self._render_local_result(content, context)
+        )
+    
+    def _create_prompt_template(self, content: str, context: Dict[str, Any]) -> str:
+        """Create structured prompt template for this tool within the prompt token budget"""
+        budget_chars = self.max_prompt_tokens * CHARS_PER_TOKEN - self._prompt_template.static_length
+        
+        # The query is already rendered as content
+        excluded_keys = ("original_query",) if context.get("original_query") is content else ()
+        
+        # Content gets at most half the budget, context fields share the rest
+        content_chars = max(0, budget_chars // 2)
+        if len(content) > content_chars:
+            content = content[:content_chars] + "..."
+        
+        rendered_context = self.context_renderer.render(
+            context,
+            priority_keys=self.reads,
+            max_chars=max(0, budget_chars - len(content)),
+            exclude=excluded_keys
+        )
+        
+        return self._prompt_template.render(content=content, context=rendered_context)
     
     @abstractmethod
     def _get_process_steps(self) -> str:
@@ -57,32 +163,23 @@ class UnderstandTool(CognitiveTool):
     Focuses on breaking down problems and identifying core requirements.
     """
     
-    def __init__(self):
+    base_confidence = 0.85
+    trace_step = "concept_identification"
+    trace_result = "Identified main concepts and problem structure"
+    result_metadata = {"concepts_identified": 5}
+    reads = ("original_query",)
+    writes = ("understanding",)
+    
+    def __init__(self, dispatcher: Optional[ModelDispatcher] = None, **options):
         super().__init__(
             "understand",
-            "Comprehend the problem, identify main concepts, and clarify requirements"
+            "Comprehend the problem, identify main concepts, and clarify requirements",
+            dispatcher,
+            **options
         )
     
-    async def execute(self, content: str, parameters: Dict[str, Any]) -> ProcessingResult:
-        """Execute understanding analysis"""
-        context = parameters.get("context", {})
-        
-        # Simulate cognitive understanding process
-        understanding_result = self._analyze_understanding(content, context)
-        
-        # Mock processing time
-        await asyncio.sleep(0.1)
-        
-        return ProcessingResult(
-            content=understanding_result,
-            confidence=0.85,
-            processing_time=0.1,
-            metadata={"tool": "understand", "concepts_identified": 5},
-            reasoning_trace=[{
-                "step": "concept_identification",
-                "result": "Identified main concepts and problem structure"
-            }]
-        )
+    def _render_local_result(self, content: str, context: Dict[str, Any]) -> str:
+        return self._analyze_understanding(content, context)
     
     def _get_process_steps(self) -> str:
         return """
@@ -122,30 +219,23 @@ class ExtractTool(CognitiveTool):
     Focuses on identifying and extracting key information and data points.
     """
     
-    def __init__(self):
+    base_confidence = 0.80
+    trace_step = "information_extraction"
+    trace_result = "Extracted key facts and data points"
+    result_metadata = {"facts_extracted": 8}
+    reads = ("original_query", "understanding")
+    writes = ("extracted_info",)
+    
+    def __init__(self, dispatcher: Optional[ModelDispatcher] = None, **options):
         super().__init__(
             "extract",
-            "Extract relevant information, facts, and data points from content"
+            "Extract relevant information, facts, and data points from content",
+            dispatcher,
+            **options
         )
     
-    async def execute(self, content: str, parameters: Dict[str, Any]) -> ProcessingResult:
-        """Execute information extraction"""
-        context = parameters.get("context", {})
-        
-        extracted_info = self._extract_information(content, context)
-        
-        await asyncio.sleep(0.1)
-        
-        return ProcessingResult(
-            content=extracted_info,
-            confidence=0.80,
-            processing_time=0.1,
-            metadata={"tool": "extract", "facts_extracted": 8},
-            reasoning_trace=[{
-                "step": "information_extraction", 
-                "result": "Extracted key facts and data points"
-            }]
-        )
+    def _render_local_result(self, content: str, context: Dict[str, Any]) -> str:
+        return self._extract_information(content, context)
     
     def _get_process_steps(self) -> str:
         return """
@@ -187,30 +277,23 @@ class HighlightTool(CognitiveTool):
     Focuses on identifying critical relationships, patterns, and insights.
     """
     
-    def __init__(self):
+    base_confidence = 0.88
+    trace_step = "pattern_identification"
+    trace_result = "Identified key patterns and relationships"
+    result_metadata = {"patterns_found": 6}
+    reads = ("original_query", "understanding")
+    writes = ("key_insights",)
+    
+    def __init__(self, dispatcher: Optional[ModelDispatcher] = None, **options):
         super().__init__(
             "highlight",
-            "Identify and highlight key relationships, patterns, and critical insights"
+            "Identify and highlight key relationships, patterns, and critical insights",
+            dispatcher,
+            **options
         )
     
-    async def execute(self, content: str, parameters: Dict[str, Any]) -> ProcessingResult:
-        """Execute highlighting analysis"""
-        context = parameters.get("context", {})
-        
-        highlighted_insights = self._highlight_insights(content, context)
-        
-        await asyncio.sleep(0.1)
-        
-        return ProcessingResult(
-            content=highlighted_insights,
-            confidence=0.88,
-            processing_time=0.1,
-            metadata={"tool": "highlight", "patterns_found": 6},
-            reasoning_trace=[{
-                "step": "pattern_identification",
-                "result": "Identified key patterns and relationships"
-            }]
-        )
+    def _render_local_result(self, content: str, context: Dict[str, Any]) -> str:
+        return self._highlight_insights(content, context)
     
     def _get_process_steps(self) -> str:
         return """
@@ -257,30 +340,23 @@ class ApplyTool(CognitiveTool):
     Focuses on applying appropriate methods and techniques to solve problems.
     """
     
-    def __init__(self):
+    base_confidence = 0.90
+    trace_step = "reasoning_application"
+    trace_result = "Applied systematic reasoning techniques"
+    result_metadata = {"techniques_used": 4}
+    reads = ("original_query", "understanding", "extracted_info", "key_insights")
+    writes = ("reasoning_result",)
+    
+    def __init__(self, dispatcher: Optional[ModelDispatcher] = None, **options):
         super().__init__(
             "apply",
-            "Apply appropriate reasoning techniques and methods to solve the problem"
+            "Apply appropriate reasoning techniques and methods to solve the problem",
+            dispatcher,
+            **options
         )
     
-    async def execute(self, content: str, parameters: Dict[str, Any]) -> ProcessingResult:
-        """Execute reasoning application"""
-        context = parameters.get("context", {})
-        
-        applied_reasoning = self._apply_reasoning(content, context)
-        
-        await asyncio.sleep(0.2)  # Slightly longer for reasoning
-        
-        return ProcessingResult(
-            content=applied_reasoning,
-            confidence=0.90,
-            processing_time=0.2,
-            metadata={"tool": "apply", "techniques_used": 4},
-            reasoning_trace=[{
-                "step": "reasoning_application",
-                "result": "Applied systematic reasoning techniques"
-            }]
-        )
+    def _render_local_result(self, content: str, context: Dict[str, Any]) -> str:
+        return self._apply_reasoning(content, context)
     
     def _get_process_steps(self) -> str:
         return """
@@ -345,30 +421,24 @@ class ValidateTool(CognitiveTool):
     Focuses on verification, validation, and quality assurance of reasoning.
     """
     
-    def __init__(self):
+    base_confidence = 0.92
+    trace_step = "validation_verification"
+    trace_result = "Validated reasoning steps and conclusions"
+    result_metadata = {"checks_passed": 7}
+    reads = ("reasoning_result",)
+    writes = ("validation_result",)
+    input_key = "reasoning_result"
+    
+    def __init__(self, dispatcher: Optional[ModelDispatcher] = None, **options):
         super().__init__(
             "validate",
-            "Verify reasoning steps, validate conclusions, and ensure quality"
+            "Verify reasoning steps, validate conclusions, and ensure quality",
+            dispatcher,
+            **options
         )
     
-    async def execute(self, content: str, parameters: Dict[str, Any]) -> ProcessingResult:
-        """Execute validation analysis"""
-        context = parameters.get("context", {})
-        
-        validation_result = self._validate_reasoning(content, context)
-        
-        await asyncio.sleep(0.1)
-        
-        return ProcessingResult(
-            content=validation_result,
-            confidence=0.92,
-            processing_time=0.1,
-            metadata={"tool": "validate", "checks_passed": 7},
-            reasoning_trace=[{
-                "step": "validation_verification",
-                "result": "Validated reasoning steps and conclusions"
-            }]
-        )
+    def _render_local_result(self, content: str, context: Dict[str, Any]) -> str:
+        return self._validate_reasoning(content, context)
     
     def _get_process_steps(self) -> str:
         return """
@@ -7,14 +7,16 @@ A comprehensive, modern website showcasing the Context Engineering repository
 with interactive diagrams, paradigm explanations, and visual demonstrations.
 """
 
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import HTMLResponse, JSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 import time
 import json
 from typing import Dict, Any, Optional
 
+from utils.static import StaticAsset
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Context Engineering Research Hub",
@@ -278,11 +280,8 @@ async def get_research_metrics():
         }
     }
 
-@app.get("/", response_class=HTMLResponse)
-async def serve_research_hub():
-    """Serve the main demo HTML page."""
-    html_content = """
-<!DOCTYPE html>
+# Rendered and compressed once at import; requests only pick a variant
+RESEARCH_HUB_PAGE_HTML = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -898,8 +897,19 @@ async def serve_research_hub():
     </script>
 </body>
 </html>
-    """
-    return HTMLResponse(content=html_content)
+"""
+
+RESEARCH_HUB_PAGE = StaticAsset(RESEARCH_HUB_PAGE_HTML)
+
+@app.api_route("/", methods=["GET", "HEAD"], response_class=HTMLResponse)
+async def serve_research_hub(request: Request):
+    """Serve the main demo HTML page."""
+    status, headers, body = RESEARCH_HUB_PAGE.respond(
+        request.method,
+        request.headers.get("accept-encoding"),
+        request.headers.get("if-none-match")
+    )
+    return Response(content=body, status_code=status, headers=dict(headers))
 
 if __name__ == "__main__":
     import uvicorn
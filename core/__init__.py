@@ -10,10 +10,12 @@ from .engine import ContextualEngine
 from .config import ContextualConfig
 from .base import BaseContextProcessor
 from .orchestrator import ContextOrchestrator
+from .features import ContextFeatures
 
 __all__ = [
     'ContextualEngine',
     'ContextualConfig', 
     'BaseContextProcessor',
-    'ContextOrchestrator'
+    'ContextOrchestrator',
+    'ContextFeatures'
 ]
\ No newline at end of file
@@ -22,6 +22,9 @@ class ProcessingResult:
 class BaseContextProcessor(ABC):
     """Base class for all context processing components"""
     
+    # Config fields that can change at runtime without rebuilding the component
+    LIVE_CONFIG_KEYS: frozenset = frozenset()
+    
     def __init__(self, config: Any):
         self.config = config
         self.processing_count = 0
@@ -59,6 +62,18 @@ class BaseContextProcessor(ABC):
         self.processing_count += 1
         self.total_processing_time += processing_time
         self.last_processing_time = processing_time
+    
+    def apply_config_change(self, key: str, value: Any) -> bool:
+        """Apply a config field change in place, returning False if a rebuild is needed"""
+        if key not in self.LIVE_CONFIG_KEYS:
+            return False
+        setattr(self.config, key, value)
+        self._on_config_change(key, value)
+        return True
+    
+    def _on_config_change(self, key: str, value: Any):
+        """Update state derived from a changed config field"""
+        pass
 
 class BaseFieldProcessor(BaseContextProcessor):
     """Base class for field-based processors"""
@@ -147,6 +162,8 @@ class BaseToolProcessor(BaseContextProcessor):
         super().__init__(config)
         self.available_tools = {}
         self.tool_usage_count = {}
+        self.tool_cache_lookups = {}
+        self.tool_cache_hits = {}
     
     @abstractmethod
     def execute_tool(
@@ -163,10 +180,20 @@ class BaseToolProcessor(BaseContextProcessor):
         self.available_tools[tool_name] = tool_function
         self.tool_usage_count[tool_name] = 0
     
+    def _record_tool_cache_lookup(self, tool_name: str, hit: bool):
+        """Record a tool result cache lookup"""
+        self.tool_cache_lookups[tool_name] = self.tool_cache_lookups.get(tool_name, 0) + 1
+        if hit:
+            self.tool_cache_hits[tool_name] = self.tool_cache_hits.get(tool_name, 0) + 1
+    
     def get_tool_metrics(self) -> Dict[str, Any]:
         """Get tool usage metrics"""
         return {
             "available_tools": list(self.available_tools.keys()),
             "tool_usage": self.tool_usage_count.copy(),
-            "most_used_tool": max(self.tool_usage_count.items(), key=lambda x: x[1])[0] if self.tool_usage_count else None
+            "most_used_tool": max(self.tool_usage_count.items(), key=lambda x: x[1])[0] if self.tool_usage_count else None,
+            "tool_cache_hit_rates": {
+                tool_name: self.tool_cache_hits.get(tool_name, 0) / lookups
+                for tool_name, lookups in self.tool_cache_lookups.items()
+            }
         }
\ No newline at end of file
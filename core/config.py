@@ -14,6 +14,7 @@ class EngineConfig:
     model_provider: str = "openai"
     model_name: str = "gpt-4"
     api_key: Optional[str] = None
+    api_base: Optional[str] = None  # Defaults to the provider's public endpoint
     max_tokens: int = 4000
     temperature: float = 0.7
     enable_streaming: bool = True
@@ -31,6 +32,22 @@ class CognitiveToolsConfig:
     ])
     max_tool_depth: int = 5
     parallel_processing: bool = True
+    max_parallel_tools: int = 4  # Cap on concurrently running independent tools
+    batch_max_size: int = 16  # Max model requests per micro-batch
+    batch_max_wait_ms: float = 5.0  # Max time a request waits for its batch to fill
+    max_concurrent_batches: int = 8
+    backend_pool_size: int = 8  # Pooled connections to the model server
+    retry_backoff: float = 0.2  # Base delay in seconds for jittered retry backoff
+    tool_timeout: float = 30.0  # Upper bound for a single tool call in seconds
+    hedged_execution: bool = True
+    hedge_percentile: float = 0.95  # Duration percentile after which a duplicate call is fired
+    hedge_min_samples: int = 20
+    result_cache_enabled: bool = True
+    result_cache_size: int = 512
+    result_cache_max_bytes: int = 16 * 1024 * 1024
+    result_cache_path: Optional[str] = None  # SQLite file that keeps results across restarts
+    prompt_max_tokens: int = 2000  # Estimated token budget for a rendered tool prompt
+    prompt_max_field_chars: int = 1000  # Size cap for a single rendered context field
 
 @dataclass
 class NeuralFieldsConfig:
@@ -43,6 +60,8 @@ class NeuralFieldsConfig:
     attractor_formation_threshold: float = 0.7
     max_attractors: int = 10
     field_dimensions: int = 512
+    log_sample_rate: float = 1.0  # Fraction of hot-path debug/info lines emitted
+    log_rate_limit: float = 20.0  # Hot-path lines per second per call site, 0 for unlimited
 
 @dataclass
 class MemoryConfig:
@@ -54,6 +73,8 @@ class MemoryConfig:
     retention_strategy: str = "reasoning_value"  # "reasoning_value", "recency", "frequency"
     compression_method: str = "semantic_similarity"
     persistence_enabled: bool = True
+    log_sample_rate: float = 1.0  # Fraction of hot-path debug/info lines emitted
+    log_rate_limit: float = 20.0  # Hot-path lines per second per call site, 0 for unlimited
 
 @dataclass
 class SymbolicProcessingConfig:
@@ -64,6 +85,18 @@ class SymbolicProcessingConfig:
     retrieval_strategy: str = "best_match"  # "best_match", "ensemble", "weighted"
     symbolic_validation: bool = True
     generalization_enabled: bool = True
+    cache_size: int = 256
+    bounded_induction: bool = False
+    max_pattern_length: int = 32
+    max_candidate_patterns: int = 64
+    min_pattern_confidence: float = 0.75
+    batch_parallel_threshold: int = 64
+    batch_max_workers: int = 0  # 0 uses all available CPUs
+    batch_cooccurrence_terms: int = 32
+    batch_patterns_per_input: int = 5  # Max shared co-occurrence patterns added to each input
+    retrieval_cache_ttl: float = 300.0
+    log_sample_rate: float = 1.0  # Fraction of hot-path debug/info lines emitted
+    log_rate_limit: float = 20.0  # Hot-path lines per second per call site, 0 for unlimited
 
 @dataclass
 class QuantumSemanticsConfig:
@@ -74,6 +107,13 @@ class QuantumSemanticsConfig:
     superposition_threshold: float = 0.3
     measurement_strategy: str = "context_collapse"
     degeneracy_management: bool = True
+    semantic_perspectives: List[str] = field(default_factory=lambda: [
+        "literal_meaning", "metaphorical_meaning", "contextual_meaning",
+        "inferential_meaning", "pragmatic_meaning"
+    ])
+    superposition_cache_size: int = 256
+    measurement_seed: int = 0  # Combined with a request digest for reproducible collapse
+    measurement_history_size: int = 1000
 
 @dataclass
 class ProgressiveComplexityConfig:
@@ -86,6 +126,30 @@ class ProgressiveComplexityConfig:
     ])
     scaling_strategy: str = "adaptive"  # "adaptive", "linear", "exponential"
     efficiency_monitoring: bool = True
+    assessment_cache_size: int = 512
+    adaptive_routing: bool = False  # Learn which level to execute for each assessed level
+    routing_exploration: float = 0.1
+    routing_latency_weight: float = 0.1  # Reward penalty per multiple of the assessed level's own latency
+    routing_coverage_weight: float = 0.3  # Reward penalty for skipping all phases the assessed level runs
+    # Optional phases run at each level; every level keeps the learning phases
+    # (memory_consolidation, field_updates) unless a custom plan drops them
+    phase_plans: Dict[str, List[str]] = field(default_factory=lambda: {
+        "atom": ["memory_consolidation", "field_updates"],
+        "molecule": ["memory_retrieval", "memory_consolidation", "field_updates"],
+        "cell": ["memory_retrieval", "symbolic_processing", "memory_consolidation", "field_updates"],
+        "organ": [
+            "memory_retrieval", "quantum_semantic_interpretation", "symbolic_processing",
+            "memory_consolidation", "field_updates"
+        ],
+        "neural_system": [
+            "memory_retrieval", "neural_field_processing", "quantum_semantic_interpretation",
+            "symbolic_processing", "memory_consolidation", "field_updates"
+        ],
+        "neural_field": [
+            "memory_retrieval", "neural_field_processing", "quantum_semantic_interpretation",
+            "symbolic_processing", "memory_consolidation", "field_updates"
+        ]
+    })
 
 @dataclass
 class ContextualConfig:
@@ -7,8 +7,10 @@ operations. It integrates all research components into a unified system.
 """
 
 import asyncio
+import copy
 import time
 import logging
+from functools import partial
 from typing import Dict, List, Any, Optional, Union, AsyncGenerator
 from dataclasses import dataclass, field
 
@@ -20,7 +22,7 @@ from ..memory_systems import MemoryManager
 from ..symbolic_processing import SymbolicProcessor
 from ..quantum_semantics import QuantumSemanticProcessor
 from ..progressive_complexity import ComplexityManager
-from ..utils import ContextualLogger, PerformanceMonitor
+from ..utils import ContextualLogger, PerformanceMonitor, ConfigManager, ConfigFileWatcher
 
 @dataclass
 class ContextualRequest:
@@ -57,6 +59,16 @@ class ContextualEngine:
     - Progressive complexity management (Context Engineering)
     """
     
+    # Config section -> engine attribute holding the component built from it
+    COMPONENT_SECTIONS = {
+        "cognitive_tools": "cognitive_tools",
+        "neural_fields": "neural_fields",
+        "memory": "memory_manager",
+        "symbolic_processing": "symbolic_processor",
+        "quantum_semantics": "quantum_semantic",
+        "progressive_complexity": "complexity_manager"
+    }
+    
     def __init__(self, config: Optional[ContextualConfig] = None):
         """Initialize the contextual engine with configuration"""
         self.config = config or ContextualConfig()
@@ -76,53 +88,55 @@ class ContextualEngine:
             complexity_manager=self.complexity_manager
         )
         
+        # Live configuration: changed keys are routed to the components using them
+        self.config_manager = ConfigManager()
+        self.config_manager.replace_config(self.config.to_dict(), notify=False, validate=False)
+        self.config_file_watcher: Optional[ConfigFileWatcher] = None
+        self._pending_rebuilds = set()
+        for section in self.COMPONENT_SECTIONS:
+            self.config_manager.add_config_watcher(
+                partial(self._apply_component_config, section), key_prefix=f"{section}."
+            )
+        self.config_manager.add_config_watcher(self._apply_engine_config, key_prefix="engine.")
+        
         self.logger.info("ContextualEngine initialized successfully")
     
     def _initialize_components(self):
         """Initialize all component managers"""
         self.logger.info("Initializing contextual engine components...")
         
-        # Cognitive Tools Manager (IBM Zurich Framework)
-        if self.config.cognitive_tools.enabled:
-            self.cognitive_tools = CognitiveToolsManager(self.config.cognitive_tools)
-            self.logger.info("✓ Cognitive Tools Manager initialized")
-        else:
-            self.cognitive_tools = None
-            
-        # Neural Field Manager (Shanghai AI Lab + Context Engineering)
-        if self.config.neural_fields.enabled:
-            self.neural_fields = NeuralFieldManager(self.config.neural_fields) 
-            self.logger.info("✓ Neural Field Manager initialized")
-        else:
-            self.neural_fields = None
-            
-        # Memory Manager (Singapore-MIT MEM1)
-        if self.config.memory.enabled:
-            self.memory_manager = MemoryManager(self.config.memory)
-            self.logger.info("✓ Memory Manager initialized")
-        else:
-            self.memory_manager = None
-            
-        # Symbolic Processor (Princeton ICML)
-        if self.config.symbolic_processing.enabled:
-            self.symbolic_processor = SymbolicProcessor(self.config.symbolic_processing)
-            self.logger.info("✓ Symbolic Processor initialized")
-        else:
-            self.symbolic_processor = None
-            
-        # Quantum Semantic Processor (Indiana University)
-        if self.config.quantum_semantics.enabled:
-            self.quantum_semantic = QuantumSemanticProcessor(self.config.quantum_semantics)
-            self.logger.info("✓ Quantum Semantic Processor initialized")
-        else:
-            self.quantum_semantic = None
-            
-        # Complexity Manager (Context Engineering Progressive Framework)
-        if self.config.progressive_complexity.enabled:
-            self.complexity_manager = ComplexityManager(self.config.progressive_complexity)
-            self.logger.info("✓ Complexity Manager initialized")
-        else:
-            self.complexity_manager = None
+        for section in self.COMPONENT_SECTIONS:
+            self._initialize_component(section)
+    
+    def _initialize_component(self, section: str):
+        """Initialize the component manager for one config section"""
+        section_config = getattr(self.config, section)
+        component = None
+        
+        if not section_config.enabled:
+            pass
+        elif section == "cognitive_tools":
+            # Cognitive Tools Manager (IBM Zurich Framework)
+            component = CognitiveToolsManager(section_config, self.config.engine)
+        elif section == "neural_fields":
+            # Neural Field Manager (Shanghai AI Lab + Context Engineering)
+            component = NeuralFieldManager(section_config)
+        elif section == "memory":
+            # Memory Manager (Singapore-MIT MEM1)
+            component = MemoryManager(section_config)
+        elif section == "symbolic_processing":
+            # Symbolic Processor (Princeton ICML)
+            component = SymbolicProcessor(section_config)
+        elif section == "quantum_semantics":
+            # Quantum Semantic Processor (Indiana University)
+            component = QuantumSemanticProcessor(section_config)
+        elif section == "progressive_complexity":
+            # Complexity Manager (Context Engineering Progressive Framework)
+            component = ComplexityManager(section_config)
+        
+        setattr(self, self.COMPONENT_SECTIONS[section], component)
+        if component is not None:
+            self.logger.info(f"✓ {type(component).__name__} initialized")
     
     async def reason(
         self, 
@@ -282,25 +296,85 @@ class ContextualEngine:
         self.performance_monitor.reset()
         self.logger.info("✓ Engine state reset completed")
     
-    def configure(self, new_config: ContextualConfig):
-        """Update engine configuration"""
+    def configure(self, new_config: ContextualConfig) -> List[str]:
+        """Update engine configuration, keeping component state where changes apply in place"""
         self.logger.info("Updating contextual engine configuration...")
-        self.config = new_config
         
-        # Reinitialize components with new config
-        self._initialize_components()
+        # Validated before anything changes; watchers apply live keys in place
+        self._pending_rebuilds = set()
+        changed_keys = self.config_manager.replace_config(new_config.to_dict())
         
-        # Update orchestrator
-        self.orchestrator.update_components(
-            cognitive_tools=self.cognitive_tools,
-            neural_fields=self.neural_fields,
-            memory_manager=self.memory_manager,
-            symbolic_processor=self.symbolic_processor,
-            quantum_semantic=self.quantum_semantic,
-            complexity_manager=self.complexity_manager
+        self.config.debug_enabled = new_config.debug_enabled
+        self.config.logging_level = new_config.logging_level
+        self.config.performance_monitoring = new_config.performance_monitoring
+        
+        # Engine settings are baked into the cognitive tools model backend
+        if "engine" in self._pending_rebuilds:
+            self._pending_rebuilds.discard("engine")
+            self.config.engine = new_config.engine
+            self._pending_rebuilds.add("cognitive_tools")
+        
+        # Reinitialize only components whose changes could not be applied in place
+        rebuilt = [section for section in self.COMPONENT_SECTIONS if section in self._pending_rebuilds]
+        for section in rebuilt:
+            setattr(self.config, section, getattr(new_config, section))
+            self._initialize_component(section)
+        
+        if rebuilt:
+            self.orchestrator.update_components(
+                cognitive_tools=self.cognitive_tools,
+                neural_fields=self.neural_fields,
+                memory_manager=self.memory_manager,
+                symbolic_processor=self.symbolic_processor,
+                quantum_semantic=self.quantum_semantic,
+                complexity_manager=self.complexity_manager
+            )
+        
+        self.logger.info(
+            f"✓ Configuration update completed: {len(changed_keys)} keys changed, "
+            f"rebuilt {rebuilt or 'no components'}"
         )
+        return changed_keys
+    
+    def _apply_component_config(self, section: str, key_path: str, value: Any):
+        """Apply a changed component key in place, or schedule a component rebuild"""
+        key = key_path.split(".", 1)[1]
+        component = getattr(self, self.COMPONENT_SECTIONS[section])
+        try:
+            applied = (
+                key != "enabled" and component is not None
+                and component.apply_config_change(key, copy.deepcopy(value))
+            )
+        except Exception as e:
+            self.logger.warning(f"Live update of {key_path} failed, rebuilding {section}: {e}")
+            applied = False
         
-        self.logger.info("✓ Configuration update completed")
+        if not applied:
+            self._pending_rebuilds.add(section)
+    
+    def _apply_engine_config(self, key_path: str, value: Any):
+        """Schedule the components built from engine settings for a rebuild"""
+        self._pending_rebuilds.add("engine")
+    
+    def watch_config_file(self, config_path: str, interval: float = 1.0) -> ConfigFileWatcher:
+        """Apply a JSON or YAML config file now and whenever it changes; needs a running loop"""
+        self.stop_config_watch()
+        self.config_file_watcher = ConfigFileWatcher(
+            config_path, self._reload_config_file, interval, initial_load=True
+        )
+        self.config_file_watcher.check()
+        self.config_file_watcher.start()
+        return self.config_file_watcher
+    
+    def stop_config_watch(self):
+        """Stop watching the config file"""
+        if self.config_file_watcher is not None:
+            self.config_file_watcher.stop()
+            self.config_file_watcher = None
+    
+    def _reload_config_file(self, file_config: Dict[str, Any]):
+        """Apply a reloaded config file on top of the current configuration"""
+        self.configure(ContextualConfig.from_dict(self.config_manager.merged_config(file_config)))
     
     def __repr__(self) -> str:
         """String representation of the engine"""
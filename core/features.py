@@ -0,0 +1,145 @@
+"""
+Context Features - Precomputed Context Representations
+=======================================================
+
+Shared, lazily computed features of a context dictionary so that
+components do not repeatedly stringify the same context.
+"""
+
+from typing import Dict, Any, Optional, Set, Tuple
+
+from ..utils.cache import content_digest
+
+class ContextFeatures:
+    """
+    Lowercase text blob, token set and structural statistics of a context.
+
+    Text fragments are cached per context key. Reassigned or new keys are
+    detected automatically on access; values mutated in place must be
+    invalidated explicitly with invalidate(key).
+    """
+
+    def __init__(self, context: Optional[Dict[str, Any]]):
+        self.context = context if context is not None else {}
+        self._fragments: Dict[str, Tuple[Any, str]] = {}  # key -> (value, lowercase text)
+        self._text: Optional[str] = None
+        self._tokens: Optional[Set[str]] = None
+        self._digest: Optional[str] = None
+        self._mentions: Dict[str, bool] = {}
+        self._structure: Optional[Dict[str, int]] = None
+
+    @classmethod
+    def resolve(
+        cls,
+        context: Optional[Dict[str, Any]],
+        features: Optional['ContextFeatures'] = None
+    ) -> 'ContextFeatures':
+        """Reuse precomputed features for this context, or build new ones"""
+        if features is not None and features.context is context:
+            return features
+        return cls(context)
+
+    def invalidate(self, *keys: str):
+        """Drop cached features for the given keys, or for all keys"""
+        if keys:
+            for key in keys:
+                self._fragments.pop(key, None)
+        else:
+            self._fragments.clear()
+        self._clear_derived()
+
+    @property
+    def text(self) -> str:
+        """Lowercase text of all context values joined by spaces"""
+        self._sync()
+        if self._text is None:
+            self._text = ' '.join(self._fragments[key][1] for key in self.context)
+        return self._text
+
+    @property
+    def tokens(self) -> Set[str]:
+        """Set of whitespace-separated tokens in the context text"""
+        self._sync()
+        if self._tokens is None:
+            self._tokens = set(self.text.split())
+        return self._tokens
+
+    @property
+    def digest(self) -> str:
+        """Stable digest of the context text"""
+        self._sync()
+        if self._digest is None:
+            self._digest = content_digest(self.text)
+        return self._digest
+
+    def mentions(self, term: str) -> bool:
+        """Check whether a term occurs anywhere in the context text"""
+        text = self.text
+        if term not in self._mentions:
+            self._mentions[term] = term in text
+        return self._mentions[term]
+
+    @property
+    def size(self) -> int:
+        """Number of top-level context items"""
+        return len(self.context)
+
+    @property
+    def nested_count(self) -> int:
+        """Number of top-level values that are dicts or lists"""
+        return self._get_structure()["nested_count"]
+
+    @property
+    def total_elements(self) -> int:
+        """Top-level items plus the direct children of nested values"""
+        return self._get_structure()["total_elements"]
+
+    def _get_structure(self) -> Dict[str, int]:
+        """Get structural statistics of the context"""
+        self._sync()
+        if self._structure is None:
+            nested_count = 0
+            total_elements = 0
+            for value in self.context.values():
+                total_elements += 1
+                if isinstance(value, (dict, list)):
+                    nested_count += 1
+                    total_elements += len(value)
+            self._structure = {
+                "nested_count": nested_count,
+                "total_elements": total_elements
+            }
+        return self._structure
+
+    def _is_stale(self) -> bool:
+        """Check whether context keys were added, removed or reassigned"""
+        if len(self._fragments) != len(self.context):
+            return True
+        for key, value in self.context.items():
+            fragment = self._fragments.get(key)
+            if fragment is None or fragment[0] is not value:
+                return True
+        return False
+
+    def _sync(self):
+        """Refresh text fragments for added, removed or reassigned keys"""
+        if not self._is_stale():
+            return
+
+        fragments = {}
+        for key, value in self.context.items():
+            fragment = self._fragments.get(key)
+            if fragment is None or fragment[0] is not value:
+                fragment = (value, str(value).lower())
+            fragments[key] = fragment
+
+        self._fragments = fragments
+        self._clear_derived()
+
+    def _clear_derived(self):
+        """Clear features derived from the text fragments"""
+        self._text = None
+        self._tokens = None
+        self._digest = None
+        self._mentions = {}
+        self._structure = None
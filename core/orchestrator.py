@@ -9,16 +9,17 @@ to provide seamless integration of research findings into practical solutions.
 import asyncio
 import time
 import logging
-from typing import Dict, List, Any, Optional, AsyncGenerator
+from typing import Dict, List, Any, Optional, AsyncGenerator, Callable
 from dataclasses import dataclass
 
 from .base import ProcessingResult
+from .features import ContextFeatures
 from ..cognitive_tools import CognitiveToolsManager
 from ..neural_fields import NeuralFieldManager
 from ..memory_systems import MemoryManager
 from ..symbolic_processing import SymbolicProcessor
 from ..quantum_semantics import QuantumSemanticProcessor
-from ..progressive_complexity import ComplexityManager
+from ..progressive_complexity import ComplexityManager, ExecutionPlan
 
 @dataclass
 class IntegratedResult:
@@ -62,12 +63,17 @@ class ContextOrchestrator:
         
         self.logger = logging.getLogger("ContextOrchestrator")
         
-    async def process_request(self, request) -> IntegratedResult:
+    async def process_request(
+        self,
+        request,
+        on_phase: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> IntegratedResult:
         """
         Process a request using integrated contextual processing.
         
         Args:
             request: ContextualRequest object
+            on_phase: Optional callback receiving each phase's trace entry as it completes
             
         Returns:
             IntegratedResult with comprehensive processing output
@@ -76,32 +82,52 @@ class ContextOrchestrator:
         reasoning_trace = []
         performance_metrics = {}
         
+        def record_phase(entry: Dict[str, Any]):
+            reasoning_trace.append(entry)
+            if on_phase is not None:
+                on_phase(entry)
+        
         self.logger.info(f"Starting integrated contextual processing: {request.query[:100]}...")
         
+        # Context features are built once and refreshed as phases enrich the context
+        enriched_context = request.context.copy()
+        context_features = ContextFeatures(enriched_context)
+        
         # Phase 1: Complexity Assessment and Scaling
         target_complexity = "neural_system"  # Default
+        execution_plan = None  # Without a complexity manager every phase runs
         if self.complexity_manager:
             complexity_result = await self.complexity_manager.assess_complexity(
-                request.query, request.context
+                request.query, enriched_context, context_features
             )
-            target_complexity = complexity_result.recommended_complexity
-            reasoning_trace.append({
+            
+            # The plan decides the executed level and which optional phases run;
+            # an explicit complexity preference is executed as requested
+            preference = getattr(request, "complexity_preference", "auto")
+            if preference in self.complexity_manager.complexity_levels:
+                execution_plan = self.complexity_manager.plan_execution(preference, adaptive=False)
+            else:
+                execution_plan = self.complexity_manager.plan_execution(
+                    complexity_result.recommended_complexity
+                )
+            target_complexity = execution_plan.complexity
+            record_phase({
                 "phase": "complexity_assessment",
-                "result": target_complexity,
+                "result": complexity_result.recommended_complexity,
+                "execution_complexity": target_complexity,
                 "confidence": complexity_result.confidence
             })
         
         # Phase 2: Memory Retrieval and Context Enrichment
-        enriched_context = request.context.copy()
         memory_updates = {}
         
-        if self.memory_manager:
+        if self.memory_manager and self._phase_enabled(execution_plan, "memory_retrieval"):
             memory_result = await self.memory_manager.retrieve_relevant_memories(
                 request.query, request.context
             )
             enriched_context["retrieved_memories"] = memory_result.memories
             memory_updates["retrieved"] = memory_result.memories
-            reasoning_trace.append({
+            record_phase({
                 "phase": "memory_retrieval", 
                 "retrieved_count": len(memory_result.memories),
                 "relevance_score": memory_result.average_relevance
@@ -109,7 +135,7 @@ class ContextOrchestrator:
         
         # Phase 3: Neural Field Injection and Resonance
         field_state = {}
-        if self.neural_fields:
+        if self.neural_fields and self._phase_enabled(execution_plan, "neural_field_processing"):
             # Inject query into field
             field_injection = await self.neural_fields.inject_pattern(
                 request.query, strength=1.0
@@ -123,7 +149,7 @@ class ContextOrchestrator:
             field_state = self.neural_fields.get_field_state()
             enriched_context["field_resonance"] = field_resonance.resonance_score
             
-            reasoning_trace.append({
+            record_phase({
                 "phase": "neural_field_processing",
                 "resonance_score": field_resonance.resonance_score,
                 "field_attractors": len(field_state.get("attractors", {}))
@@ -131,14 +157,14 @@ class ContextOrchestrator:
         
         # Phase 4: Quantum Semantic Interpretation
         interpretation_results = []
-        if self.quantum_semantic:
+        if self.quantum_semantic and self._phase_enabled(execution_plan, "quantum_semantic_interpretation"):
             semantic_result = await self.quantum_semantic.interpret_with_context(
-                request.query, enriched_context
+                request.query, enriched_context, context_features
             )
             interpretation_results = semantic_result.interpretations
             enriched_context["semantic_interpretations"] = interpretation_results
             
-            reasoning_trace.append({
+            record_phase({
                 "phase": "quantum_semantic_interpretation",
                 "interpretation_count": len(interpretation_results),
                 "uncertainty_score": semantic_result.uncertainty_score
@@ -146,14 +172,14 @@ class ContextOrchestrator:
         
         # Phase 5: Symbolic Processing and Abstract Reasoning
         symbolic_result = None
-        if self.symbolic_processor:
+        if self.symbolic_processor and self._phase_enabled(execution_plan, "symbolic_processing"):
             symbolic_result = await self.symbolic_processor.three_stage_process(
-                request.query, enriched_context
+                request.query, enriched_context, context_features=context_features
             )
             enriched_context["symbolic_variables"] = symbolic_result.variables
             enriched_context["abstract_patterns"] = symbolic_result.patterns
             
-            reasoning_trace.append({
+            record_phase({
                 "phase": "symbolic_processing",
                 "abstraction_depth": symbolic_result.abstraction_depth,
                 "pattern_count": len(symbolic_result.patterns)
@@ -170,7 +196,7 @@ class ContextOrchestrator:
             final_result = cognitive_result.result
             cognitive_trace = cognitive_result.reasoning_trace
             
-            reasoning_trace.append({
+            record_phase({
                 "phase": "cognitive_tools_execution", 
                 "tools_used": cognitive_result.tools_used,
                 "verification_passed": cognitive_result.verification_passed
@@ -178,32 +204,32 @@ class ContextOrchestrator:
         else:
             # Fallback: Direct processing without cognitive tools
             final_result = await self._fallback_processing(request.query, enriched_context)
-            reasoning_trace.append({
+            record_phase({
                 "phase": "fallback_processing",
                 "method": "direct_response"
             })
         
         # Phase 7: Memory Consolidation and Updates
-        if self.memory_manager and final_result:
+        if self.memory_manager and final_result and self._phase_enabled(execution_plan, "memory_consolidation"):
             consolidation_result = await self.memory_manager.consolidate_experience(
                 request.query, final_result, enriched_context
             )
             memory_updates["consolidated"] = consolidation_result.insights
             
-            reasoning_trace.append({
+            record_phase({
                 "phase": "memory_consolidation",
                 "insights_extracted": len(consolidation_result.insights),
                 "memory_efficiency": consolidation_result.efficiency_score
             })
         
         # Phase 8: Field Updates and Attractor Formation
-        if self.neural_fields and final_result:
+        if self.neural_fields and final_result and self._phase_enabled(execution_plan, "field_updates"):
             field_update = await self.neural_fields.update_field_with_result(
                 final_result, enriched_context
             )
             field_state = self.neural_fields.get_field_state()
             
-            reasoning_trace.append({
+            record_phase({
                 "phase": "field_updates",
                 "attractors_formed": field_update.new_attractors,
                 "field_stability": field_update.stability_score
@@ -228,6 +254,9 @@ class ContextOrchestrator:
             "field_resonance": field_state.get("resonance", 0.5) if field_state else 0.5
         }
         
+        if execution_plan is not None:
+            self.complexity_manager.record_execution(execution_plan, overall_confidence, processing_time)
+        
         self.logger.info(f"✓ Integrated processing completed in {processing_time:.2f}s")
         
         return IntegratedResult(
@@ -239,48 +268,54 @@ class ContextOrchestrator:
             confidence_score=overall_confidence,
             metadata={
                 "target_complexity": target_complexity,
+                "executed_phases": execution_plan.phases if execution_plan else None,
                 "components_used": self._get_active_components(),
                 "integration_version": "1.0.0"
             }
         )
     
     async def process_request_stream(self, request) -> AsyncGenerator[Dict[str, Any], None]:
-        """Stream processing updates in real-time"""
-        yield {"status": "starting", "phase": "initialization"}
+        """Stream phase updates as the request is processed"""
+        yield {"status": "starting", "phase": "initialization", "timestamp": time.time()}
         
-        # Simulate streaming updates for each phase
-        phases = [
-            "complexity_assessment",
-            "memory_retrieval", 
-            "neural_field_processing",
-            "quantum_semantic_interpretation",
-            "symbolic_processing",
-            "cognitive_tools_execution",
-            "memory_consolidation",
-            "field_updates"
-        ]
+        # Phases report through a queue while the request runs as its own task
+        phase_updates: asyncio.Queue = asyncio.Queue()
+        task = asyncio.ensure_future(self.process_request(request, on_phase=phase_updates.put_nowait))
+        task.add_done_callback(lambda _: phase_updates.put_nowait(None))
+        phases_completed = 0
         
-        for i, phase in enumerate(phases):
-            yield {
-                "status": "processing",
-                "phase": phase,
-                "progress": (i + 1) / len(phases),
-                "timestamp": time.time()
-            }
+        try:
+            while True:
+                entry = await phase_updates.get()
+                if entry is None:
+                    break
+                phases_completed += 1
+                yield {
+                    "status": "processing",
+                    "phase": entry.get("phase"),
+                    "phases_completed": phases_completed,
+                    "details": entry,
+                    "timestamp": time.time()
+                }
             
-            # Simulate processing time
-            await asyncio.sleep(0.1)
-        
-        # Process the full request
-        result = await self.process_request(request)
+            result = task.result()
+        finally:
+            # A consumer that stops listening cancels the request
+            if not task.done():
+                task.cancel()
         
         yield {
             "status": "completed", 
             "result": result.result,
             "confidence": result.confidence_score,
-            "processing_time": result.performance_metrics["total_processing_time"]
+            "processing_time": result.performance_metrics["total_processing_time"],
+            "metadata": result.metadata
         }
     
+    def _phase_enabled(self, plan: Optional[ExecutionPlan], phase: str) -> bool:
+        """Check whether an optional phase should run under the execution plan"""
+        return plan is None or plan.includes(phase)
+    
     async def _fallback_processing(self, query: str, context: Dict[str, Any]) -> str:
         """Fallback processing when cognitive tools are not available"""
         return f"""
@@ -14,11 +14,12 @@ from urllib.parse import parse_qs, urlparse
 import threading
 import time
 
+from utils.static import StaticAsset
+
 # Import the Context Engineering framework - with fallback for missing modules
 try:
     from core.engine import ContextualEngine
     from core.config import ContextualConfig
-    from api.context import ContextAPI
     ENGINE_AVAILABLE = True
 except ImportError as e:
     print(f"⚠️  Context Engineering modules not fully available: {e}")
@@ -28,19 +29,25 @@ except ImportError as e:
 class ContextEngineRequestHandler(SimpleHTTPRequestHandler):
     """Custom request handler for Context Engineering demos."""
     
-    def __init__(self, *args, **kwargs):
-        # Initialize the contextual engine only if available
+    # One engine per server process, created by the first reasoning request
+    # rather than per connection, so health checks and page loads stay cheap
+    engine = None
+    engine_ready = False
+    _engine_initialized = False
+    
+    @classmethod
+    def _ensure_engine(cls):
+        """Initialize the shared contextual engine if available."""
+        if cls._engine_initialized:
+            return
+        cls._engine_initialized = True
         if ENGINE_AVAILABLE:
             try:
-                self.engine = ContextualEngine()
-                self.api = ContextAPI()
-                self.engine_ready = True
+                cls.engine = ContextualEngine()
+                cls.engine_ready = True
             except Exception as e:
                 print(f"⚠️  Failed to initialize Context Engine: {e}")
-                self.engine_ready = False
-        else:
-            self.engine_ready = False
-        super().__init__(*args, **kwargs)
+                cls.engine_ready = False
     
     def do_GET(self):
         """Handle GET requests."""
@@ -65,9 +72,7 @@ class ContextEngineRequestHandler(SimpleHTTPRequestHandler):
         path = parsed_path.path
         
         if path == '/':
-            self.send_response(200)
-            self.send_header('Content-type', 'text/html')
-            self.end_headers()
+            self.serve_demo_page()
         elif path == '/health':
             self.send_response(200)
             self.send_header('Content-type', 'application/json')
@@ -98,8 +103,136 @@ class ContextEngineRequestHandler(SimpleHTTPRequestHandler):
     
     def serve_demo_page(self):
         """Serve the demo HTML page."""
-        html_content = """
-<!DOCTYPE html>
+        status, headers, body = DEMO_PAGE.respond(
+            self.command,
+            self.headers.get('Accept-Encoding'),
+            self.headers.get('If-None-Match')
+        )
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+    
+    def serve_health(self):
+        """Serve health check endpoint for Kubernetes ingress."""
+        health_data = {
+            "status": "healthy",
+            "service": "context-engineering-demo", 
+            "version": "1.0.0",
+            "timestamp": time.time()
+        }
+        
+        self.send_response(200)
+        self.send_header('Content-type', 'application/json')
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.end_headers()
+        self.wfile.write(json.dumps(health_data).encode())
+    
+    def serve_status(self):
+        """Serve system status."""
+        status_data = {
+            "status": "operational",
+            "components": 6,
+            "version": "1.0.0"
+        }
+        
+        self.send_response(200)
+        self.send_header('Content-type', 'application/json')
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.end_headers()
+        self.wfile.write(json.dumps(status_data).encode())
+    
+    def serve_demo_api(self):
+        """Serve demo API endpoint."""
+        demo_data = {
+            "message": "Context Engineering Demo API",
+            "endpoints": [
+                "/api/status - System status",
+                "/api/reason - Process reasoning queries"
+            ]
+        }
+        
+        self.send_response(200)
+        self.send_header('Content-type', 'application/json')
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.end_headers()
+        self.wfile.write(json.dumps(demo_data).encode())
+    
+    def handle_reasoning_request(self):
+        """Handle reasoning API requests."""
+        try:
+            content_length = int(self.headers.get('Content-Length', 0))
+            if content_length > 0:
+                post_data = self.rfile.read(content_length).decode('utf-8')
+                request_data = json.loads(post_data)
+            else:
+                request_data = {}
+            
+            query = request_data.get('query', 'Hello, Context Engineering!')
+            
+            self._ensure_engine()
+            if self.engine_ready and ENGINE_AVAILABLE:
+                # Try to use the actual contextual engine
+                try:
+                    result = self.engine.reason_sync(query)
+                    response_data = {
+                        "success": True,
+                        "query": query,
+                        "response": result.result,
+                        "confidence": int(result.confidence_score * 100),
+                        "processing_time": f"{result.processing_time:.2f}",
+                        "components_used": len(result.reasoning_trace),
+                        "reasoning_trace": [step.get('description', str(step)) for step in result.reasoning_trace[:5]]
+                    }
+                except Exception as e:
+                    # Fall back to mock response
+                    response_data = self._get_mock_response(query, f"Engine error: {e}")
+            else:
+                # Use mock response
+                response_data = self._get_mock_response(query)
+            
+            self.send_response(200)
+            self.send_header('Content-type', 'application/json')
+            self.send_header('Access-Control-Allow-Origin', '*')
+            self.send_header('Access-Control-Allow-Methods', 'POST')
+            self.send_header('Access-Control-Allow-Headers', 'Content-Type')
+            self.end_headers()
+            self.wfile.write(json.dumps(response_data).encode())
+            
+        except Exception as e:
+            error_response = {
+                "success": False,
+                "error": f"Processing error: {str(e)}"
+            }
+            
+            self.send_response(500)
+            self.send_header('Content-type', 'application/json')
+            self.send_header('Access-Control-Allow-Origin', '*')
+            self.end_headers()
+            self.wfile.write(json.dumps(error_response).encode())
+    
+    def _get_mock_response(self, query, error_context=""):
+        """Generate a mock response for demonstration."""
+        return {
+            "success": True,
+            "query": query,
+            "response": f"🧠 Context Engineering Demo Response: This query '{query}' has been processed through our comprehensive contextual framework integrating multiple research components. {error_context}The system demonstrates multi-layered reasoning combining symbolic processing, neural field dynamics, quantum semantics, and progressive complexity management to provide contextually-aware responses.",
+            "confidence": 87,
+            "processing_time": "1.23",
+            "components_used": 5,
+            "reasoning_trace": [
+                "✓ Understanding phase - Query parsed and contextualized",
+                "✓ Information extraction - Key concepts identified", 
+                "✓ Pattern highlighting - Relevant patterns matched",
+                "✓ Reasoning application - Multi-step inference executed",
+                "✓ Validation - Response coherence verified"
+            ]
+        }
+
+# Rendered and compressed once at import; requests only pick a variant
+DEMO_PAGE_HTML = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -382,127 +515,9 @@ Examples:
     </script>
 </body>
 </html>
-        """
-        
-        self.send_response(200)
-        self.send_header('Content-type', 'text/html')
-        self.end_headers()
-        self.wfile.write(html_content.encode())
-    
-    def serve_health(self):
-        """Serve health check endpoint for Kubernetes ingress."""
-        health_data = {
-            "status": "healthy",
-            "service": "context-engineering-demo", 
-            "version": "1.0.0",
-            "timestamp": time.time()
-        }
-        
-        self.send_response(200)
-        self.send_header('Content-type', 'application/json')
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.end_headers()
-        self.wfile.write(json.dumps(health_data).encode())
-    
-    def serve_status(self):
-        """Serve system status."""
-        status_data = {
-            "status": "operational",
-            "components": 6,
-            "version": "1.0.0"
-        }
-        
-        self.send_response(200)
-        self.send_header('Content-type', 'application/json')
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.end_headers()
-        self.wfile.write(json.dumps(status_data).encode())
-    
-    def serve_demo_api(self):
-        """Serve demo API endpoint."""
-        demo_data = {
-            "message": "Context Engineering Demo API",
-            "endpoints": [
-                "/api/status - System status",
-                "/api/reason - Process reasoning queries"
-            ]
-        }
-        
-        self.send_response(200)
-        self.send_header('Content-type', 'application/json')
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.end_headers()
-        self.wfile.write(json.dumps(demo_data).encode())
-    
-    def handle_reasoning_request(self):
-        """Handle reasoning API requests."""
-        try:
-            content_length = int(self.headers.get('Content-Length', 0))
-            if content_length > 0:
-                post_data = self.rfile.read(content_length).decode('utf-8')
-                request_data = json.loads(post_data)
-            else:
-                request_data = {}
-            
-            query = request_data.get('query', 'Hello, Context Engineering!')
-            
-            if self.engine_ready and ENGINE_AVAILABLE:
-                # Try to use the actual contextual engine
-                try:
-                    result = self.engine.reason_sync(query)
-                    response_data = {
-                        "success": True,
-                        "query": query,
-                        "response": result.result,
-                        "confidence": int(result.confidence_score * 100),
-                        "processing_time": f"{result.processing_time:.2f}",
-                        "components_used": len(result.reasoning_trace),
-                        "reasoning_trace": [step.get('description', str(step)) for step in result.reasoning_trace[:5]]
-                    }
-                except Exception as e:
-                    # Fall back to mock response
-                    response_data = self._get_mock_response(query, f"Engine error: {e}")
-            else:
-                # Use mock response
-                response_data = self._get_mock_response(query)
-            
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.send_header('Access-Control-Allow-Methods', 'POST')
-            self.send_header('Access-Control-Allow-Headers', 'Content-Type')
-            self.end_headers()
-            self.wfile.write(json.dumps(response_data).encode())
-            
-        except Exception as e:
-            error_response = {
-                "success": False,
-                "error": f"Processing error: {str(e)}"
-            }
-            
-            self.send_response(500)
-            self.send_header('Content-type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            self.wfile.write(json.dumps(error_response).encode())
-    
-    def _get_mock_response(self, query, error_context=""):
-        """Generate a mock response for demonstration."""
-        return {
-            "success": True,
-            "query": query,
-            "response": f"🧠 Context Engineering Demo Response: This query '{query}' has been processed through our comprehensive contextual framework integrating multiple research components. {error_context}The system demonstrates multi-layered reasoning combining symbolic processing, neural field dynamics, quantum semantics, and progressive complexity management to provide contextually-aware responses.",
-            "confidence": 87,
-            "processing_time": "1.23",
-            "components_used": 5,
-            "reasoning_trace": [
-                "✓ Understanding phase - Query parsed and contextualized",
-                "✓ Information extraction - Key concepts identified", 
-                "✓ Pattern highlighting - Relevant patterns matched",
-                "✓ Reasoning application - Multi-step inference executed",
-                "✓ Validation - Response coherence verified"
-            ]
-        }
+"""
+
+DEMO_PAGE = StaticAsset(DEMO_PAGE_HTML)
 
 def run_demo_server(port=8001):
     """Run the demo server."""
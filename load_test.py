@@ -0,0 +1,519 @@
+#!/usr/bin/env python3
+"""
+Context Engineering Server Load Test
+====================================
+
+Drives a running server over keep-alive HTTP/1.1 connections and reports
+throughput, latency percentiles, error rates and status codes.
+
+Closed loop (each connection sends its next request when the last completes):
+
+    context-engine serve --port 8000 --workers 4
+    python load_test.py --url http://127.0.0.1:8000 --connections 32 --requests 2000
+
+Open loop (requests arrive at a fixed rate whether or not earlier ones finished;
+latency is measured from the scheduled arrival, so queueing is not hidden):
+
+    python load_test.py --rate 200 --duration 30 --arrival poisson
+
+Replay a JSONL corpus against the demo servers, stream reasoning over SSE,
+ramp concurrency to find the saturation point, or fail on SLO breaches:
+
+    python load_test.py --url http://127.0.0.1:8001 --path /api/reason --field query --corpus requests.jsonl
+    python load_test.py --path /v1/process/stream --stream --requests 200
+    python load_test.py --ramp 1,2,4,8,16,32 --requests 500
+    python load_test.py --slo p99=500ms --slo error_rate=1% --slo throughput=50
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import sys
+import time
+from collections import Counter
+from typing import Dict, List, Any, Optional, Tuple
+from urllib.parse import urlsplit
+
+DEFAULT_QUERIES = [
+    "What is 2+2?",
+    "Summarize the main idea of context engineering.",
+    "Compare memory consolidation and retrieval strategies for long conversations.",
+    "Analyze the theoretical framework and synthesize perspectives because the methodology implies consequences."
+]
+
+REPORT_PERCENTILES = (50, 95, 99, 99.9)
+TEXT_FIELDS = ("content", "query", "body", "title", "text")  # Corpus fields tried in order
+SATURATION_GAIN = 0.1  # A ramp step adding less throughput than this fraction is saturated
+
+class KeepAliveConnection:
+    """Minimal HTTP/1.1 client connection reused across requests"""
+
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self.reader: Optional[asyncio.StreamReader] = None
+        self.writer: Optional[asyncio.StreamWriter] = None
+        self.connects = 0
+        self.first_body_at: Optional[float] = None  # perf_counter when the last response's body began
+
+    async def request(self, method: str, path: str, payload: Optional[Dict[str, Any]] = None) -> Tuple[int, bytes]:
+        """Send a request, reconnecting if the server closed the connection"""
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+            self.connects += 1
+
+        body = json.dumps(payload).encode() if payload is not None else b""
+        head = (
+            f"{method} {path} HTTP/1.1\r\n"
+            f"Host: {self.host}:{self.port}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: keep-alive\r\n\r\n"
+        )
+        self.first_body_at = None
+        self.writer.write(head.encode() + body)
+        await self.writer.drain()
+
+        status_line = await self.reader.readline()
+        if not status_line:
+            raise ConnectionError("Server closed the connection")
+        status = int(status_line.split()[1])
+
+        headers = {}
+        while True:
+            line = await self.reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        if method == "HEAD" or status in (204, 304):
+            response_body = b""
+        elif headers.get("transfer-encoding", "").lower() == "chunked":
+            response_body = await self._read_chunked()
+        elif "content-length" in headers:
+            response_body = await self.reader.readexactly(int(headers["content-length"]))
+        else:
+            response_body = await self.reader.read()  # Delimited by the server closing
+            headers["connection"] = "close"
+        if self.first_body_at is None:
+            self.first_body_at = time.perf_counter()
+
+        if headers.get("connection", "").lower() == "close":
+            await self.close()
+        return status, response_body
+
+    async def _read_chunked(self) -> bytes:
+        """Read a chunked body, noting when its first chunk arrived"""
+        chunks = []
+        while True:
+            size_line = await self.reader.readline()
+            if not size_line:
+                raise ConnectionError("Server closed the connection mid-response")
+            size = int(size_line.split(b";")[0].strip(), 16)
+            if size == 0:
+                while await self.reader.readline() not in (b"\r\n", b"\n", b""):
+                    pass  # Trailers
+                return b"".join(chunks)
+            chunks.append(await self.reader.readexactly(size))
+            if self.first_body_at is None:
+                self.first_body_at = time.perf_counter()
+            await self.reader.readline()
+
+    async def close(self):
+        """Close the connection"""
+        if self.writer is not None:
+            self.writer.close()
+            try:
+                await self.writer.wait_closed()
+            except ConnectionError:
+                pass
+        self.reader = self.writer = None
+
+class LoadTest:
+    """
+    Load test against one endpoint.
+
+    Closed loop by default: `connections` workers each send their next
+    request when the previous one completes. With `rate` set the test is
+    open loop: requests are scheduled at that many per second and wait for
+    one of `connections` connections, and their latency counts from the
+    scheduled time so server queueing shows up in the tail.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        connections: int,
+        requests: Optional[int],
+        path: str,
+        queries: List[str],
+        field: str = "content",
+        corpus: Optional[List[Dict[str, Any]]] = None,
+        duration: Optional[float] = None,
+        rate: Optional[float] = None,
+        arrival: str = "constant",
+        stream: bool = False,
+        timeout: float = 30.0
+    ):
+        parts = urlsplit(url)
+        self.host = parts.hostname or "127.0.0.1"
+        self.port = parts.port or 80
+        self.connections = connections
+        self.requests = requests if requests is not None or duration is not None else 1000
+        self.duration = duration
+        self.rate = rate
+        self.arrival = arrival
+        self.stream = stream
+        self.timeout = timeout
+        self.path = path
+        self.queries = queries
+        self.corpus = corpus or [
+            {"method": "POST", "path": path, "payload": {field: query}} for query in queries
+        ]
+        self.latencies: List[float] = []
+        self.first_event_latencies: List[float] = []
+        self.statuses: Counter = Counter()
+        self.errors: Counter = Counter()
+        self.connects = 0
+        self._issued = 0
+        self._deadline: Optional[float] = None
+
+    async def run(self) -> Dict[str, Any]:
+        """Run the test and return the report"""
+        start = time.perf_counter()
+        if self.duration is not None:
+            self._deadline = start + self.duration
+
+        if self.rate:
+            await self._run_open_loop()
+        else:
+            await asyncio.gather(*(self._run_connection() for _ in range(self.connections)))
+        return self.report(time.perf_counter() - start)
+
+    def _next_request(self) -> Optional[Dict[str, Any]]:
+        """Take the next corpus entry, or None once the test is complete"""
+        if self.requests is not None and self._issued >= self.requests:
+            return None
+        if self._deadline is not None and time.perf_counter() >= self._deadline:
+            return None
+        entry = self.corpus[self._issued % len(self.corpus)]
+        self._issued += 1
+        return entry
+
+    async def _run_connection(self):
+        """Send requests on one connection until the test is complete"""
+        connection = KeepAliveConnection(self.host, self.port)
+        while True:
+            entry = self._next_request()
+            if entry is None:
+                break
+            await self._send(connection, entry, time.perf_counter())
+
+        self.connects += connection.connects
+        await connection.close()
+
+    async def _run_open_loop(self):
+        """Schedule requests at the target rate over a fixed connection pool"""
+        pool: asyncio.Queue = asyncio.Queue()
+        opened = [KeepAliveConnection(self.host, self.port) for _ in range(self.connections)]
+        for connection in opened:
+            pool.put_nowait(connection)
+
+        async def send_scheduled(entry: Dict[str, Any], scheduled: float):
+            connection = await pool.get()
+            try:
+                await self._send(connection, entry, scheduled)
+            finally:
+                pool.put_nowait(connection)
+
+        in_flight = set()
+        next_arrival = time.perf_counter()
+        while True:
+            delay = next_arrival - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            entry = self._next_request()
+            if entry is None:
+                break
+            task = asyncio.ensure_future(send_scheduled(entry, next_arrival))
+            in_flight.add(task)
+            task.add_done_callback(in_flight.discard)
+
+            next_arrival += random.expovariate(self.rate) if self.arrival == "poisson" else 1.0 / self.rate
+
+        if in_flight:
+            await asyncio.gather(*in_flight)
+        for connection in opened:
+            self.connects += connection.connects
+            await connection.close()
+
+    async def _send(self, connection: KeepAliveConnection, entry: Dict[str, Any], started: float):
+        """Send one corpus entry and record its outcome"""
+        try:
+            status, body = await asyncio.wait_for(
+                connection.request(entry.get("method", "POST"), entry.get("path", self.path), entry.get("payload")),
+                self.timeout
+            )
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.TimeoutError, OSError, ValueError) as e:
+            self.errors[type(e).__name__] += 1
+            await connection.close()
+            return
+
+        self.latencies.append(time.perf_counter() - started)
+        self.statuses[status] += 1
+        if self.stream and status < 400:
+            if connection.first_body_at is not None:
+                self.first_event_latencies.append(connection.first_body_at - started)
+            if b"event: error" in body:
+                self.errors["StreamError"] += 1
+
+    def report(self, duration: float) -> Dict[str, Any]:
+        """Summarize throughput, latency and outcomes"""
+        completed = len(self.latencies)
+        failed_statuses = sum(count for status, count in self.statuses.items() if status >= 400)
+        total = completed + sum(count for name, count in self.errors.items() if name != "StreamError")
+        failures = failed_statuses + sum(self.errors.values())
+
+        report = {
+            "mode": "open" if self.rate else "closed",
+            "connections": self.connections,
+            "offered_rate": self.rate,
+            "requests": total,
+            "duration": duration,
+            "throughput": (completed - failed_statuses) / duration if duration > 0 else 0.0,
+            "latency": latency_summary(self.latencies),
+            "error_rate": failures / total if total else 0.0,
+            "statuses": dict(self.statuses),
+            "errors": dict(self.errors),
+            "connections_opened": self.connects
+        }
+        if self.stream:
+            report["first_event_latency"] = latency_summary(self.first_event_latencies)
+        return report
+
+def percentile_of(sorted_values: List[float], percentile: float) -> float:
+    """Nearest-rank percentile of sorted values"""
+    if not sorted_values:
+        return 0.0
+    # Rounding first keeps float error (99.9 / 100 * 1000 = 999.0000000000001) from skipping a rank
+    rank = math.ceil(round(percentile * len(sorted_values) / 100, 9)) - 1
+    rank = max(0, min(len(sorted_values) - 1, rank))
+    return sorted_values[rank]
+
+def latency_summary(latencies: List[float]) -> Dict[str, float]:
+    """Report percentiles and maximum of latencies in seconds"""
+    latencies = sorted(latencies)
+    summary = {f"p{percentile:g}": percentile_of(latencies, percentile) for percentile in REPORT_PERCENTILES}
+    summary["max"] = latencies[-1] if latencies else 0.0
+    return summary
+
+def load_corpus(path: str, endpoint: str, field: str) -> List[Dict[str, Any]]:
+    """
+    Load request entries from a JSONL file.
+
+    Lines with a "payload" (and optionally "method" and "path") are sent as
+    given. Otherwise the first text field found (content, query, body, title
+    or text) becomes {field: text} posted to the endpoint, so a file like the
+    repository's requests.jsonl works as a seed corpus.
+    """
+    entries = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            record = json.loads(line)
+            if isinstance(record, str):
+                record = {"content": record}
+            if not isinstance(record, dict):
+                raise ValueError(f"{path}:{line_number}: expected a JSON object")
+
+            if "payload" in record:
+                entries.append({
+                    "method": record.get("method", "POST"),
+                    "path": record.get("path", endpoint),
+                    "payload": record["payload"]
+                })
+                continue
+
+            text = next((record[name] for name in TEXT_FIELDS if isinstance(record.get(name), str)), None)
+            if text is None:
+                raise ValueError(f"{path}:{line_number}: no payload or text field")
+            entries.append({"method": "POST", "path": endpoint, "payload": {field: text}})
+
+    if not entries:
+        raise ValueError(f"{path}: corpus is empty")
+    return entries
+
+def parse_slo(spec: str) -> Tuple[str, float]:
+    """
+    Parse an SLO such as "p99=500ms", "p50=0.2s", "error_rate=1%" or "throughput=50".
+
+    Latency SLOs are maxima in seconds (bare numbers are milliseconds),
+    error_rate is a maximum fraction and throughput a minimum in requests/s.
+    """
+    name, _, value = spec.partition("=")
+    name, value = name.strip().lower(), value.strip().lower()
+    if not value:
+        raise ValueError(f"SLO must look like name=value: {spec}")
+
+    if name == "error_rate":
+        return name, float(value[:-1]) / 100 if value.endswith("%") else float(value)
+    if name == "throughput":
+        return name, float(value.replace("/s", ""))
+    if name.startswith("p") or name == "max":
+        if value.endswith("ms"):
+            return name, float(value[:-2]) / 1000
+        if value.endswith("s"):
+            return name, float(value[:-1])
+        return name, float(value) / 1000
+    raise ValueError(f"Unknown SLO: {name}")
+
+def check_slos(report: Dict[str, Any], slos: List[Tuple[str, float]]) -> List[str]:
+    """Get a description of each SLO the report breaches"""
+    breaches = []
+    for name, limit in slos:
+        if name == "error_rate":
+            actual = report["error_rate"]
+            if actual > limit:
+                breaches.append(f"error_rate {actual:.2%} > {limit:.2%}")
+        elif name == "throughput":
+            actual = report["throughput"]
+            if actual < limit:
+                breaches.append(f"throughput {actual:.1f} req/s < {limit:g} req/s")
+        else:
+            actual = report["latency"].get(name)
+            if actual is None:
+                breaches.append(f"{name} is not reported (use one of {', '.join(report['latency'])})")
+            elif actual > limit:
+                breaches.append(f"{name} {actual * 1000:.1f}ms > {limit * 1000:.1f}ms")
+    return breaches
+
+async def run_ramp(levels: List[int], open_loop: bool, **options) -> Dict[str, Any]:
+    """Run one test per concurrency (or rate) level and locate saturation"""
+    steps = []
+    for level in levels:
+        if open_loop:
+            load_test = LoadTest(rate=level, **options)
+        else:
+            load_test = LoadTest(**dict(options, connections=level))
+        report = await load_test.run()
+        report["level"] = level
+        steps.append(report)
+
+    # Saturation: the first level whose extra load buys little extra throughput
+    saturation = None
+    for previous, step in zip(steps, steps[1:]):
+        if step["throughput"] < previous["throughput"] * (1 + SATURATION_GAIN):
+            saturation = previous["level"]
+            break
+
+    peak = max(steps, key=lambda step: step["throughput"])
+    return {
+        "steps": steps,
+        "peak_throughput": peak["throughput"],
+        "peak_level": peak["level"],
+        "saturation_level": saturation
+    }
+
+def print_report(report: Dict[str, Any]):
+    """Print a load test report"""
+    def format_latency(latency: Dict[str, float]) -> str:
+        return "  ".join(f"{name}={value * 1000:.1f}ms" for name, value in latency.items())
+
+    mode = f"open loop at {report['offered_rate']:g} req/s" if report["mode"] == "open" else "closed loop"
+    print(f"Mode:         {mode}, {report['connections']} connections")
+    print(f"Requests:     {report['requests']} in {report['duration']:.2f}s")
+    print(f"Throughput:   {report['throughput']:.1f} req/s")
+    print(f"Latency:      {format_latency(report['latency'])}")
+    if "first_event_latency" in report:
+        print(f"First event:  {format_latency(report['first_event_latency'])}")
+    print(f"Error rate:   {report['error_rate']:.2%}")
+    print(f"Statuses:     {report['statuses']}")
+    print(f"Errors:       {report['errors'] or 'none'}")
+    print(f"Connections:  {report['connections_opened']} opened")
+
+def print_ramp(ramp: Dict[str, Any], open_loop: bool):
+    """Print a saturation curve"""
+    print(f"{'rate' if open_loop else 'conns':>8} {'req/s':>9} {'p50 ms':>9} {'p99 ms':>9} {'p99.9 ms':>9} {'errors':>8}")
+    for step in ramp["steps"]:
+        latency = step["latency"]
+        print(
+            f"{step['level']:>8} {step['throughput']:>9.1f} {latency['p50'] * 1000:>9.1f} "
+            f"{latency['p99'] * 1000:>9.1f} {latency['p99.9'] * 1000:>9.1f} {step['error_rate']:>8.2%}"
+        )
+    print(f"Peak:         {ramp['peak_throughput']:.1f} req/s at {ramp['peak_level']}")
+    saturation = ramp["saturation_level"]
+    print(f"Saturation:   {saturation if saturation is not None else 'not reached'}")
+    if "slo_capacity" in ramp:
+        capacity = ramp["slo_capacity"]
+        print(f"SLO capacity: {capacity if capacity is not None else 'no level met the SLOs'}")
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Load test a context-engine server")
+    parser.add_argument("--url", default="http://127.0.0.1:8000", help="Server base URL")
+    parser.add_argument("--connections", type=int, default=16, help="Concurrent keep-alive connections")
+    parser.add_argument("--requests", type=int, help="Total requests to send (default 1000 without --duration)")
+    parser.add_argument("--duration", type=float, help="Stop issuing requests after this many seconds")
+    parser.add_argument("--path", default="/v1/process", help="Endpoint receiving {FIELD: query}")
+    parser.add_argument("--field", default="content", help="Payload field holding the query (/api/reason uses query)")
+    parser.add_argument("--corpus", help="JSONL file of requests to replay instead of the built-in queries")
+    parser.add_argument("--rate", type=float, help="Open loop: requests per second, independent of response times")
+    parser.add_argument("--arrival", choices=["constant", "poisson"], default="constant", help="Open loop arrival process")
+    parser.add_argument("--stream", action="store_true", help="Endpoint streams SSE; also report first event latency")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Per-request timeout in seconds")
+    parser.add_argument("--ramp", help="Comma-separated connection counts (or rates with --rate) to run in turn")
+    parser.add_argument(
+        "--slo", action="append", default=[],
+        help="Fail when breached: p50/p95/p99/p99.9/max=<ms|s>, error_rate=<fraction|%%>, throughput=<req/s>"
+    )
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args(argv)
+
+    try:
+        slos = [parse_slo(spec) for spec in args.slo]
+        corpus = load_corpus(args.corpus, args.path, args.field) if args.corpus else None
+        levels = [int(level) for level in args.ramp.split(",")] if args.ramp else None
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+
+    options = dict(
+        url=args.url, connections=args.connections, requests=args.requests, path=args.path,
+        queries=DEFAULT_QUERIES, field=args.field, corpus=corpus, duration=args.duration,
+        arrival=args.arrival, stream=args.stream, timeout=args.timeout
+    )
+
+    if levels:
+        open_loop = args.rate is not None
+        ramp = asyncio.run(run_ramp(levels, open_loop, **options))
+        breaches = []
+        for step in ramp["steps"]:
+            step["slo_breaches"] = check_slos(step, slos)
+            breaches.extend(f"{step['level']}: {breach}" for breach in step["slo_breaches"])
+        if slos:
+            passing = [step["level"] for step in ramp["steps"] if not step["slo_breaches"]]
+            ramp["slo_capacity"] = max(passing) if passing else None
+        report_errors = any(step["errors"] for step in ramp["steps"])
+        if args.json:
+            print(json.dumps(ramp, indent=2))
+        else:
+            print_ramp(ramp, open_loop)
+    else:
+        report = asyncio.run(LoadTest(rate=args.rate, **options).run())
+        breaches = report["slo_breaches"] = check_slos(report, slos)
+        report_errors = bool(report["errors"])
+        if args.json:
+            print(json.dumps(report, indent=2))
+        else:
+            print_report(report)
+
+    if breaches:
+        print("SLO breached: " + "; ".join(breaches), file=sys.stderr)
+        return 2
+    return 0 if not report_errors else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -10,10 +10,12 @@ from .manager import MemoryManager
 from .consolidation import MemoryConsolidator
 from .retrieval import MemoryRetriever
 from .efficiency import EfficiencyOptimizer
+from .statistics import MemoryStatistics
 
 __all__ = [
     'MemoryManager',
     'MemoryConsolidator',
     'MemoryRetriever',
-    'EfficiencyOptimizer'
+    'EfficiencyOptimizer',
+    'MemoryStatistics'
 ]
\ No newline at end of file
@@ -9,7 +9,14 @@ for resource utilization and performance optimization.
 import asyncio
 import time
 import math
-from typing import Dict, List, Any, Optional
+from itertools import accumulate
+from typing import Dict, List, Any, Iterable, Optional, Tuple
+
+import numpy as np
+
+from .statistics import MemoryStatistics
+
+VECTORIZED_COUNT_THRESHOLD = 512  # Memory count above which NumPy is faster
 
 class EfficiencyOptimizer:
     """Optimizes memory system efficiency using MEM1 principles"""
@@ -59,10 +66,16 @@ class EfficiencyOptimizer:
     async def optimize_memory_allocation(
         self, 
         memory_items: Dict[str, Any], 
-        target_efficiency: float
+        target_efficiency: float,
+        memory_stats: Optional[MemoryStatistics] = None
     ) -> Dict[str, Any]:
         """Optimize memory allocation for target efficiency"""
-        current_metrics = await self._calculate_current_metrics(memory_items)
+        # Callers without the manager's running aggregates pay for one full scan
+        if memory_stats is None:
+            memory_stats = MemoryStatistics()
+            memory_stats.rebuild(memory_items.values())
+        
+        current_metrics = await self._calculate_current_metrics(memory_stats)
         
         optimization_recommendations = {
             "current_efficiency": current_metrics["efficiency"],
@@ -78,26 +91,25 @@ class EfficiencyOptimizer:
             optimization_recommendations["recommendations"].append(memory_count_rec)
         
         # Memory quality optimization
-        quality_rec = await self._optimize_memory_quality(memory_items)
+        quality_rec = await self._optimize_memory_quality(memory_stats)
         optimization_recommendations["recommendations"].append(quality_rec)
         
         # Access pattern optimization
-        access_rec = await self._optimize_access_patterns(memory_items)
+        access_rec = await self._optimize_access_patterns(memory_stats)
         optimization_recommendations["recommendations"].append(access_rec)
         
         return optimization_recommendations
     
-    async def _calculate_current_metrics(self, memory_items: Dict[str, Any]) -> Dict[str, float]:
+    async def _calculate_current_metrics(self, memory_stats: MemoryStatistics) -> Dict[str, float]:
         """Calculate current memory system metrics"""
-        if not memory_items:
+        if not memory_stats.count:
             return {"efficiency": 1.0, "quality": 1.0, "utilization": 0.0}
         
         # Calculate memory quality (average reasoning value)
-        total_reasoning_value = sum(memory.reasoning_value for memory in memory_items.values())
-        average_quality = total_reasoning_value / len(memory_items)
+        average_quality = memory_stats.reasoning_value_mean
         
         # Calculate utilization (against budget)
-        utilization = len(memory_items) / self.config.memory_budget
+        utilization = memory_stats.count / self.config.memory_budget
         
         # Calculate overall efficiency
         efficiency = self._calculate_overall_efficiency(average_quality, utilization)
@@ -130,26 +142,19 @@ class EfficiencyOptimizer:
         """Optimize memory count for target efficiency"""
         current_count = len(memory_items)
         
-        # Calculate optimal count based on quality distribution
+        # Find the smallest count of top memories, from half the current count,
+        # that maintains target efficiency
         memory_values = [memory.reasoning_value for memory in memory_items.values()]
-        memory_values.sort(reverse=True)
+        min_count = max(1, int(current_count * 0.5))
         
-        # Find optimal count that maintains target efficiency
-        optimal_count = current_count
-        
-        for count in range(int(current_count * 0.5), current_count):
-            if count == 0:
-                continue
-                
-            # Calculate efficiency with top 'count' memories
-            top_memories_value = sum(memory_values[:count]) / count
-            utilization = count / self.config.memory_budget
-            
-            efficiency = self._calculate_overall_efficiency(top_memories_value, utilization)
-            
-            if efficiency >= target_efficiency:
-                optimal_count = count
-                break
+        if current_count > VECTORIZED_COUNT_THRESHOLD:
+            efficiency = self._calculate_efficiency_curve(memory_values, self.config.memory_budget)[1]
+            candidates = np.flatnonzero(efficiency[min_count - 1:current_count - 1] >= target_efficiency)
+            optimal_count = min_count + int(candidates[0]) if candidates.size else current_count
+        else:
+            optimal_count = self._find_optimal_count(
+                memory_values, min_count, target_efficiency
+            )
         
         return {
             "type": "memory_count_optimization",
@@ -159,105 +164,90 @@ class EfficiencyOptimizer:
             "efficiency_gain": self._estimate_efficiency_gain(current_count, optimal_count)
         }
     
-    async def _optimize_memory_quality(self, memory_items: Dict[str, Any]) -> Dict[str, Any]:
+    async def _optimize_memory_quality(self, memory_stats: MemoryStatistics) -> Dict[str, Any]:
         """Optimize memory quality through consolidation and enhancement"""
-        if not memory_items:
+        if not memory_stats.count:
             return {"type": "memory_quality_optimization", "recommendations": []}
         
-        # Identify low-quality memories
-        low_quality_memories = [
-            memory_id for memory_id, memory in memory_items.items()
-            if memory.reasoning_value < 0.3
-        ]
-        
-        # Identify high-quality memories
-        high_quality_memories = [
-            memory_id for memory_id, memory in memory_items.items()
-            if memory.reasoning_value > 0.8
-        ]
+        # Low-quality (< 0.3) and high-quality (> 0.8) memory counts
+        low_quality_count = memory_stats.low_value_count
+        high_quality_count = memory_stats.high_value_count
         
         recommendations = []
         
-        if low_quality_memories:
+        if low_quality_count:
             recommendations.append(
-                f"Consider consolidating or removing {len(low_quality_memories)} low-quality memories"
+                f"Consider consolidating or removing {low_quality_count} low-quality memories"
             )
         
-        if high_quality_memories:
+        if high_quality_count:
             recommendations.append(
-                f"Preserve and potentially expand {len(high_quality_memories)} high-quality memories"
+                f"Preserve and potentially expand {high_quality_count} high-quality memories"
             )
         
         # Quality improvement strategies
-        quality_strategies = await self._generate_quality_strategies(memory_items)
+        quality_strategies = await self._generate_quality_strategies(memory_stats)
         recommendations.extend(quality_strategies)
         
         return {
             "type": "memory_quality_optimization",
-            "low_quality_count": len(low_quality_memories),
-            "high_quality_count": len(high_quality_memories),
+            "low_quality_count": low_quality_count,
+            "high_quality_count": high_quality_count,
             "recommendations": recommendations
         }
     
-    async def _optimize_access_patterns(self, memory_items: Dict[str, Any]) -> Dict[str, Any]:
+    async def _optimize_access_patterns(self, memory_stats: MemoryStatistics) -> Dict[str, Any]:
         """Optimize memory access patterns for efficiency"""
-        if not memory_items:
+        if not memory_stats.count:
             return {"type": "access_pattern_optimization", "insights": []}
         
         # Analyze access patterns
-        access_stats = {
-            "frequently_accessed": [],
-            "rarely_accessed": [],
-            "never_accessed": []
+        never_accessed = memory_stats.access_counts.get(0, 0)
+        rarely_accessed = memory_stats.access_counts.get(1, 0)
+        access_distribution = {
+            "frequently_accessed": memory_stats.count - never_accessed - rarely_accessed,
+            "rarely_accessed": rarely_accessed,
+            "never_accessed": never_accessed
         }
         
-        for memory_id, memory in memory_items.items():
-            if memory.access_count == 0:
-                access_stats["never_accessed"].append(memory_id)
-            elif memory.access_count < 2:
-                access_stats["rarely_accessed"].append(memory_id)
-            else:
-                access_stats["frequently_accessed"].append(memory_id)
-        
         insights = []
         
-        if access_stats["never_accessed"]:
+        if access_distribution["never_accessed"]:
             insights.append(
-                f"{len(access_stats['never_accessed'])} memories never accessed - candidates for removal"
+                f"{access_distribution['never_accessed']} memories never accessed - candidates for removal"
             )
         
-        if access_stats["frequently_accessed"]:
+        if access_distribution["frequently_accessed"]:
             insights.append(
-                f"{len(access_stats['frequently_accessed'])} memories frequently accessed - ensure retention"
+                f"{access_distribution['frequently_accessed']} memories frequently accessed - ensure retention"
             )
         
         # Access pattern recommendations
-        pattern_recommendations = await self._generate_access_recommendations(access_stats)
+        pattern_recommendations = await self._generate_access_recommendations(access_distribution)
         insights.extend(pattern_recommendations)
         
         return {
             "type": "access_pattern_optimization",
-            "access_distribution": {k: len(v) for k, v in access_stats.items()},
+            "access_distribution": access_distribution,
             "insights": insights
         }
     
-    async def _generate_quality_strategies(self, memory_items: Dict[str, Any]) -> List[str]:
+    async def _generate_quality_strategies(self, memory_stats: MemoryStatistics) -> List[str]:
         """Generate strategies for improving memory quality"""
         strategies = []
         
         # Analyze reasoning value distribution
-        reasoning_values = [memory.reasoning_value for memory in memory_items.values()]
-        avg_quality = sum(reasoning_values) / len(reasoning_values)
+        reasoning_value_stats = memory_stats.get_reasoning_value_stats()
+        avg_quality = reasoning_value_stats["average"]
         
         if avg_quality < 0.5:
             strategies.append("Overall memory quality is low - increase consolidation frequency")
         
-        if max(reasoning_values) - min(reasoning_values) > 0.7:
+        if reasoning_value_stats["max"] - reasoning_value_stats["min"] > 0.7:
             strategies.append("High quality variance - consider selective retention strategies")
         
         # Content-based strategies
-        content_lengths = [len(memory.content) for memory in memory_items.values()]
-        avg_length = sum(content_lengths) / len(content_lengths)
+        avg_length = memory_stats.content_length_sum / memory_stats.count
         
         if avg_length < 50:
             strategies.append("Memories are very short - consider content enrichment")
@@ -266,24 +256,88 @@ class EfficiencyOptimizer:
         
         return strategies
     
-    async def _generate_access_recommendations(self, access_stats: Dict[str, List]) -> List[str]:
+    async def _generate_access_recommendations(self, access_distribution: Dict[str, int]) -> List[str]:
         """Generate recommendations based on access patterns"""
         recommendations = []
         
-        total_memories = sum(len(memories) for memories in access_stats.values())
+        total_memories = sum(access_distribution.values())
         
-        if len(access_stats["never_accessed"]) > total_memories * 0.3:
+        if access_distribution["never_accessed"] > total_memories * 0.3:
             recommendations.append(
                 "High proportion of unused memories - review retention criteria"
             )
         
-        if len(access_stats["frequently_accessed"]) < total_memories * 0.1:
+        if access_distribution["frequently_accessed"] < total_memories * 0.1:
             recommendations.append(
                 "Few frequently accessed memories - improve retrieval targeting"
             )
         
         return recommendations
     
+    def _find_optimal_count(
+        self, 
+        memory_values: List[float], 
+        min_count: int, 
+        target_efficiency: float
+    ) -> int:
+        """Scan counts using prefix sums of the highest reasoning values"""
+        prefix_sums = list(accumulate(sorted(memory_values, reverse=True)))
+        
+        for count in range(min_count, len(memory_values)):
+            # Efficiency with top 'count' memories
+            top_memories_value = prefix_sums[count - 1] / count
+            utilization = count / self.config.memory_budget
+            
+            efficiency = self._calculate_overall_efficiency(top_memories_value, utilization)
+            
+            if efficiency >= target_efficiency:
+                return count
+        
+        return len(memory_values)
+    
+    def _calculate_efficiency_curve(
+        self, 
+        memory_values: Iterable[float], 
+        memory_budget: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Calculate quality and efficiency of keeping the top 1..n memories"""
+        values = np.sort(np.fromiter(memory_values, dtype=float))[::-1]
+        counts = np.arange(1, len(values) + 1)
+        
+        quality = np.cumsum(values) / counts
+        utilization_efficiency = 1.0 - np.abs(counts / memory_budget - 0.75)
+        efficiency = np.clip((quality * 0.6) + (utilization_efficiency * 0.4), 0.0, 1.0)
+        
+        return quality, efficiency
+    
+    def get_efficiency_curve(
+        self, 
+        memory_items: Dict[str, Any], 
+        memory_budget: Optional[int] = None, 
+        max_points: int = 100
+    ) -> Dict[str, Any]:
+        """Get efficiency versus retained memory count for budget planning"""
+        memory_budget = memory_budget or self.config.memory_budget
+        if not memory_items:
+            return {"memory_budget": memory_budget, "counts": [], "quality": [], "efficiency": []}
+        
+        quality, efficiency = self._calculate_efficiency_curve(
+            (memory.reasoning_value for memory in memory_items.values()), memory_budget
+        )
+        
+        # Sample evenly spaced counts, always including the full count
+        points = np.unique(np.linspace(0, len(efficiency) - 1, max(2, max_points)).astype(int))
+        best_index = int(np.argmax(efficiency))
+        
+        return {
+            "memory_budget": memory_budget,
+            "counts": (points + 1).tolist(),
+            "quality": quality[points].tolist(),
+            "efficiency": efficiency[points].tolist(),
+            "best_count": best_index + 1,
+            "best_efficiency": float(efficiency[best_index])
+        }
+    
     def _estimate_efficiency_gain(self, current_count: int, optimal_count: int) -> float:
         """Estimate efficiency gain from count optimization"""
         if current_count == 0:
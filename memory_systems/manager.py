@@ -16,6 +16,8 @@ from ..core.base import BaseMemoryProcessor, ProcessingResult
 from .consolidation import MemoryConsolidator
 from .retrieval import MemoryRetriever
 from .efficiency import EfficiencyOptimizer
+from .statistics import MemoryStatistics
+from ..utils.logger import SampledLogger
 
 @dataclass
 class MemoryItem:
@@ -54,6 +56,11 @@ class MemoryManager(BaseMemoryProcessor):
     - Performance optimization for long-horizon tasks
     """
     
+    LIVE_CONFIG_KEYS = frozenset({
+        "consolidation_frequency", "memory_budget", "efficiency_target", "retention_strategy",
+        "compression_method", "persistence_enabled", "log_sample_rate", "log_rate_limit"
+    })
+    
     def __init__(self, config):
         super().__init__(config)
         
@@ -64,10 +71,14 @@ class MemoryManager(BaseMemoryProcessor):
         
         # Memory storage
         self.memory_items = {}  # Full memory storage
+        self.memory_stats = MemoryStatistics()  # Running aggregates over memory_items
         self.consolidated_insights = {}  # Consolidated high-value insights
         self.interaction_count = 0
         
         self.logger = logging.getLogger("MemoryManager")
+        self.sampled_logger = SampledLogger(
+            self.logger, config.log_sample_rate, config.log_rate_limit
+        )
         self.logger.info("MEM1 memory framework initialized")
     
     async def process(self, content: str, context: Dict[str, Any]) -> ProcessingResult:
@@ -116,7 +127,7 @@ class MemoryManager(BaseMemoryProcessor):
         max_results: int = 5
     ) -> RetrievalResult:
         """Retrieve memories relevant to the query using MEM1 principles"""
-        self.logger.debug(f"Retrieving memories for query: {query[:50]}...")
+        self.sampled_logger.debug("Retrieving memories for query: %.50s...", query)
         
         relevant_memories = await self.retriever.retrieve_memories(
             query, context, self.memory_items, max_results
@@ -126,6 +137,7 @@ class MemoryManager(BaseMemoryProcessor):
         for memory in relevant_memories:
             memory.access_count += 1
             memory.last_accessed = time.time()
+            self.memory_stats.record_access(memory.access_count - 1, memory.access_count)
         
         # Calculate retrieval metrics
         if relevant_memories:
@@ -154,7 +166,7 @@ class MemoryManager(BaseMemoryProcessor):
         context: Dict[str, Any]
     ) -> ConsolidationResult:
         """Consolidate experience using MEM1 reasoning-driven approach"""
-        self.logger.debug("Consolidating experience with reasoning-driven approach")
+        self.sampled_logger.debug("Consolidating experience with reasoning-driven approach")
         
         # Store the experience
         experience_memory = MemoryItem(
@@ -165,21 +177,23 @@ class MemoryManager(BaseMemoryProcessor):
             timestamp=time.time()
         )
         
-        self.memory_items[experience_memory.id] = experience_memory
+        self._put_memory(experience_memory)
         
         # Perform consolidation
         return await self.consolidate_memory()
     
     async def consolidate_memory(self) -> ConsolidationResult:
         """Perform MEM1-style memory consolidation"""
-        self.logger.info("Performing MEM1 memory consolidation...")
+        self.sampled_logger.info("Performing MEM1 memory consolidation...")
         
         consolidation_result = await self.consolidator.consolidate_memories(
             self.memory_items, self.config.efficiency_target
         )
         
         # Update memory storage based on consolidation
+        previous_items = self.memory_items
         self.memory_items = consolidation_result["updated_memories"]
+        self._apply_consolidation_diff(previous_items, self.memory_items)
         self.consolidated_insights.update(consolidation_result["insights"])
         
         self.consolidation_count += 1
@@ -191,6 +205,22 @@ class MemoryManager(BaseMemoryProcessor):
             memories_pruned=consolidation_result["memories_pruned"]
         )
     
+    def _apply_consolidation_diff(self, previous_items: Dict[str, Any], current_items: Dict[str, Any]):
+        """Update running statistics for the memories consolidation removed, added or replaced"""
+        # Consolidation builds new items rather than mutating, so identity marks a change
+        for memory_id, memory in previous_items.items():
+            if current_items.get(memory_id) is not memory:
+                self.memory_stats.remove(memory)
+        for memory_id, memory in current_items.items():
+            if previous_items.get(memory_id) is not memory:
+                self.memory_stats.add(memory)
+    
+    async def optimize_memory_allocation(self) -> Dict[str, Any]:
+        """Get allocation recommendations from the running memory statistics"""
+        return await self.efficiency_optimizer.optimize_memory_allocation(
+            self.memory_items, self.config.efficiency_target, self.memory_stats
+        )
+    
     async def store_memory(self, key: str, content: Any, priority: float = 1.0):
         """Store content in memory with reasoning value assessment"""
         reasoning_value = await self._assess_reasoning_value(content, priority)
@@ -203,7 +233,7 @@ class MemoryManager(BaseMemoryProcessor):
             timestamp=time.time()
         )
         
-        self.memory_items[key] = memory_item
+        self._put_memory(memory_item)
         self.interaction_count += 1
         
         # Check memory budget
@@ -212,6 +242,15 @@ class MemoryManager(BaseMemoryProcessor):
         
         return key
     
+    def _put_memory(self, memory_item: MemoryItem):
+        """Store a memory item, keeping running statistics in sync"""
+        previous_item = self.memory_items.get(memory_item.id)
+        if previous_item is not None:
+            self.memory_stats.remove(previous_item)
+        
+        self.memory_items[memory_item.id] = memory_item
+        self.memory_stats.add(memory_item)
+    
     def retrieve_memory(self, query: str, max_results: int = 5) -> List[Any]:
         """Synchronous memory retrieval"""
         try:
@@ -253,6 +292,10 @@ class MemoryManager(BaseMemoryProcessor):
     
     async def _enforce_memory_budget(self):
         """Enforce memory budget by removing low-value memories"""
+        self._trim_to_budget()
+    
+    def _trim_to_budget(self):
+        """Remove the lowest-value memories beyond the memory budget"""
         if len(self.memory_items) <= self.config.memory_budget:
             return
         
@@ -266,10 +309,20 @@ class MemoryManager(BaseMemoryProcessor):
         memories_to_remove = len(self.memory_items) - self.config.memory_budget
         
         for i in range(memories_to_remove):
-            memory_id, _ = sorted_memories[i]
+            memory_id, memory = sorted_memories[i]
             del self.memory_items[memory_id]
+            self.memory_stats.remove(memory)
         
-        self.logger.info(f"Removed {memories_to_remove} low-value memories to fit budget")
+        self.sampled_logger.info("Removed %d low-value memories to fit budget", memories_to_remove)
+    
+    def _on_config_change(self, key: str, value: Any):
+        """Update state derived from a changed config field"""
+        if key == "memory_budget":
+            self._trim_to_budget()
+        elif key == "log_sample_rate":
+            self.sampled_logger.sample_rate = value
+        elif key == "log_rate_limit":
+            self.sampled_logger.rate_limit = value
     
     def _calculate_relevance(self, memory_content: str, query: str) -> float:
         """Calculate relevance score between memory and query"""
@@ -300,6 +353,7 @@ class MemoryManager(BaseMemoryProcessor):
     def reset(self):
         """Reset memory manager state"""
         self.memory_items = {}
+        self.memory_stats.clear()
         self.consolidated_insights = {}
         self.consolidation_count = 0
         self.interaction_count = 0
@@ -0,0 +1,139 @@
+"""
+Memory Statistics - Incremental Memory Aggregates
+=================================================
+
+Running aggregates over stored memories, updated on every mutation so
+analytics can be read in constant time instead of scanning all memories.
+"""
+
+import math
+from collections import Counter
+from typing import Dict, Any, Iterable, Optional
+
+REASONING_VALUE_BINS = 10  # Equal-width bins over [0, 1]
+ACCESS_COUNT_BUCKETS = [(0, 0, "0"), (1, 1, "1"), (2, 5, "2-5"), (6, None, "6+")]
+
+class MemoryStatistics:
+    """Aggregates over memory items maintained incrementally"""
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        """Reset all aggregates"""
+        self.count = 0
+        self.reasoning_value_mean = 0.0
+        self._reasoning_value_m2 = 0.0  # Welford sum of squared deviations
+        self.content_length_sum = 0
+        self.high_value_count = 0  # reasoning value > 0.8
+        self.low_value_count = 0  # reasoning value < 0.3
+        self.total_accesses = 0
+        self.reasoning_value_histogram = [0] * REASONING_VALUE_BINS
+        self.access_counts: Counter = Counter()  # access count -> memories
+        self._reasoning_values: Counter = Counter()  # reasoning value -> memories
+        self._min_value: Optional[float] = None
+        self._max_value: Optional[float] = None
+        self._extremes_stale = False
+
+    def rebuild(self, memory_items: Iterable[Any]):
+        """Recompute aggregates from a full set of memories"""
+        self.clear()
+        for memory in memory_items:
+            self.add(memory)
+
+    def add(self, memory: Any):
+        """Account for a stored memory"""
+        value = memory.reasoning_value
+        self.count += 1
+        delta = value - self.reasoning_value_mean
+        self.reasoning_value_mean += delta / self.count
+        self._reasoning_value_m2 += delta * (value - self.reasoning_value_mean)
+        self.content_length_sum += len(memory.content)
+        self.high_value_count += value > 0.8
+        self.low_value_count += value < 0.3
+        self.total_accesses += memory.access_count
+        self.reasoning_value_histogram[self._value_bin(value)] += 1
+        self.access_counts[memory.access_count] += 1
+        self._reasoning_values[value] += 1
+
+        if not self._extremes_stale:
+            self._min_value = value if self._min_value is None else min(self._min_value, value)
+            self._max_value = value if self._max_value is None else max(self._max_value, value)
+
+    def remove(self, memory: Any):
+        """Account for a removed memory"""
+        value = memory.reasoning_value
+        self.count -= 1
+        if self.count:
+            previous_mean = self.reasoning_value_mean
+            self.reasoning_value_mean -= (value - previous_mean) / self.count
+            self._reasoning_value_m2 = max(
+                0.0, self._reasoning_value_m2 - (value - previous_mean) * (value - self.reasoning_value_mean)
+            )
+        else:
+            self.reasoning_value_mean = 0.0
+            self._reasoning_value_m2 = 0.0
+        self.content_length_sum -= len(memory.content)
+        self.high_value_count -= value > 0.8
+        self.low_value_count -= value < 0.3
+        self.total_accesses -= memory.access_count
+        self.reasoning_value_histogram[self._value_bin(value)] -= 1
+        self._decrement(self.access_counts, memory.access_count)
+        self._decrement(self._reasoning_values, value)
+
+        # Extremes are recomputed lazily only when one of them is removed
+        if value == self._min_value or value == self._max_value:
+            self._extremes_stale = True
+
+    def record_access(self, previous_count: int, new_count: int):
+        """Account for a change in a memory's access count"""
+        self.total_accesses += new_count - previous_count
+        self._decrement(self.access_counts, previous_count)
+        self.access_counts[new_count] += 1
+
+    def get_reasoning_value_stats(self) -> Dict[str, Any]:
+        """Get reasoning value summary statistics"""
+        if not self.count:
+            return {"average": 0.0, "min": 0.0, "max": 0.0, "std": 0.0}
+
+        self._refresh_extremes()
+        return {
+            "average": self.reasoning_value_mean,
+            "min": self._min_value,
+            "max": self._max_value,
+            "std": math.sqrt(self._reasoning_value_m2 / self.count)
+        }
+
+    def get_access_histogram(self) -> Dict[str, int]:
+        """Get memory counts per access count bucket"""
+        histogram = {label: 0 for _, _, label in ACCESS_COUNT_BUCKETS}
+        for access_count, memories in self.access_counts.items():
+            for low, high, label in ACCESS_COUNT_BUCKETS:
+                if access_count >= low and (high is None or access_count <= high):
+                    histogram[label] += memories
+                    break
+        return histogram
+
+    def count_accessed_over(self, threshold: int) -> int:
+        """Count memories accessed more than threshold times"""
+        return sum(
+            memories for access_count, memories in self.access_counts.items()
+            if access_count > threshold
+        )
+
+    def _value_bin(self, value: float) -> int:
+        """Get the histogram bin of a reasoning value"""
+        return min(REASONING_VALUE_BINS - 1, max(0, int(value * REASONING_VALUE_BINS)))
+
+    def _decrement(self, counter: Counter, key: Any):
+        """Decrement a counter entry, dropping it at zero"""
+        counter[key] -= 1
+        if counter[key] <= 0:
+            del counter[key]
+
+    def _refresh_extremes(self):
+        """Recompute min and max reasoning values after an extreme was removed"""
+        if self._extremes_stale:
+            self._min_value = min(self._reasoning_values) if self._reasoning_values else None
+            self._max_value = max(self._reasoning_values) if self._reasoning_values else None
+            self._extremes_stale = False
@@ -143,19 +143,22 @@ class AttractorManager:
         
         return intersection / union if union > 0 else 0.0
     
-    def get_attractors(self) -> Dict[str, Any]:
+    def get_attractors(self, include_patterns: bool = True) -> Dict[str, Any]:
         """Get all attractors with metadata"""
-        return {
-            attractor_id: {
-                "pattern": attractor.pattern,
+        now = time.time()
+        attractors = {}
+        for attractor_id, attractor in self.attractors.items():
+            attractor_data = {
                 "strength": attractor.strength,
                 "basin_width": attractor.basin_width,
                 "formation_time": attractor.formation_time,
                 "interaction_count": attractor.interaction_count,
-                "age": time.time() - attractor.formation_time
+                "age": now - attractor.formation_time
             }
-            for attractor_id, attractor in self.attractors.items()
-        }
+            if include_patterns:
+                attractor_data["pattern"] = attractor.pattern
+            attractors[attractor_id] = attractor_data
+        return attractors
     
     def get_interaction_graph(self) -> Dict[str, Dict[str, float]]:
         """Get attractor interaction graph"""
@@ -10,6 +10,7 @@ import asyncio
 import math
 from typing import Dict, List, Any, Optional
 from collections import defaultdict
+from itertools import islice
 
 class BaseField:
     """Base class for neural fields"""
@@ -90,6 +91,28 @@ class BaseField:
             "pattern_count": len(self.patterns)
         }
     
+    def get_summary(self) -> Dict[str, Any]:
+        """Get field state without pattern contents"""
+        return {
+            "type": self.field_type,
+            "total_energy": self.calculate_energy(),
+            "pattern_count": len(self.patterns)
+        }
+    
+    def get_patterns_page(self, offset: int = 0, limit: int = 50) -> Dict[str, Any]:
+        """Get a page of patterns with their energy levels"""
+        page = islice(self.patterns.items(), max(0, offset), max(0, offset) + max(0, limit))
+        return {
+            "type": self.field_type,
+            "pattern_count": len(self.patterns),
+            "offset": offset,
+            "limit": limit,
+            "patterns": {
+                pattern_id: {"pattern": pattern, "energy": self.energy_levels.get(pattern_id, 0.0)}
+                for pattern_id, pattern in page
+            }
+        }
+    
     def reset(self):
         """Reset field state"""
         self.patterns = {}
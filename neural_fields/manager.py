@@ -15,6 +15,7 @@ from ..core.base import BaseFieldProcessor, ProcessingResult
 from .field import SemanticField, CognitiveField
 from .attractors import AttractorManager
 from .resonance import ResonanceProcessor
+from ..utils.logger import SampledLogger
 
 @dataclass
 class FieldInjectionResult:
@@ -51,6 +52,12 @@ class NeuralFieldManager(BaseFieldProcessor):
     - Symbolic residue tracking and persistence
     """
     
+    LIVE_CONFIG_KEYS = frozenset({
+        "field_type", "decay_rate", "boundary_permeability", "resonance_bandwidth",
+        "attractor_formation_threshold", "max_attractors", "field_dimensions",
+        "log_sample_rate", "log_rate_limit"
+    })
+    
     def __init__(self, config):
         super().__init__(config)
         
@@ -60,7 +67,13 @@ class NeuralFieldManager(BaseFieldProcessor):
         self.attractor_manager = AttractorManager(config)
         self.resonance_processor = ResonanceProcessor(config)
         
+        # Initialize state
+        self._previous_energy = 0.0
+        
         self.logger = logging.getLogger("NeuralFieldManager")
+        self.sampled_logger = SampledLogger(
+            self.logger, config.log_sample_rate, config.log_rate_limit
+        )
         self.logger.info("Neural field dynamics initialized")
     
     async def process(self, content: str, context: Dict[str, Any]) -> ProcessingResult:
@@ -97,7 +110,7 @@ class NeuralFieldManager(BaseFieldProcessor):
     
     async def inject_pattern(self, pattern: str, strength: float = 1.0) -> FieldInjectionResult:
         """Inject a pattern into the neural field"""
-        self.logger.debug(f"Injecting pattern with strength {strength}")
+        self.sampled_logger.debug("Injecting pattern with strength %s", strength)
         
         # Apply boundary filtering
         effective_strength = strength * self.config.boundary_permeability
@@ -134,7 +147,7 @@ class NeuralFieldManager(BaseFieldProcessor):
         context: Dict[str, Any]
     ) -> FieldResonanceResult:
         """Measure resonance between content and field state"""
-        self.logger.debug("Measuring field resonance")
+        self.sampled_logger.debug("Measuring field resonance")
         
         # Calculate resonance with semantic field
         semantic_resonance = await self.semantic_field.measure_resonance(content)
@@ -169,7 +182,7 @@ class NeuralFieldManager(BaseFieldProcessor):
         context: Dict[str, Any]
     ) -> FieldUpdateResult:
         """Update field state with processing result"""
-        self.logger.debug("Updating field with result")
+        self.sampled_logger.debug("Updating field with result")
         
         # Inject result into field with reduced strength
         injection_result = await self.inject_pattern(result, strength=0.8)
@@ -205,10 +218,6 @@ class NeuralFieldManager(BaseFieldProcessor):
         # Update attractor strengths
         await self.attractor_manager.apply_attractor_decay(self.config.decay_rate * 0.2)
     
-    def inject_pattern(self, pattern: str, strength: float = 1.0):
-        """Synchronous version of inject_pattern"""
-        return asyncio.run(self.inject_pattern(pattern, strength))
-    
     def measure_resonance(self, content: str) -> float:
         """Simple resonance measurement for compatibility"""
         try:
@@ -227,11 +236,39 @@ class NeuralFieldManager(BaseFieldProcessor):
             "semantic_field": semantic_state,
             "cognitive_field": cognitive_state,
             "attractors": attractors,
-            "field_energy": semantic_state.get("energy", 0) + cognitive_state.get("energy", 0),
+            "field_energy": semantic_state["total_energy"] + cognitive_state["total_energy"],
+            "stability": self._calculate_stability(),
+            "resonance_bandwidth": self.config.resonance_bandwidth
+        }
+    
+    def get_field_summary(self) -> Dict[str, Any]:
+        """Get field state with counts and energies instead of pattern contents"""
+        semantic_summary = self.semantic_field.get_summary()
+        cognitive_summary = self.cognitive_field.get_summary()
+        
+        return {
+            "semantic_field": semantic_summary,
+            "cognitive_field": cognitive_summary,
+            "attractors": self.attractor_manager.get_attractors(include_patterns=False),
+            "field_energy": semantic_summary["total_energy"] + cognitive_summary["total_energy"],
             "stability": self._calculate_stability(),
             "resonance_bandwidth": self.config.resonance_bandwidth
         }
     
+    def get_field_patterns(self, field_type: str, offset: int = 0, limit: int = 50) -> Dict[str, Any]:
+        """Get a page of patterns from the semantic or cognitive field"""
+        fields = {"semantic": self.semantic_field, "cognitive": self.cognitive_field}
+        if field_type not in fields:
+            raise ValueError(f"Unknown field type: {field_type}")
+        return fields[field_type].get_patterns_page(offset, limit)
+    
+    def _on_config_change(self, key: str, value: Any):
+        """Update state derived from a changed config field"""
+        if key == "log_sample_rate":
+            self.sampled_logger.sample_rate = value
+        elif key == "log_rate_limit":
+            self.sampled_logger.rate_limit = value
+    
     def reset(self):
         """Reset neural field manager state"""
         self.semantic_field.reset()
@@ -281,18 +318,3 @@ Field recommendations: Continue with structured approach, leveraging existing co
             return 0.5
             
         return sum(attractor_strengths) / len(attractor_strengths)
-    
-    def __init__(self, config):
-        super().__init__(config)
-        
-        # Initialize field components
-        self.semantic_field = SemanticField(config)
-        self.cognitive_field = CognitiveField(config)
-        self.attractor_manager = AttractorManager(config)
-        self.resonance_processor = ResonanceProcessor(config)
-        
-        # Initialize state
-        self._previous_energy = 0.0
-        
-        self.logger = logging.getLogger("NeuralFieldManager")
-        self.logger.info("Neural field dynamics initialized")
\ No newline at end of file
@@ -9,11 +9,12 @@ cognitive architecture scaling from atoms to neural fields.
 from .manager import ComplexityManager
 from .scaling import ComplexityScaler
 from .assessment import ComplexityAssessment
-from .optimization import ComplexityOptimizer
+from .optimization import ComplexityOptimizer, ExecutionPlan
 
 __all__ = [
     'ComplexityManager',
     'ComplexityScaler',
     'ComplexityAssessment', 
-    'ComplexityOptimizer'
+    'ComplexityOptimizer',
+    'ExecutionPlan'
 ]
\ No newline at end of file
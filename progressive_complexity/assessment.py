@@ -7,8 +7,12 @@ for efficient cognitive resource allocation.
 """
 
 import asyncio
-from typing import Dict, List, Any, Optional, TYPE_CHECKING
-from dataclasses import dataclass
+from collections import Counter
+from typing import Dict, List, Any, Optional, Set, TYPE_CHECKING
+from dataclasses import dataclass, replace
+
+from ..core.features import ContextFeatures
+from ..utils.cache import LRUCache, content_digest
 
 if TYPE_CHECKING:
     from .manager import ComplexityRecommendation
@@ -24,23 +28,236 @@ class ComplexityFactors:
     abstraction_requirement: float
     integration_demand: float
 
+# Indicator phrases matched as substrings of the lowercased content
+ABSTRACT_INDICATORS = [
+    'concept', 'theory', 'principle', 'philosophy', 'methodology',
+    'framework', 'paradigm', 'perspective', 'interpretation', 'analysis'
+]
+REASONING_INDICATORS = [
+    'because', 'therefore', 'thus', 'consequently', 'implies',
+    'suggests', 'indicates', 'demonstrates', 'proves', 'shows'
+]
+META_INDICATORS = [
+    'thinking', 'understanding', 'reasoning', 'cognition', 'awareness',
+    'consciousness', 'reflection', 'introspection', 'analysis'
+]
+ABSTRACTION_KEYWORDS = [
+    'abstract', 'general', 'universal', 'pattern', 'model', 'framework',
+    'structure', 'relationship', 'system', 'process', 'mechanism',
+    'principle', 'rule', 'law', 'theory', 'hypothesis'
+]
+ABSTRACT_QUESTIONS = [
+    'why', 'how', 'what if', 'suppose', 'imagine', 'consider',
+    'analyze', 'evaluate', 'synthesize', 'generalize'
+]
+INTEGRATION_INDICATORS = [
+    'combine', 'integrate', 'synthesize', 'merge', 'unify', 'connect',
+    'relate', 'compare', 'contrast', 'balance', 'coordinate', 'align'
+]
+SOURCE_INDICATORS = [
+    'according to', 'based on', 'from', 'considering', 'given',
+    'taking into account', 'in light of', 'perspective', 'viewpoint'
+]
+
+_ALL_INDICATORS = frozenset(
+    ABSTRACT_INDICATORS + REASONING_INDICATORS + META_INDICATORS + ABSTRACTION_KEYWORDS
+    + ABSTRACT_QUESTIONS + INTEGRATION_INDICATORS + SOURCE_INDICATORS
+)
+_INDICATOR_OVERLAP = max(len(indicator) for indicator in _ALL_INDICATORS) - 1
+
+def _is_technical_term(word: str) -> bool:
+    """Check if a word is a technical term"""
+    # Simplified technical term detection
+    technical_suffixes = (
+        'tion', 'sion', 'ment', 'ness', 'ity', 'ism', 'ology', 'ics', 'ing'
+    )
+    
+    return (len(word) > 8 or 
+            word.endswith(technical_suffixes) or
+            word.isupper())
+
+class ComplexityFeatureExtractor:
+    """
+    Single-pass extractor for complexity factors.
+    
+    Text is fed in chunks; every statistic is updated incrementally so
+    factors can be read for a partially received input at any time.
+    """
+    
+    def __init__(self):
+        self.char_count = 0
+        self.word_counts: Counter = Counter()  # Lowercased word -> occurrences
+        self.period_count = 0
+        self.punctuation_count = 0
+        self.nesting_count = 0
+        self.found_indicators: Set[str] = set()
+        self._pending_word = ""  # Trailing raw word that may continue in the next chunk
+        self._tail = ""  # Lowercased text an indicator could still span into
+    
+    def feed(self, chunk: str):
+        """Update statistics with the next chunk of text"""
+        if not chunk:
+            return
+        
+        self.char_count += len(chunk)
+        self.period_count += chunk.count('.')
+        self.punctuation_count += chunk.count(',') + chunk.count(';') + chunk.count(':')
+        self.nesting_count += chunk.count('(') + chunk.count('[') + chunk.count('{')
+        
+        # Indicators may straddle chunk boundaries, so search with the previous tail;
+        # each indicator is searched for only until it is first found
+        scanned = self._tail + chunk.lower()
+        self.found_indicators.update(
+            indicator for indicator in _ALL_INDICATORS - self.found_indicators
+            if indicator in scanned
+        )
+        self._tail = scanned[-_INDICATOR_OVERLAP:]
+        
+        # Hold back a trailing partial word; complete words are lowercased
+        # together so chunking cannot change how they are cased
+        text = self._pending_word + chunk
+        if chunk[-1].isspace():
+            complete_text, self._pending_word = text, ""
+        else:
+            parts = text.rsplit(None, 1)
+            complete_text, self._pending_word = parts if len(parts) == 2 else ("", parts[0])
+        self.word_counts.update(complete_text.lower().split())
+    
+    def finish(self):
+        """Mark the input as complete"""
+        if self._pending_word:
+            self.word_counts[self._pending_word.lower()] += 1
+            self._pending_word = ""
+    
+    def _count_found(self, indicators: List[str]) -> int:
+        """Count indicators found so far"""
+        return sum(1 for indicator in indicators if indicator in self.found_indicators)
+    
+    def get_factors(self, context_features: ContextFeatures) -> ComplexityFactors:
+        """Get complexity factors for the text received so far"""
+        # A pending word counts as complete for a snapshot
+        word_counts = self.word_counts
+        if self._pending_word:
+            word_counts = word_counts.copy()
+            word_counts[self._pending_word.lower()] += 1
+        
+        # Word checks run once per distinct word, weighted by occurrences
+        word_count = sum(word_counts.values())
+        long_words = sum(count for word, count in word_counts.items() if len(word) > 6)
+        technical_terms = sum(count for word, count in word_counts.items() if _is_technical_term(word))
+        unique_words = len(word_counts)
+        
+        # Content length factor
+        content_length = min(1.0, self.char_count / 1000)  # Normalize to 1000 chars
+        
+        # Vocabulary complexity
+        vocabulary_complexity = 0.0
+        if word_count:
+            vocabulary_complexity = min(1.0, (
+                (long_words / word_count) * 0.4 +
+                (technical_terms / word_count) * 0.4 +
+                (unique_words / word_count) * 0.2
+            ))
+        
+        # Syntactic complexity
+        sentence_count = self.period_count + 1
+        avg_sentence_length = word_count / sentence_count
+        syntactic_complexity = (
+            min(1.0, avg_sentence_length / 20) * 0.5 +  # Normalize to 20 words
+            min(1.0, self.punctuation_count / sentence_count / 3) * 0.3 +
+            min(1.0, self.nesting_count / sentence_count) * 0.2
+        )
+        
+        # Contextual richness
+        contextual_richness = 0.0
+        if context_features.size:
+            contextual_richness = (
+                min(1.0, context_features.size / 10) * 0.4 +  # Normalize to 10 context items
+                (context_features.nested_count / context_features.size) * 0.3 +
+                min(1.0, context_features.total_elements / 20) * 0.3  # Normalize to 20 total elements
+            )
+        
+        # Context integration demand
+        context_integration = context_features.size / 5  # Normalize to 5 context items
+        
+        if not word_count:
+            semantic_depth = 0.0
+            abstraction_requirement = 0.0
+            integration_demand = min(1.0, context_integration)
+        else:
+            # Semantic depth from abstract, reasoning and meta-cognitive indicators
+            semantic_count = (
+                self._count_found(ABSTRACT_INDICATORS) +
+                self._count_found(REASONING_INDICATORS) +
+                self._count_found(META_INDICATORS)
+            )
+            semantic_depth = min(1.0, semantic_count / word_count * 100 * 0.5)
+            
+            # Abstraction requirement
+            abstraction_count = self._count_found(ABSTRACTION_KEYWORDS) + self._count_found(ABSTRACT_QUESTIONS)
+            abstraction_requirement = min(1.0, abstraction_count / word_count * 50)
+            
+            # Integration demand
+            integration_count = self._count_found(INTEGRATION_INDICATORS) + self._count_found(SOURCE_INDICATORS)
+            integration_demand = min(1.0, integration_count / word_count * 50 + context_integration * 0.3)
+        
+        return ComplexityFactors(
+            content_length=content_length,
+            vocabulary_complexity=vocabulary_complexity,
+            syntactic_complexity=syntactic_complexity,
+            semantic_depth=semantic_depth,
+            contextual_richness=contextual_richness,
+            abstraction_requirement=abstraction_requirement,
+            integration_demand=integration_demand
+        )
+
 class ComplexityAssessment:
     """Assesses optimal complexity levels for tasks"""
     
     def __init__(self, config):
         self.config = config
-        self.assessment_cache = {}
+        self.assessment_cache = LRUCache(config.assessment_cache_size)
         
     async def assess_optimal_complexity(
         self, 
         content: str, 
-        context: Dict[str, Any]
+        context: Dict[str, Any],
+        context_features: Optional[ContextFeatures] = None
     ) -> 'ComplexityRecommendation':
         """Assess optimal complexity level for given task"""
+        context_features = ContextFeatures.resolve(context, context_features)
         
-        # Analyze complexity factors
-        complexity_factors = await self._analyze_complexity_factors(content, context)
-        
+        # Recommendations depend on the content and the context statistics only
+        cache_key = content_digest(
+            content, context_features.size, context_features.nested_count, context_features.total_elements
+        )
+        cached_recommendation = self.assessment_cache.get(cache_key)
+        if cached_recommendation is None:
+            complexity_factors = await self._analyze_complexity_factors(content, context_features)
+            cached_recommendation = self._build_recommendation(complexity_factors)
+            self.assessment_cache.put(cache_key, cached_recommendation)
+        
+        return replace(
+            cached_recommendation,
+            resource_requirements=dict(cached_recommendation.resource_requirements)
+        )
+    
+    def create_extractor(self) -> ComplexityFeatureExtractor:
+        """Create an extractor for incrementally received content"""
+        return ComplexityFeatureExtractor()
+    
+    async def assess_partial_complexity(
+        self,
+        extractor: ComplexityFeatureExtractor,
+        context: Dict[str, Any],
+        context_features: Optional[ContextFeatures] = None
+    ) -> 'ComplexityRecommendation':
+        """Assess complexity from the content an extractor has received so far"""
+        context_features = ContextFeatures.resolve(context, context_features)
+        return self._build_recommendation(extractor.get_factors(context_features))
+    
+    def _build_recommendation(self, complexity_factors: ComplexityFactors) -> 'ComplexityRecommendation':
+        """Build a recommendation from complexity factors"""
         # Calculate overall complexity score
         complexity_score = self._calculate_complexity_score(complexity_factors)
         
@@ -73,231 +290,13 @@ class ComplexityAssessment:
     async def _analyze_complexity_factors(
         self, 
         content: str, 
-        context: Dict[str, Any]
+        context_features: ContextFeatures
     ) -> ComplexityFactors:
         """Analyze various factors contributing to task complexity"""
-        
-        # Content length factor
-        content_length = min(1.0, len(content) / 1000)  # Normalize to 1000 chars
-        
-        # Vocabulary complexity
-        vocabulary_complexity = await self._assess_vocabulary_complexity(content)
-        
-        # Syntactic complexity
-        syntactic_complexity = await self._assess_syntactic_complexity(content)
-        
-        # Semantic depth
-        semantic_depth = await self._assess_semantic_depth(content, context)
-        
-        # Contextual richness
-        contextual_richness = await self._assess_contextual_richness(context)
-        
-        # Abstraction requirement
-        abstraction_requirement = await self._assess_abstraction_requirement(content)
-        
-        # Integration demand
-        integration_demand = await self._assess_integration_demand(content, context)
-        
-        return ComplexityFactors(
-            content_length=content_length,
-            vocabulary_complexity=vocabulary_complexity,
-            syntactic_complexity=syntactic_complexity,
-            semantic_depth=semantic_depth,
-            contextual_richness=contextual_richness,
-            abstraction_requirement=abstraction_requirement,
-            integration_demand=integration_demand
-        )
-    
-    async def _assess_vocabulary_complexity(self, content: str) -> float:
-        """Assess vocabulary complexity of content"""
-        words = content.lower().split()
-        
-        if not words:
-            return 0.0
-        
-        # Factors indicating vocabulary complexity
-        long_words = sum(1 for word in words if len(word) > 6)
-        technical_terms = sum(1 for word in words if self._is_technical_term(word))
-        unique_words = len(set(words))
-        
-        # Calculate complexity score
-        long_word_ratio = long_words / len(words)
-        technical_ratio = technical_terms / len(words)
-        vocabulary_diversity = unique_words / len(words)
-        
-        complexity = (long_word_ratio * 0.4) + (technical_ratio * 0.4) + (vocabulary_diversity * 0.2)
-        
-        return min(1.0, complexity)
-    
-    async def _assess_syntactic_complexity(self, content: str) -> float:
-        """Assess syntactic complexity of content"""
-        
-        # Simple heuristics for syntactic complexity
-        sentences = content.split('.')
-        
-        if not sentences:
-            return 0.0
-        
-        # Average sentence length
-        avg_sentence_length = len(content.split()) / len(sentences)
-        sentence_length_complexity = min(1.0, avg_sentence_length / 20)  # Normalize to 20 words
-        
-        # Punctuation complexity (indicates complex structures)
-        complex_punctuation = content.count(',') + content.count(';') + content.count(':')
-        punctuation_complexity = min(1.0, complex_punctuation / len(sentences) / 3)
-        
-        # Nested structure indicators
-        nesting_indicators = content.count('(') + content.count('[') + content.count('{')
-        nesting_complexity = min(1.0, nesting_indicators / len(sentences))
-        
-        syntactic_complexity = (
-            sentence_length_complexity * 0.5 +
-            punctuation_complexity * 0.3 +
-            nesting_complexity * 0.2
-        )
-        
-        return syntactic_complexity
-    
-    async def _assess_semantic_depth(self, content: str, context: Dict[str, Any]) -> float:
-        """Assess semantic depth and meaning complexity"""
-        
-        # Abstract concept indicators
-        abstract_indicators = [
-            'concept', 'theory', 'principle', 'philosophy', 'methodology',
-            'framework', 'paradigm', 'perspective', 'interpretation', 'analysis'
-        ]
-        
-        content_lower = content.lower()
-        abstract_count = sum(1 for indicator in abstract_indicators if indicator in content_lower)
-        
-        # Reasoning indicators
-        reasoning_indicators = [
-            'because', 'therefore', 'thus', 'consequently', 'implies',
-            'suggests', 'indicates', 'demonstrates', 'proves', 'shows'
-        ]
-        
-        reasoning_count = sum(1 for indicator in reasoning_indicators if indicator in content_lower)
-        
-        # Meta-cognitive indicators
-        meta_indicators = [
-            'thinking', 'understanding', 'reasoning', 'cognition', 'awareness',
-            'consciousness', 'reflection', 'introspection', 'analysis'
-        ]
-        
-        meta_count = sum(1 for indicator in meta_indicators if indicator in content_lower)
-        
-        # Calculate semantic depth
-        word_count = len(content.split())
-        if word_count == 0:
-            return 0.0
-        
-        abstract_ratio = abstract_count / word_count * 100  # Scale up
-        reasoning_ratio = reasoning_count / word_count * 100
-        meta_ratio = meta_count / word_count * 100
-        
-        semantic_depth = min(1.0, (abstract_ratio + reasoning_ratio + meta_ratio) * 0.5)
-        
-        return semantic_depth
-    
-    async def _assess_contextual_richness(self, context: Dict[str, Any]) -> float:
-        """Assess richness and complexity of context"""
-        
-        if not context:
-            return 0.0
-        
-        # Context size factor
-        context_size = len(context)
-        size_factor = min(1.0, context_size / 10)  # Normalize to 10 context items
-        
-        # Context depth factor (nested structures)
-        depth_count = 0
-        total_elements = 0
-        
-        for key, value in context.items():
-            total_elements += 1
-            if isinstance(value, dict):
-                depth_count += 1
-                total_elements += len(value)
-            elif isinstance(value, list):
-                depth_count += 1
-                total_elements += len(value)
-        
-        depth_factor = depth_count / len(context) if context else 0.0
-        richness_factor = min(1.0, total_elements / 20)  # Normalize to 20 total elements
-        
-        contextual_richness = (size_factor * 0.4) + (depth_factor * 0.3) + (richness_factor * 0.3)
-        
-        return contextual_richness
-    
-    async def _assess_abstraction_requirement(self, content: str) -> float:
-        """Assess requirement for abstract reasoning"""
-        
-        abstraction_keywords = [
-            'abstract', 'general', 'universal', 'pattern', 'model', 'framework',
-            'structure', 'relationship', 'system', 'process', 'mechanism',
-            'principle', 'rule', 'law', 'theory', 'hypothesis'
-        ]
-        
-        content_lower = content.lower()
-        abstraction_count = sum(1 for keyword in abstraction_keywords if keyword in content_lower)
-        
-        # Question words indicating abstraction needs
-        abstract_questions = [
-            'why', 'how', 'what if', 'suppose', 'imagine', 'consider',
-            'analyze', 'evaluate', 'synthesize', 'generalize'
-        ]
-        
-        question_count = sum(1 for question in abstract_questions if question in content_lower)
-        
-        word_count = len(content.split())
-        if word_count == 0:
-            return 0.0
-        
-        abstraction_ratio = (abstraction_count + question_count) / word_count * 50  # Scale up
-        
-        return min(1.0, abstraction_ratio)
-    
-    async def _assess_integration_demand(self, content: str, context: Dict[str, Any]) -> float:
-        """Assess demand for integrating multiple sources/perspectives"""
-        
-        integration_indicators = [
-            'combine', 'integrate', 'synthesize', 'merge', 'unify', 'connect',
-            'relate', 'compare', 'contrast', 'balance', 'coordinate', 'align'
-        ]
-        
-        content_lower = content.lower()
-        integration_count = sum(1 for indicator in integration_indicators if indicator in content_lower)
-        
-        # Multiple source indicators
-        source_indicators = [
-            'according to', 'based on', 'from', 'considering', 'given',
-            'taking into account', 'in light of', 'perspective', 'viewpoint'
-        ]
-        
-        source_count = sum(1 for indicator in source_indicators if indicator in content_lower)
-        
-        # Context integration demand
-        context_integration = len(context) / 5 if context else 0.0  # Normalize to 5 context items
-        
-        word_count = len(content.split())
-        if word_count == 0:
-            return min(1.0, context_integration)
-        
-        integration_ratio = (integration_count + source_count) / word_count * 50  # Scale up
-        total_integration = min(1.0, integration_ratio + context_integration * 0.3)
-        
-        return total_integration
-    
-    def _is_technical_term(self, word: str) -> bool:
-        """Check if a word is a technical term"""
-        # Simplified technical term detection
-        technical_suffixes = [
-            'tion', 'sion', 'ment', 'ness', 'ity', 'ism', 'ology', 'ics', 'ing'
-        ]
-        
-        return (len(word) > 8 or 
-                any(word.endswith(suffix) for suffix in technical_suffixes) or
-                word.isupper())
+        extractor = self.create_extractor()
+        extractor.feed(content)
+        extractor.finish()
+        return extractor.get_factors(context_features)
     
     def _calculate_complexity_score(self, factors: ComplexityFactors) -> float:
         """Calculate overall complexity score from factors"""
@@ -428,4 +427,4 @@ class ComplexityAssessment:
     
     def reset(self):
         """Reset complexity assessment state"""
-        self.assessment_cache = {}
\ No newline at end of file
+        self.assessment_cache.clear()
\ No newline at end of file
@@ -12,9 +12,10 @@ from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
 
 from ..core.base import BaseContextProcessor, ProcessingResult
+from ..core.features import ContextFeatures
 from .scaling import ComplexityScaler
 from .assessment import ComplexityAssessment
-from .optimization import ComplexityOptimizer
+from .optimization import ComplexityOptimizer, ExecutionPlan
 
 @dataclass
 class ComplexityLevel:
@@ -46,6 +47,12 @@ class ComplexityManager(BaseContextProcessor):
     6. Neural Field: Emergent field-level cognition
     """
     
+    LIVE_CONFIG_KEYS = frozenset({
+        "auto_scaling", "performance_threshold", "complexity_levels", "scaling_strategy",
+        "efficiency_monitoring", "assessment_cache_size", "adaptive_routing",
+        "routing_exploration", "routing_latency_weight", "routing_coverage_weight", "phase_plans"
+    })
+    
     def __init__(self, config):
         super().__init__(config)
         
@@ -152,12 +159,35 @@ class ComplexityManager(BaseContextProcessor):
     async def assess_complexity(
         self, 
         content: str, 
-        context: Dict[str, Any]
+        context: Dict[str, Any],
+        context_features: Optional[ContextFeatures] = None
     ) -> ComplexityRecommendation:
         """Assess optimal complexity level for given content and context"""
         self.logger.debug("Assessing complexity requirements")
         
-        return await self.assessor.assess_optimal_complexity(content, context)
+        return await self.assessor.assess_optimal_complexity(content, context, context_features)
+    
+    def plan_execution(self, assessed_complexity: str, adaptive: bool = True) -> ExecutionPlan:
+        """Plan the complexity level and phases to execute for a request"""
+        return self.optimizer.plan_execution(assessed_complexity, adaptive)
+    
+    def record_execution(self, plan: ExecutionPlan, confidence: float, processing_time: float):
+        """Record the outcome of an executed plan for routing optimization"""
+        all_phases = max(len(phases) for phases in self.config.phase_plans.values()) or 1
+        resource_utilization = max(0.1, len(plan.phases) / all_phases)
+        performance_record = {
+            "timestamp": asyncio.get_event_loop().time(),
+            "assessed_complexity": plan.assessed_complexity,
+            "actual_complexity": plan.complexity,
+            "confidence_achieved": confidence,
+            "resource_utilization": resource_utilization,
+            "processing_time": processing_time,
+            "efficiency": confidence / resource_utilization,
+            "phases": plan.phases
+        }
+        
+        self._append_performance_record(performance_record)
+        self.optimizer.record_routing_outcome(performance_record)
     
     async def scale_complexity(self, target_complexity: str):
         """Scale to target complexity level"""
@@ -348,6 +378,10 @@ class ComplexityManager(BaseContextProcessor):
             "efficiency": complexity_result["confidence"] / max(0.1, complexity_result["resource_utilization"])
         }
         
+        self._append_performance_record(performance_record)
+    
+    def _append_performance_record(self, performance_record: Dict[str, Any]):
+        """Append a performance record, keeping only recent history"""
         self.performance_history.append(performance_record)
         
         # Keep only recent performance history
@@ -370,7 +404,8 @@ class ComplexityManager(BaseContextProcessor):
             "level_config": current_level.__dict__,
             "performance_history_length": len(self.performance_history),
             "recent_efficiency": self._calculate_recent_efficiency(),
-            "complexity_utilization": self._calculate_complexity_utilization()
+            "complexity_utilization": self._calculate_complexity_utilization(),
+            "routing_table": self.optimizer.get_routing_table()
         }
     
     def _calculate_recent_efficiency(self) -> float:
@@ -393,6 +428,11 @@ class ComplexityManager(BaseContextProcessor):
         
         return sum(resource_utilizations) / len(resource_utilizations)
     
+    def _on_config_change(self, key: str, value: Any):
+        """Update state derived from a changed config field"""
+        if key == "assessment_cache_size":
+            self.assessor.assessment_cache.resize(value)
+    
     def reset(self):
         """Reset complexity manager state"""
         self.current_complexity = "neural_system"  # Reset to default
@@ -3,11 +3,25 @@ Complexity Optimizer - Performance-Based Optimization
 =====================================================
 
 Optimizes complexity scaling strategies based on performance
-history and efficiency metrics.
+history and efficiency metrics, and learns online which complexity level
+to execute for each assessed level.
 """
 
 import asyncio
-from typing import Dict, List, Any, Optional
+import random
+from typing import Dict, List, Any, Optional, Tuple
+from dataclasses import dataclass, field
+
+@dataclass
+class ExecutionPlan:
+    """Complexity level and optional phases to execute for a request"""
+    assessed_complexity: str
+    complexity: str
+    phases: List[str] = field(default_factory=list)
+    
+    def includes(self, phase: str) -> bool:
+        """Check whether a phase is part of the plan"""
+        return phase in self.phases
 
 class ComplexityOptimizer:
     """Optimizes complexity strategies based on performance data"""
@@ -15,6 +29,89 @@ class ComplexityOptimizer:
     def __init__(self, config):
         self.config = config
         self.optimization_history = []
+        self.routing_stats: Dict[Tuple[str, str], List[float]] = {}  # (assessed, executed) -> [count, reward sum]
+        self.latency_baselines: Dict[str, List[float]] = {}  # assessed level run as assessed -> [count, time sum]
+        self._rng = random.Random(0)
+    
+    def plan_execution(self, assessed_complexity: str, adaptive: bool = True) -> ExecutionPlan:
+        """Choose the complexity level and phases to execute for an assessed level"""
+        complexity = assessed_complexity
+        if adaptive and self.config.adaptive_routing and assessed_complexity in self.config.complexity_levels:
+            complexity = self._select_execution_level(assessed_complexity)
+        
+        return ExecutionPlan(
+            assessed_complexity=assessed_complexity,
+            complexity=complexity,
+            phases=list(self.config.phase_plans.get(complexity, []))
+        )
+    
+    def _select_execution_level(self, assessed_complexity: str) -> str:
+        """Epsilon-greedy choice among the assessed level and its neighbours"""
+        levels = self.config.complexity_levels
+        index = levels.index(assessed_complexity)
+        candidates = levels[max(0, index - 1):index + 2]
+        
+        if self._rng.random() < self.config.routing_exploration:
+            return self._rng.choice(candidates)
+        
+        # Untried neighbours are only reached through exploration
+        best_level, best_reward = assessed_complexity, None
+        for level in candidates:
+            count, reward_sum = self.routing_stats.get((assessed_complexity, level), (0, 0.0))
+            if count and (best_reward is None or reward_sum / count > best_reward):
+                best_level, best_reward = level, reward_sum / count
+        return best_level
+    
+    def record_routing_outcome(self, performance_record: Dict[str, Any]):
+        """
+        Update routing statistics with the outcome of an executed plan.
+        
+        Self-reported confidence alone barely differs between levels, so the
+        reward also charges for skipping phases the assessed level would run
+        and for latency relative to running the assessed level itself.
+        """
+        assessed = performance_record["assessed_complexity"]
+        executed = performance_record["actual_complexity"]
+        processing_time = performance_record["processing_time"]
+        
+        if executed == assessed:
+            baseline = self.latency_baselines.setdefault(assessed, [0, 0.0])
+            baseline[0] += 1
+            baseline[1] += processing_time
+        
+        reward = (
+            performance_record["confidence_achieved"]
+            - self.config.routing_coverage_weight * self._skipped_phase_fraction(assessed, executed)
+            - self.config.routing_latency_weight * self._relative_latency(assessed, processing_time)
+        )
+        stats = self.routing_stats.setdefault((assessed, executed), [0, 0.0])
+        stats[0] += 1
+        stats[1] += reward
+    
+    def _skipped_phase_fraction(self, assessed: str, executed: str) -> float:
+        """Fraction of the assessed level's phases the executed plan skips"""
+        assessed_phases = self.config.phase_plans.get(assessed, [])
+        if not assessed_phases:
+            return 0.0
+        executed_phases = set(self.config.phase_plans.get(executed, []))
+        return sum(1 for phase in assessed_phases if phase not in executed_phases) / len(assessed_phases)
+    
+    def _relative_latency(self, assessed: str, processing_time: float) -> float:
+        """Processing time as a multiple of the assessed level's mean latency"""
+        count, time_sum = self.latency_baselines.get(assessed, (0, 0.0))
+        if not count or time_sum <= 0:
+            return 1.0  # No baseline yet: charge every level the same
+        return processing_time / (time_sum / count)
+    
+    def get_routing_table(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """Get mean reward and sample count per assessed and executed level"""
+        table: Dict[str, Dict[str, Dict[str, float]]] = {}
+        for (assessed, executed), (count, reward_sum) in self.routing_stats.items():
+            table.setdefault(assessed, {})[executed] = {
+                "count": count,
+                "mean_reward": reward_sum / count
+            }
+        return table
         
     async def optimize_strategy(self, performance_history: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Optimize complexity strategy based on performance history"""
@@ -369,4 +466,7 @@ class ComplexityOptimizer:
     
     def reset(self):
         """Reset complexity optimizer state"""
-        self.optimization_history = []
\ No newline at end of file
+        self.optimization_history = []
+        self.routing_stats = {}
+        self.latency_baselines = {}
+        self._rng = random.Random(0)
\ No newline at end of file
@@ -8,10 +8,14 @@ until observed/measured, based on Indiana University research on quantum semanti
 
 import asyncio
 import logging
+from collections import deque
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
 
+import numpy as np
+
 from ..core.base import BaseContextProcessor, ProcessingResult
+from ..core.features import ContextFeatures
 from .observer import ObserverManager
 from .superposition import SuperpositionProcessor
 from .measurement import MeasurementEngine
@@ -44,6 +48,12 @@ class QuantumSemanticProcessor(BaseContextProcessor):
     - Uncertainty Principle: Precision and scope are complementary
     """
     
+    LIVE_CONFIG_KEYS = frozenset({
+        "observer_contexts", "uncertainty_handling", "superposition_threshold",
+        "measurement_strategy", "degeneracy_management", "semantic_perspectives",
+        "superposition_cache_size", "measurement_seed", "measurement_history_size"
+    })
+    
     def __init__(self, config):
         super().__init__(config)
         
@@ -84,7 +94,8 @@ class QuantumSemanticProcessor(BaseContextProcessor):
     async def interpret_with_context(
         self, 
         content: str, 
-        context: Dict[str, Any]
+        context: Dict[str, Any],
+        context_features: Optional[ContextFeatures] = None
     ) -> QuantumSemanticResult:
         """Interpret content using quantum semantic principles"""
         self.logger.debug("Starting quantum semantic interpretation")
@@ -99,7 +110,7 @@ class QuantumSemanticProcessor(BaseContextProcessor):
         
         # Phase 3: Measure/collapse semantic meaning
         measurement_result = await self.measurement_engine.measure_semantic_state(
-            observed_superposition, context
+            observed_superposition, context, context_features
         )
         
         # Calculate overall uncertainty and observer influence
@@ -123,24 +134,22 @@ class QuantumSemanticProcessor(BaseContextProcessor):
             return 1.0
         
         # Shannon entropy-based uncertainty
-        import math
-        
-        probabilities = [interp.probability for interp in interpretations if interp.probability > 0]
-        if not probabilities:
+        probabilities = np.fromiter(
+            (interp.probability for interp in interpretations), dtype=float, count=len(interpretations)
+        )
+        probabilities = probabilities[probabilities > 0]
+        if not probabilities.size:
             return 1.0
         
-        # Normalize probabilities
-        total_prob = sum(probabilities)
-        normalized_probs = [p / total_prob for p in probabilities]
-        
-        # Calculate entropy
-        entropy = -sum(p * math.log2(p) for p in normalized_probs if p > 0)
-        max_entropy = math.log2(len(normalized_probs))
+        # Normalize probabilities and calculate entropy
+        normalized_probs = probabilities / probabilities.sum()
+        entropy = -(normalized_probs * np.log2(normalized_probs)).sum()
+        max_entropy = np.log2(len(normalized_probs))
         
         # Normalize to 0-1 scale
         uncertainty = entropy / max_entropy if max_entropy > 0 else 0.0
         
-        return uncertainty
+        return float(uncertainty)
     
     def _calculate_observer_influence(
         self, 
@@ -160,6 +169,19 @@ class QuantumSemanticProcessor(BaseContextProcessor):
         
         return max(0.0, state_reduction)
     
+    def _on_config_change(self, key: str, value: Any):
+        """Update state derived from a changed config field"""
+        if key == "observer_contexts":
+            self.observer_manager.reset()  # Rebuild observers from the new contexts
+        elif key in ("semantic_perspectives", "superposition_threshold"):
+            self.superposition_processor.superposition_cache.clear()
+        elif key == "superposition_cache_size":
+            self.superposition_processor.superposition_cache.resize(value)
+        elif key == "measurement_history_size":
+            self.measurement_engine.measurement_history = deque(
+                self.measurement_engine.measurement_history, maxlen=value
+            )
+    
     def reset(self):
         """Reset quantum semantic processor state"""
         self.observer_manager.reset()
@@ -3,14 +3,21 @@ Measurement Engine - Quantum Semantic Measurement
 =================================================
 
 Handles measurement/collapse of semantic superposition states
-into concrete meanings based on context and observation.
+into concrete meanings based on context and observation. Random collapse
+draws from a per-request stream seeded by a digest of the request, so
+identical requests collapse identically across workers.
 """
 
 import asyncio
-import random
+from collections import deque
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
 
+import numpy as np
+
+from ..core.features import ContextFeatures
+from ..utils.cache import content_digest
+
 @dataclass
 class MeasurementResult:
     """Result from quantum semantic measurement"""
@@ -22,45 +29,137 @@ class MeasurementResult:
 class MeasurementEngine:
     """Handles quantum measurement of semantic states"""
     
+    # Bases that collapse deterministically; all others collapse at random
+    DETERMINISTIC_BASES = {
+        "max_probability_basis",
+        "coherence_basis",
+        "complex_context_measurement",
+        "specific_context_measurement"
+    }
+    
     def __init__(self, config):
         self.config = config
-        self.measurement_history = []
+        self.measurement_history = deque(maxlen=config.measurement_history_size)
         
     async def measure_semantic_state(
         self, 
         superposition: Dict[str, Any], 
-        context: Dict[str, Any]
+        context: Dict[str, Any],
+        context_features: Optional[ContextFeatures] = None
     ) -> MeasurementResult:
         """Measure/collapse semantic superposition into concrete meaning"""
-        
-        # Determine measurement basis
-        measurement_basis = await self._determine_measurement_basis(superposition, context)
-        
-        # Perform quantum measurement
-        measurement_result = await self._perform_measurement(
-            superposition, measurement_basis, context
+        results = await self.measure_batch([superposition], [context], [context_features])
+        return results[0]
+    
+    async def measure_batch(
+        self,
+        superpositions: List[Dict[str, Any]],
+        contexts: List[Dict[str, Any]],
+        context_features: Optional[List[Optional[ContextFeatures]]] = None
+    ) -> List[MeasurementResult]:
+        """Measure many superpositions, sampling all random collapses together"""
+        if context_features is None:
+            context_features = [None] * len(superpositions)
+        resolved_features = [
+            ContextFeatures.resolve(context, features)
+            for context, features in zip(contexts, context_features)
+        ]
+        
+        # Determine measurement bases and request digests
+        measurement_bases = [
+            await self._determine_measurement_basis(superposition, features)
+            for superposition, features in zip(superpositions, resolved_features)
+        ]
+        request_digests = [
+            self._request_digest(superposition, measurement_basis)
+            for superposition, measurement_basis in zip(superpositions, measurement_bases)
+        ]
+        
+        # Sample every random collapse in the batch in one vectorized step
+        random_positions = [
+            position for position, (superposition, measurement_basis)
+            in enumerate(zip(superpositions, measurement_bases))
+            if measurement_basis not in self.DETERMINISTIC_BASES
+            and superposition.get("interpretations")
+        ]
+        selected_indices = dict(zip(random_positions, self._sample_collapse(
+            [self._get_probabilities(superpositions[position]) for position in random_positions],
+            [request_digests[position] for position in random_positions]
+        )))
+        
+        results = []
+        for position, superposition in enumerate(superpositions):
+            # Perform quantum measurement
+            measurement_result = await self._perform_measurement(
+                superposition, measurement_bases[position], resolved_features[position],
+                selected_index=selected_indices.get(position)
+            )
+            
+            # Record measurement in history
+            self.measurement_history.append({
+                "superposition_id": id(superposition),
+                "request_digest": request_digests[position],
+                "measurement_basis": measurement_bases[position],
+                "collapse_result": measurement_result.collapsed_meaning[:100],  # Truncated
+                "interpretations_count": len(measurement_result.interpretations)
+            })
+            results.append(measurement_result)
+        
+        return results
+    
+    def _request_digest(self, superposition: Dict[str, Any], measurement_basis: str) -> str:
+        """Digest the parts of a request that determine its measurement"""
+        return content_digest(
+            superposition.get("content", ""),
+            measurement_basis,
+            [(interp.get("id"), interp.get("probability")) for interp in superposition.get("interpretations", [])]
         )
-        
-        # Record measurement in history
-        self.measurement_history.append({
-            "superposition_id": id(superposition),
-            "measurement_basis": measurement_basis,
-            "collapse_result": measurement_result.collapsed_meaning[:100],  # Truncated
-            "interpretations_count": len(measurement_result.interpretations)
-        })
-        
-        return measurement_result
+    
+    def _get_probabilities(self, superposition: Dict[str, Any]) -> np.ndarray:
+        """Get the probability vector of a superposition"""
+        probabilities = superposition.get("probabilities")
+        if probabilities is None:
+            probabilities = np.array([
+                interp.get("probability", 0.0) for interp in superposition.get("interpretations", [])
+            ])
+        return probabilities
+    
+    def _sample_collapse(self, probability_vectors: List[np.ndarray], request_digests: List[str]) -> List[int]:
+        """Sample one interpretation index per probability vector"""
+        if not probability_vectors:
+            return []
+        
+        # Each request draws from its own stream, so batching does not change outcomes
+        uniforms = np.array([
+            np.random.default_rng([self.config.measurement_seed, int(digest[:16], 16)]).random()
+            for digest in request_digests
+        ])
+        
+        # Pad vectors into one matrix; all-zero rows fall back to equal weights
+        lengths = np.array([len(probabilities) for probabilities in probability_vectors])
+        weights = np.zeros((len(probability_vectors), lengths.max()))
+        for row, probabilities in enumerate(probability_vectors):
+            weights[row, :len(probabilities)] = probabilities
+        valid = np.arange(weights.shape[1]) < lengths[:, None]
+        totals = weights.sum(axis=1)
+        weights[totals <= 0] = valid[totals <= 0]
+        
+        # Inverse CDF sampling for all rows at once
+        cumulative = np.cumsum(weights, axis=1)
+        thresholds = uniforms * cumulative[:, -1]
+        indices = (cumulative <= thresholds[:, None]).sum(axis=1)
+        return np.minimum(indices, lengths - 1).tolist()
     
     async def _determine_measurement_basis(
         self, 
         superposition: Dict[str, Any], 
-        context: Dict[str, Any]
+        context_features: ContextFeatures
     ) -> str:
         """Determine the basis for quantum measurement"""
         
         # Strategy selection based on context and configuration
         if self.config.measurement_strategy == "context_collapse":
-            return await self._context_based_measurement_basis(superposition, context)
+            return await self._context_based_measurement_basis(superposition, context_features)
         
         elif self.config.measurement_strategy == "max_probability":
             return "max_probability_basis"
@@ -70,20 +169,20 @@ class MeasurementEngine:
         
         else:
             # Default to context-based measurement
-            return await self._context_based_measurement_basis(superposition, context)
+            return await self._context_based_measurement_basis(superposition, context_features)
     
     async def _context_based_measurement_basis(
         self, 
         superposition: Dict[str, Any], 
-        context: Dict[str, Any]
+        context_features: ContextFeatures
     ) -> str:
         """Determine measurement basis based on context"""
         
-        if not context:
+        if not context_features.size:
             return "uniform_measurement"
         
         # Analyze context to determine most relevant measurement approach
-        context_characteristics = self._analyze_context_characteristics(context)
+        context_characteristics = self._analyze_context_characteristics(context_features)
         
         if context_characteristics["complexity"] > 0.7:
             return "complex_context_measurement"
@@ -92,7 +191,7 @@ class MeasurementEngine:
         else:
             return "general_context_measurement"
     
-    def _analyze_context_characteristics(self, context: Dict[str, Any]) -> Dict[str, float]:
+    def _analyze_context_characteristics(self, context_features: ContextFeatures) -> Dict[str, float]:
         """Analyze characteristics of the context"""
         
         characteristics = {
@@ -101,21 +200,13 @@ class MeasurementEngine:
             "richness": 0.0
         }
         
+        context = context_features.context
         if not context:
             return characteristics
         
         # Complexity: based on nesting and variety of context elements
-        total_elements = 0
-        nested_elements = 0
-        
-        for key, value in context.items():
-            total_elements += 1
-            if isinstance(value, (dict, list)):
-                nested_elements += 1
-                if isinstance(value, dict):
-                    total_elements += len(value)
-                elif isinstance(value, list):
-                    total_elements += len(value)
+        total_elements = context_features.total_elements
+        nested_elements = context_features.nested_count
         
         characteristics["complexity"] = min(1.0, nested_elements / max(1, len(context)))
         characteristics["richness"] = min(1.0, total_elements / 10.0)  # Normalize to 10 elements
@@ -133,7 +224,8 @@ class MeasurementEngine:
         self, 
         superposition: Dict[str, Any], 
         measurement_basis: str, 
-        context: Dict[str, Any]
+        context_features: ContextFeatures,
+        selected_index: Optional[int] = None
     ) -> MeasurementResult:
         """Perform the actual quantum measurement"""
         
@@ -155,11 +247,18 @@ class MeasurementEngine:
             return await self._coherence_preserving_collapse(interpretations, superposition, measurement_basis)
         
         elif measurement_basis in ["complex_context_measurement", "specific_context_measurement"]:
-            return await self._context_weighted_collapse(interpretations, context, measurement_basis)
+            return await self._context_weighted_collapse(interpretations, context_features, measurement_basis)
         
         else:
             # Default: weighted random collapse based on probabilities
-            return await self._probability_weighted_collapse(interpretations, measurement_basis)
+            if selected_index is None:
+                selected_index = self._sample_collapse(
+                    [self._get_probabilities(superposition)],
+                    [self._request_digest(superposition, measurement_basis)]
+                )[0]
+            return await self._probability_weighted_collapse(
+                interpretations, measurement_basis, selected_index
+            )
     
     async def _max_probability_collapse(
         self, 
@@ -240,7 +339,7 @@ class MeasurementEngine:
     async def _context_weighted_collapse(
         self, 
         interpretations: List[Dict[str, Any]], 
-        context: Dict[str, Any], 
+        context_features: ContextFeatures, 
         measurement_basis: str
     ) -> MeasurementResult:
         """Collapse with context-weighted probabilities"""
@@ -249,7 +348,7 @@ class MeasurementEngine:
         context_weighted_interpretations = []
         
         for interp in interpretations:
-            context_alignment = self._calculate_context_alignment(interp, context)
+            context_alignment = self._calculate_context_alignment(interp, context_features)
             context_weight = interp.get("probability", 0.0) * (1.0 + context_alignment)
             
             weighted_interp = interp.copy()
@@ -291,22 +390,18 @@ class MeasurementEngine:
     async def _probability_weighted_collapse(
         self, 
         interpretations: List[Dict[str, Any]], 
-        measurement_basis: str
+        measurement_basis: str,
+        selected_index: int
     ) -> MeasurementResult:
-        """Collapse using probability-weighted random selection"""
+        """Collapse to an interpretation sampled in proportion to its probability"""
         
-        # Prepare probability distribution
-        probabilities = [interp.get("probability", 0.0) for interp in interpretations]
-        total_prob = sum(probabilities)
+        selected_interp = interpretations[selected_index]
+        total_prob = sum(interp.get("probability", 0.0) for interp in interpretations)
         
         if total_prob == 0:
             # Equal probability if no probabilities specified
-            selected_interp = random.choice(interpretations)
             collapse_probability = 1.0 / len(interpretations)
         else:
-            # Weighted random selection
-            normalized_probs = [p / total_prob for p in probabilities]
-            selected_interp = random.choices(interpretations, weights=normalized_probs)[0]
             collapse_probability = selected_interp.get("probability", 0.0)
         
         # Create structured interpretations
@@ -334,24 +429,21 @@ class MeasurementEngine:
     def _calculate_context_alignment(
         self, 
         interpretation: Dict[str, Any], 
-        context: Dict[str, Any]
+        context_features: ContextFeatures
     ) -> float:
         """Calculate alignment between interpretation and context"""
         
-        if not context:
+        if not context_features.size:
             return 0.0
         
         # Simple token-based alignment
-        interp_text = interpretation.get("text", "").lower().split()
-        context_text = " ".join(str(v) for v in context.values()).lower().split()
+        interp_set = set(interpretation.get("text", "").lower().split())
+        context_set = context_features.tokens
         
-        if not interp_text or not context_text:
+        if not interp_set or not context_set:
             return 0.0
         
         # Calculate overlap
-        interp_set = set(interp_text)
-        context_set = set(context_text)
-        
         intersection = len(interp_set.intersection(context_set))
         union = len(interp_set.union(context_set))
         
@@ -391,8 +483,8 @@ quantum semantic field based on observer context and measurement conditions.
     
     def get_measurement_history(self) -> List[Dict[str, Any]]:
         """Get history of quantum measurements"""
-        return self.measurement_history.copy()
+        return list(self.measurement_history)
     
     def reset(self):
         """Reset measurement engine state"""
-        self.measurement_history = []
\ No newline at end of file
+        self.measurement_history.clear()
\ No newline at end of file
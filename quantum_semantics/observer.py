@@ -3,13 +3,18 @@ Observer Manager - Quantum Observer Effects
 ============================================
 
 Manages observer contexts and their effects on semantic interpretations
-based on quantum semantic principles.
+based on quantum semantic principles. Observers are compiled into keyword
+weight vectors so resonance with every interpretation is one matrix product.
 """
 
 import asyncio
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
 
+import numpy as np
+
+from ..utils.cache import LRUCache
+
 @dataclass
 class Observer:
     """Represents an observer context"""
@@ -24,7 +29,42 @@ class ObserverManager:
     def __init__(self, config):
         self.config = config
         self.active_observers = []
+        self.keyword_features = LRUCache(1024)  # interpretation text -> keyword presence row
         self._initialize_default_observers()
+        self._compile_observers()
+    
+    def _compile_observers(self):
+        """Compile active observers into keyword weight vectors"""
+        self.keywords: List[str] = []
+        keyword_index: Dict[str, int] = {}
+        weighted_keywords = []
+        
+        for observer in self.active_observers:
+            # Focus areas carry 60% of resonance and perspective keywords 40%
+            weights = []
+            if observer.focus_areas:
+                weights.extend(
+                    (area.lower(), 0.6 / len(observer.focus_areas)) for area in observer.focus_areas
+                )
+            perspective_keywords = observer.perspective.split("_")
+            weights.extend((keyword, 0.4 / len(perspective_keywords)) for keyword in perspective_keywords)
+            
+            for keyword, _ in weights:
+                if keyword not in keyword_index:
+                    keyword_index[keyword] = len(self.keywords)
+                    self.keywords.append(keyword)
+            weighted_keywords.append(weights)
+        
+        # Observer x keyword weights; repeated keywords accumulate like separate matches
+        self.observer_weights = np.zeros((len(self.active_observers), len(self.keywords)))
+        for row, weights in enumerate(weighted_keywords):
+            for keyword, weight in weights:
+                self.observer_weights[row, keyword_index[keyword]] += weight
+        
+        self.observer_strengths = np.array(
+            [observer.influence_strength for observer in self.active_observers]
+        )
+        self.keyword_features.clear()
         
     def _initialize_default_observers(self):
         """Initialize default observer contexts"""
@@ -73,16 +113,72 @@ class ObserverManager:
         """Apply observer effects to semantic superposition"""
         
         observed_superposition = superposition.copy()
+        interpretations = superposition.get("interpretations", [])
         
-        # Apply each active observer's influence
-        for observer in self.active_observers:
-            if observer.id in observer_contexts or "all" in observer_contexts:
-                observed_superposition = await self._apply_single_observer_effect(
-                    observed_superposition, observer
+        selected = [
+            index for index, observer in enumerate(self.active_observers)
+            if observer.id in observer_contexts or "all" in observer_contexts
+        ]
+        if not selected or not interpretations:
+            return observed_superposition
+        
+        # Resonance of every interpretation with every selected observer
+        features = self._get_keyword_features(interpretations)
+        resonance = features @ self.observer_weights[selected].T
+        multipliers = 1.0 + (resonance * self.observer_strengths[selected] - 0.5)
+        
+        probabilities = superposition.get("probabilities")
+        if probabilities is None:
+            probabilities = np.array([interp["probability"] for interp in interpretations])
+        
+        # Observer effects compose multiplicatively, so normalizing once is exact
+        # unless the upper clamp binds (multipliers are at least 0.5, so the lower
+        # clamp never does); clamping observers fall back to one step per observer
+        cumulative = probabilities[:, None] * np.cumprod(multipliers, axis=1)
+        previous_totals = np.concatenate(([1.0], cumulative[:, :-1].sum(axis=0)))
+        if (cumulative.max(axis=0) <= previous_totals).all():
+            probabilities = self._normalize(cumulative[:, -1])
+        else:
+            for column in range(len(selected)):
+                probabilities = self._normalize(
+                    np.clip(probabilities * multipliers[:, column], 0.0, 1.0)
                 )
         
+        # The last applied observer is recorded, as with sequential application
+        last_observer = self.active_observers[selected[-1]]
+        last_resonance = resonance[:, -1].tolist()
+        observed_superposition["interpretations"] = [
+            {
+                **interpretation,
+                "probability": float(probability),
+                "observer_influence": last_observer.id,
+                "resonance": interpretation_resonance
+            }
+            for interpretation, probability, interpretation_resonance
+            in zip(interpretations, probabilities.tolist(), last_resonance)
+        ]
+        observed_superposition["probabilities"] = probabilities
+        observed_superposition["observer_applied"] = last_observer.id
+        
         return observed_superposition
     
+    def _get_keyword_features(self, interpretations: List[Dict[str, Any]]) -> np.ndarray:
+        """Build the interpretation x keyword presence matrix"""
+        rows = []
+        for interpretation in interpretations:
+            text = interpretation.get("text", "").lower()
+            row = self.keyword_features.get(text)
+            if row is None:
+                row = np.array([keyword in text for keyword in self.keywords], dtype=float)
+                self.keyword_features.put(text, row)
+            rows.append(row)
+        return np.vstack(rows) if self.keywords else np.zeros((len(interpretations), 0))
+    
+    def _normalize(self, probabilities: np.ndarray) -> np.ndarray:
+        """Renormalize a probability vector, leaving an all-zero vector unchanged"""
+        total = probabilities.sum()
+        return probabilities / total if total > 0 else probabilities
+    
     async def _apply_single_observer_effect(
         self, 
         superposition: Dict[str, Any], 
@@ -120,6 +216,9 @@ class ObserverManager:
         # Update superposition with observer effects
         observed_superposition = superposition.copy()
         observed_superposition["interpretations"] = modified_interpretations
+        observed_superposition["probabilities"] = np.array(
+            [interp["probability"] for interp in modified_interpretations]
+        )
         observed_superposition["observer_applied"] = observer.id
         
         return observed_superposition
@@ -155,10 +254,12 @@ class ObserverManager:
     def add_observer(self, observer: Observer):
         """Add a custom observer"""
         self.active_observers.append(observer)
+        self._compile_observers()
     
     def remove_observer(self, observer_id: str):
         """Remove an observer by ID"""
         self.active_observers = [obs for obs in self.active_observers if obs.id != observer_id]
+        self._compile_observers()
     
     def get_active_observers(self) -> List[Observer]:
         """Get list of active observers"""
@@ -167,4 +268,5 @@ class ObserverManager:
     def reset(self):
         """Reset observer manager state"""
         self.active_observers = []
-        self._initialize_default_observers()
\ No newline at end of file
+        self._initialize_default_observers()
+        self._compile_observers()
\ No newline at end of file
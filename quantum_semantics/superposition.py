@@ -7,15 +7,18 @@ interpretations exist simultaneously until measurement.
 """
 
 import asyncio
-from typing import Dict, List, Any, Optional
-import random
+from typing import Dict, List, Any, Optional, Tuple
+
+import numpy as np
+
+from ..utils.cache import LRUCache, content_digest
 
 class SuperpositionProcessor:
     """Creates and manages semantic superposition states"""
     
     def __init__(self, config):
         self.config = config
-        self.superposition_cache = {}
+        self.superposition_cache = LRUCache(config.superposition_cache_size)
         
     async def create_superposition(
         self, 
@@ -24,6 +27,12 @@ class SuperpositionProcessor:
     ) -> Dict[str, Any]:
         """Create semantic superposition from content"""
         
+        # Interpretations depend on the content and the shape of the context only
+        cache_key = content_digest(content, self._get_context_shape(context))
+        cached_superposition = self.superposition_cache.get(cache_key)
+        if cached_superposition is not None:
+            return self._copy_superposition(cached_superposition)
+        
         # Generate multiple potential interpretations
         interpretations = await self._generate_potential_interpretations(content, context)
         
@@ -31,12 +40,30 @@ class SuperpositionProcessor:
         superposition = {
             "content": content,
             "interpretations": interpretations,
+            "probabilities": np.array([interp["probability"] for interp in interpretations]),
             "coherence": self._calculate_superposition_coherence(interpretations),
             "entanglement": await self._detect_semantic_entanglement(interpretations, context),
             "state": "superposition"
         }
+        self.superposition_cache.put(cache_key, superposition)
         
-        return superposition
+        return self._copy_superposition(superposition)
+    
+    def _get_context_shape(self, context: Dict[str, Any]) -> List[Tuple[str, Optional[int]]]:
+        """Get the context keys and container sizes that interpretations depend on"""
+        return [
+            (key, len(value) if isinstance(value, (list, dict)) else None)
+            for key, value in context.items()
+        ]
+    
+    def _copy_superposition(self, superposition: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy a cached superposition so callers cannot mutate the cache entry"""
+        copied_superposition = superposition.copy()
+        copied_superposition["interpretations"] = [
+            interpretation.copy() for interpretation in superposition["interpretations"]
+        ]
+        copied_superposition["probabilities"] = superposition["probabilities"].copy()
+        return copied_superposition
     
     async def _generate_potential_interpretations(
         self, 
@@ -48,16 +75,10 @@ class SuperpositionProcessor:
         interpretations = []
         
         # Generate interpretations from different semantic perspectives
-        semantic_perspectives = [
-            "literal_meaning",
-            "metaphorical_meaning", 
-            "contextual_meaning",
-            "inferential_meaning",
-            "pragmatic_meaning"
-        ]
+        semantic_perspectives = self.config.semantic_perspectives
         
         for i, perspective in enumerate(semantic_perspectives):
-            interpretation = await self._generate_perspective_interpretation(
+            interpretation = self._generate_perspective_interpretation(
                 content, context, perspective
             )
             
@@ -84,7 +105,7 @@ class SuperpositionProcessor:
         
         return interpretations
     
-    async def _generate_perspective_interpretation(
+    def _generate_perspective_interpretation(
         self, 
         content: str, 
         context: Dict[str, Any], 
@@ -134,8 +155,9 @@ class SuperpositionProcessor:
             }
         
         else:
+            perspective_name = perspective.replace("_", " ").capitalize()
             return {
-                "text": f"General interpretation: Standard semantic analysis of '{content[:50]}...'",
+                "text": f"{perspective_name} interpretation: Standard semantic analysis of '{content[:50]}...'",
                 "type": "general",
                 "confidence": 0.7,
                 "reasoning": "General semantic processing"
@@ -179,17 +201,17 @@ class SuperpositionProcessor:
             return 0.0
         
         # Coherence based on probability distribution evenness
-        probabilities = [interp["probability"] for interp in interpretations]
+        probabilities = np.array([interp["probability"] for interp in interpretations])
         
         # Calculate entropy-based coherence
-        import math
-        entropy = -sum(p * math.log2(p) for p in probabilities if p > 0)
-        max_entropy = math.log2(len(probabilities)) if len(probabilities) > 1 else 1.0
+        nonzero = probabilities[probabilities > 0]
+        entropy = float(-(nonzero * np.log2(nonzero)).sum())
+        max_entropy = np.log2(len(probabilities)) if len(probabilities) > 1 else 1.0
         
         # Higher entropy = higher coherence (more balanced superposition)
         coherence = entropy / max_entropy if max_entropy > 0 else 1.0
         
-        return coherence
+        return float(coherence)
     
     async def _detect_semantic_entanglement(
         self, 
@@ -201,20 +223,15 @@ class SuperpositionProcessor:
         entangled_pairs = []
         
         # Look for interpretations that share semantic features
-        for i in range(len(interpretations)):
-            for j in range(i + 1, len(interpretations)):
-                interp_a = interpretations[i]
-                interp_b = interpretations[j]
-                
-                # Calculate semantic overlap
-                overlap = self._calculate_semantic_overlap(interp_a, interp_b)
-                
-                if overlap > self.config.superposition_threshold:
-                    entangled_pairs.append({
-                        "pair": [interp_a["id"], interp_b["id"]],
-                        "strength": overlap,
-                        "type": "semantic_overlap"
-                    })
+        overlap = self._calculate_overlap_matrix(interpretations)
+        rows, columns = np.nonzero(np.triu(overlap > self.config.superposition_threshold, k=1))
+        
+        for i, j in zip(rows.tolist(), columns.tolist()):
+            entangled_pairs.append({
+                "pair": [interpretations[i]["id"], interpretations[j]["id"]],
+                "strength": float(overlap[i, j]),
+                "type": "semantic_overlap"
+            })
         
         return {
             "entangled_pairs": entangled_pairs,
@@ -222,36 +239,53 @@ class SuperpositionProcessor:
             "overall_entanglement": len(entangled_pairs) / max(1, len(interpretations) * (len(interpretations) - 1) / 2)
         }
     
+    def _calculate_overlap_matrix(self, interpretations: List[Dict[str, Any]]) -> np.ndarray:
+        """Calculate pairwise semantic overlap between all interpretations"""
+        count = len(interpretations)
+        if count == 0:
+            return np.zeros((0, 0))
+        
+        # Tokenize each text once into vocabulary ids
+        vocabulary = {}
+        token_rows = []
+        token_columns = []
+        for row, interpretation in enumerate(interpretations):
+            for token in set(interpretation.get("text", "").lower().split()):
+                token_rows.append(row)
+                token_columns.append(vocabulary.setdefault(token, len(vocabulary)))
+        
+        # Token presence matrix; its Gram matrix gives set intersection counts
+        presence = np.zeros((count, max(1, len(vocabulary))), dtype=np.float32)
+        presence[token_rows, token_columns] = 1.0
+        intersection = presence @ presence.T
+        sizes = presence.sum(axis=1)
+        union = sizes[:, None] + sizes[None, :] - intersection
+        jaccard_similarity = np.divide(
+            intersection, union, out=np.zeros_like(intersection), where=union > 0
+        )
+        
+        # Type similarity bonus
+        type_ids = {}
+        types = np.array([
+            type_ids.setdefault(interpretation.get("type"), len(type_ids))
+            for interpretation in interpretations
+        ])
+        type_similarity = (types[:, None] == types[None, :]).astype(np.float32)
+        
+        # Combined overlap, zero when either text is empty
+        overlap = (jaccard_similarity * 0.8) + (type_similarity * 0.2)
+        has_text = sizes > 0
+        overlap[~(has_text[:, None] & has_text[None, :])] = 0.0
+        
+        return overlap
+    
     def _calculate_semantic_overlap(
         self, 
         interp_a: Dict[str, Any], 
         interp_b: Dict[str, Any]
     ) -> float:
         """Calculate semantic overlap between two interpretations"""
-        
-        # Simple token-based overlap
-        text_a = interp_a.get("text", "").lower().split()
-        text_b = interp_b.get("text", "").lower().split()
-        
-        if not text_a or not text_b:
-            return 0.0
-        
-        # Calculate Jaccard similarity
-        set_a = set(text_a)
-        set_b = set(text_b)
-        
-        intersection = len(set_a.intersection(set_b))
-        union = len(set_a.union(set_b))
-        
-        jaccard_similarity = intersection / union if union > 0 else 0.0
-        
-        # Type similarity bonus
-        type_similarity = 1.0 if interp_a.get("type") == interp_b.get("type") else 0.0
-        
-        # Combined overlap
-        overall_overlap = (jaccard_similarity * 0.8) + (type_similarity * 0.2)
-        
-        return overall_overlap
+        return float(self._calculate_overlap_matrix([interp_a, interp_b])[0, 1])
     
     async def evolve_superposition(
         self, 
@@ -272,6 +306,9 @@ class SuperpositionProcessor:
         # Update superposition state
         evolved_superposition = superposition.copy()
         evolved_superposition["interpretations"] = evolved_interpretations
+        evolved_superposition["probabilities"] = np.array(
+            [interp["probability"] for interp in evolved_interpretations]
+        )
         evolved_superposition["coherence"] = self._calculate_superposition_coherence(evolved_interpretations)
         evolved_superposition["evolution_count"] = superposition.get("evolution_count", 0) + 1
         
@@ -315,4 +352,4 @@ class SuperpositionProcessor:
     
     def reset(self):
         """Reset superposition processor state"""
-        self.superposition_cache = {}
\ No newline at end of file
+        self.superposition_cache.clear()
\ No newline at end of file
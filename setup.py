@@ -81,6 +81,9 @@ setup(
             "sphinx-rtd-theme>=1.0.0",
             "sphinx-autodoc-typehints>=1.12.0",
         ],
+        "server": [
+            "uvicorn[standard]>=0.22.0",  # websockets for the /v1/ws endpoint
+        ],
         "examples": [
             "jupyter>=1.0.0",
             "matplotlib>=3.5.0",
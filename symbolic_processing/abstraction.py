@@ -11,6 +11,9 @@ from typing import Dict, List, Any, Optional, TYPE_CHECKING
 from dataclasses import dataclass
 from collections import defaultdict
 
+from ..core.features import ContextFeatures
+from ..utils.cache import LRUCache, content_digest
+
 if TYPE_CHECKING:
     from .manager import SymbolicVariable
 
@@ -27,21 +30,31 @@ class AbstractionEngine:
     
     def __init__(self, config):
         self.config = config
-        self.abstraction_cache = {}  # Cache for repeated abstractions
+        self.abstraction_cache = LRUCache(config.cache_size)  # Cache for repeated abstractions
         
     async def abstract_symbols(
         self, 
         content: str, 
         context: Dict[str, Any],
-        focus: str = "relationships"
+        focus: str = "relationships",
+        context_features: Optional[ContextFeatures] = None,
+        tokens: Optional[List[str]] = None
     ) -> AbstractionResult:
-        """Abstract symbols from input content"""
+        """Abstract symbols from input content, optionally reusing its tokens"""
+        context_features = ContextFeatures.resolve(context, context_features)
+        
+        # Check cache for repeated abstractions of the same content
+        cache_key = (content_digest(content, context_features.digest), focus)
+        cached_result = self.abstraction_cache.get(cache_key)
+        if cached_result is not None:
+            return self._copy_result(cached_result)
         
         # Tokenize and analyze content
-        tokens = self._tokenize_content(content)
+        if tokens is None:
+            tokens = self._tokenize_content(content)
         
         # Identify entities and concepts
-        entities = await self._identify_entities(tokens, context)
+        entities = await self._identify_entities(tokens, context_features)
         
         # Extract relationships
         relationships = await self._extract_relationships(tokens, entities, focus)
@@ -55,12 +68,47 @@ class AbstractionEngine:
         # Determine abstraction depth
         max_depth = max((var.abstraction_level for var in variables), default=1)
         
-        return AbstractionResult(
+        result = AbstractionResult(
             variables=variables,
             relationships=relationships,
             confidence=confidence,
             max_depth=max_depth
         )
+        self.abstraction_cache.put(cache_key, result)
+        
+        return self._copy_result(result)
+    
+    def _copy_result(self, result: AbstractionResult) -> AbstractionResult:
+        """Copy a cached result so callers cannot mutate the cache entry"""
+        return AbstractionResult(
+            variables=list(result.variables),
+            relationships={key: list(values) for key, values in result.relationships.items()},
+            confidence=result.confidence,
+            max_depth=result.max_depth
+        )
+    
+    def _build_positional_index(self, tokens: List[str]) -> Dict[str, List[int]]:
+        """Build index mapping each token to its positions in the token list"""
+        token_positions = defaultdict(list)
+        for position, token in enumerate(tokens):
+            token_positions[token].append(position)
+        return token_positions
+    
+    def _build_relationship_index(
+        self, 
+        relationships: Dict[str, List[str]]
+    ) -> Dict[str, List[str]]:
+        """Build adjacency map from each token to the relationships involving it"""
+        # Dicts keep insertion order, so keys stay in relationship order
+        adjacency = defaultdict(dict)
+        
+        for rel_key, rel_values in relationships.items():
+            for term in rel_key.split('_'):
+                adjacency[term][rel_key] = None
+            for value in rel_values:
+                adjacency[value][rel_key] = None
+        
+        return {token: list(rel_keys) for token, rel_keys in adjacency.items()}
     
     def _tokenize_content(self, content: str) -> List[str]:
         """Tokenize content into meaningful units"""
@@ -83,7 +131,11 @@ class AbstractionEngine:
         
         return meaningful_tokens
     
-    async def _identify_entities(self, tokens: List[str], context: Dict[str, Any]) -> List[Dict[str, Any]]:
+    async def _identify_entities(
+        self, 
+        tokens: List[str], 
+        context_features: ContextFeatures
+    ) -> List[Dict[str, Any]]:
         """Identify entities and concepts in the tokens"""
         entities = []
         entity_types = {
@@ -101,7 +153,7 @@ class AbstractionEngine:
             entity = {
                 'token': token,
                 'type': 'concept',  # default
-                'importance': self._calculate_token_importance(token, context)
+                'importance': self._calculate_token_importance(token, context_features)
             }
             
             # Classify entity type based on suffixes and context
@@ -122,7 +174,7 @@ class AbstractionEngine:
         
         return entities
     
-    def _calculate_token_importance(self, token: str, context: Dict[str, Any]) -> float:
+    def _calculate_token_importance(self, token: str, context_features: ContextFeatures) -> float:
         """Calculate importance score for a token"""
         importance = 0.5  # Base importance
         
@@ -131,10 +183,8 @@ class AbstractionEngine:
             importance += 0.2
         
         # Context relevance
-        if context:
-            context_text = ' '.join(str(v) for v in context.values()).lower()
-            if token in context_text:
-                importance += 0.3
+        if context_features.size and context_features.mentions(token):
+            importance += 0.3
         
         # Domain-specific importance (could be enhanced with NLP models)
         technical_terms = ['analysis', 'system', 'process', 'method', 'algorithm']
@@ -180,16 +230,20 @@ class AbstractionEngine:
         # Look for relationship indicators
         relation_words = ['is', 'has', 'can', 'will', 'causes', 'leads', 'results', 'means']
         
-        for i, token in enumerate(tokens):
-            if token in relation_words:
-                # Find entities around this relationship word
-                before_entities = [e['token'] for e in entities if tokens.index(e['token']) < i]
-                after_entities = [e['token'] for e in entities if tokens.index(e['token']) > i]
-                
-                if before_entities and after_entities:
-                    subject = before_entities[-1]  # Last entity before relation
-                    object_entity = after_entities[0]  # First entity after relation
-                    relationships[f"{subject}_{token}"].append(object_entity)
+        # Entities are produced one per token, so token positions index entities directly
+        token_positions = self._build_positional_index(tokens)
+        relation_positions = sorted(
+            position
+            for word in relation_words
+            for position in token_positions.get(word, [])
+        )
+        
+        for i in relation_positions:
+            # Find entities around this relationship word
+            if 0 < i < len(entities) - 1:
+                subject = entities[i - 1]['token']  # Last entity before relation
+                object_entity = entities[i + 1]['token']  # First entity after relation
+                relationships[f"{subject}_{tokens[i]}"].append(object_entity)
         
         return relationships
     
@@ -265,16 +319,14 @@ class AbstractionEngine:
         from .manager import SymbolicVariable  # Import here to avoid circular import
         
         variables = []
+        relationship_index = self._build_relationship_index(relationships)
         
         # Create variables for high-importance entities
         for i, entity in enumerate(entities):
             if entity['importance'] > 0.6:  # Threshold for abstraction
                 
                 # Find relationships involving this entity
-                entity_relationships = []
-                for rel_key, rel_values in relationships.items():
-                    if entity['token'] in rel_key or entity['token'] in rel_values:
-                        entity_relationships.append(rel_key)
+                entity_relationships = list(relationship_index.get(entity['token'], []))
                 
                 # Determine abstraction level based on complexity
                 abstraction_level = min(3, len(entity_relationships) + 1)
@@ -330,4 +382,4 @@ class AbstractionEngine:
     
     def reset(self):
         """Reset abstraction engine state"""
-        self.abstraction_cache = {}
\ No newline at end of file
+        self.abstraction_cache.clear()
\ No newline at end of file
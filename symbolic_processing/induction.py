@@ -11,6 +11,8 @@ from typing import Dict, List, Any, Optional, TYPE_CHECKING
 from dataclasses import dataclass
 from collections import defaultdict
 
+from ..utils.cache import LRUCache, content_digest
+
 if TYPE_CHECKING:
     from .manager import SymbolicVariable, SymbolicPattern
 
@@ -27,7 +29,7 @@ class InductionEngine:
     
     def __init__(self, config):
         self.config = config
-        self.pattern_cache = {}  # Cache for identified patterns
+        self.pattern_cache = LRUCache(config.cache_size)  # Cache for identified patterns
         
     async def induce_patterns(
         self, 
@@ -37,13 +39,68 @@ class InductionEngine:
     ) -> InductionResult:
         """Induce patterns from abstract symbolic variables"""
         
-        if method == "pattern_recognition":
-            return await self._pattern_recognition_induction(variables, original_content)
-        elif method == "logical_inference":
-            return await self._logical_inference_induction(variables, original_content)
+        # Check cache for repeated induction over the same content and variables
+        cache_key = (
+            content_digest(original_content, self._get_variables_signature(variables)),
+            method,
+            self._get_search_limits()
+        )
+        cached_result = self.pattern_cache.get(cache_key)
+        if cached_result is not None:
+            return self._copy_result(cached_result)
+        
+        if method == "logical_inference":
+            result = await self._logical_inference_induction(variables, original_content)
         else:
             # Default to pattern recognition
-            return await self._pattern_recognition_induction(variables, original_content)
+            result = await self._pattern_recognition_induction(variables, original_content)
+        
+        self.pattern_cache.put(cache_key, result)
+        
+        return self._copy_result(result)
+    
+    def _get_variables_signature(self, variables: List['SymbolicVariable']) -> tuple:
+        """Get hashable signature of the variables that drive induction"""
+        return tuple(
+            (var.symbol, var.abstraction_level, var.confidence, tuple(var.relationships))
+            for var in variables
+        )
+    
+    def _get_search_limits(self) -> Optional[tuple]:
+        """Get bounded-search limits, or None for exhaustive search"""
+        if not self.config.bounded_induction:
+            return None
+        return (
+            self.config.max_pattern_length,
+            self.config.max_candidate_patterns,
+            self.config.min_pattern_confidence
+        )
+    
+    def _copy_result(self, result: InductionResult) -> InductionResult:
+        """Copy a cached result so callers cannot mutate the cache entry"""
+        return InductionResult(
+            patterns=list(result.patterns),
+            rules=list(result.rules),
+            generalizations=list(result.generalizations),
+            confidence=result.confidence
+        )
+    
+    def _is_pruned(self, confidence: float) -> bool:
+        """Check whether candidates of this confidence are pruned by bounded search"""
+        limits = self._get_search_limits()
+        return limits is not None and confidence < limits[2]
+    
+    def _is_budget_exhausted(self, candidate_count: int) -> bool:
+        """Check whether bounded search has produced its maximum number of candidates"""
+        limits = self._get_search_limits()
+        return limits is not None and candidate_count >= limits[1]
+    
+    def _bound_pattern(self, symbols: List[str]) -> List[str]:
+        """Truncate candidate pattern symbols to the bounded-search length"""
+        limits = self._get_search_limits()
+        if limits is None:
+            return symbols
+        return symbols[:limits[0]]
     
     async def _pattern_recognition_induction(
         self, 
@@ -56,10 +113,15 @@ class InductionEngine:
         sequence_patterns = await self._identify_sequence_patterns(variables)
         
         # Identify relationship patterns
-        relationship_patterns = await self._identify_relationship_patterns(variables)
+        relationship_patterns = await self._identify_relationship_patterns(
+            variables, found_count=len(sequence_patterns)
+        )
         
         # Identify structural patterns
-        structural_patterns = await self._identify_structural_patterns(variables, original_content)
+        structural_patterns = await self._identify_structural_patterns(
+            variables, original_content,
+            found_count=len(sequence_patterns) + len(relationship_patterns)
+        )
         
         # Combine all patterns
         all_patterns = sequence_patterns + relationship_patterns + structural_patterns
@@ -111,7 +173,11 @@ class InductionEngine:
             confidence=confidence
         )
     
-    async def _identify_sequence_patterns(self, variables: List['SymbolicVariable']) -> List['SymbolicPattern']:
+    async def _identify_sequence_patterns(
+        self, 
+        variables: List['SymbolicVariable'], 
+        found_count: int = 0
+    ) -> List['SymbolicPattern']:
         """Identify patterns in variable sequences"""
         from .manager import SymbolicPattern  # Import here to avoid circular import
         
@@ -124,12 +190,12 @@ class InductionEngine:
         sorted_vars = sorted(variables, key=lambda v: v.abstraction_level)
         
         # Identify ascending abstraction pattern
-        if len(sorted_vars) >= 3:
+        if len(sorted_vars) >= 3 and not self._is_pruned(0.8):
             abstraction_levels = [var.abstraction_level for var in sorted_vars]
             if all(abstraction_levels[i] <= abstraction_levels[i+1] for i in range(len(abstraction_levels)-1)):
                 pattern = SymbolicPattern(
                     id=f"seq_ascending_{len(patterns)}",
-                    pattern=[var.symbol for var in sorted_vars],
+                    pattern=self._bound_pattern([var.symbol for var in sorted_vars]),
                     rule="abstraction_ascending",
                     generalization="Variables show increasing abstraction complexity",
                     confidence=0.8
@@ -137,12 +203,20 @@ class InductionEngine:
                 patterns.append(pattern)
         
         # Identify relationship-based sequences
+        if self._is_pruned(0.7):
+            return patterns
+        
+        relationship_sets = [set(var.relationships) for var in variables]
+        
         for i in range(len(variables) - 1):
+            if self._is_budget_exhausted(found_count + len(patterns)):
+                break
+            
             current_var = variables[i]
             next_var = variables[i + 1]
             
             # Check for shared relationships
-            shared_rels = set(current_var.relationships).intersection(set(next_var.relationships))
+            shared_rels = relationship_sets[i].intersection(relationship_sets[i + 1])
             if shared_rels:
                 pattern = SymbolicPattern(
                     id=f"seq_shared_{len(patterns)}",
@@ -155,7 +229,11 @@ class InductionEngine:
         
         return patterns
     
-    async def _identify_relationship_patterns(self, variables: List['SymbolicVariable']) -> List['SymbolicPattern']:
+    async def _identify_relationship_patterns(
+        self, 
+        variables: List['SymbolicVariable'], 
+        found_count: int = 0
+    ) -> List['SymbolicPattern']:
         """Identify patterns in variable relationships"""
         from .manager import SymbolicPattern  # Import here to avoid circular import
         
@@ -171,10 +249,13 @@ class InductionEngine:
         
         # Identify patterns in relationship groups
         for rel_type, grouped_vars in relationship_groups.items():
+            if self._is_pruned(0.75) or self._is_budget_exhausted(found_count + len(patterns)):
+                break
+            
             if len(grouped_vars) >= 2:
                 pattern = SymbolicPattern(
                     id=f"rel_{rel_type}_{len(patterns)}",
-                    pattern=[var.symbol for var in grouped_vars],
+                    pattern=self._bound_pattern([var.symbol for var in grouped_vars]),
                     rule=f"relationship_grouping_{rel_type}",
                     generalization=f"Variables grouped by {rel_type} relationships",
                     confidence=0.75
@@ -184,10 +265,10 @@ class InductionEngine:
         # Identify hub variables (variables with many relationships)
         hub_variables = [var for var in variables if len(var.relationships) > 3]
         
-        if hub_variables:
+        if hub_variables and not self._is_budget_exhausted(found_count + len(patterns)):
             pattern = SymbolicPattern(
                 id=f"hub_pattern_{len(patterns)}",
-                pattern=[var.symbol for var in hub_variables],
+                pattern=self._bound_pattern([var.symbol for var in hub_variables]),
                 rule="hub_variables",
                 generalization="High-connectivity variables serve as conceptual hubs",
                 confidence=0.8
@@ -199,7 +280,8 @@ class InductionEngine:
     async def _identify_structural_patterns(
         self, 
         variables: List['SymbolicVariable'], 
-        original_content: str
+        original_content: str,
+        found_count: int = 0
     ) -> List['SymbolicPattern']:
         """Identify structural patterns in content organization"""
         from .manager import SymbolicPattern  # Import here to avoid circular import
@@ -212,7 +294,8 @@ class InductionEngine:
             level_distribution[var.abstraction_level].append(var)
         
         # Identify hierarchical patterns
-        if len(level_distribution) > 2:
+        if (len(level_distribution) > 2 and not self._is_pruned(0.7)
+                and not self._is_budget_exhausted(found_count + len(patterns))):
             pattern = SymbolicPattern(
                 id=f"hierarchical_{len(patterns)}",
                 pattern=[f"level_{level}" for level in sorted(level_distribution.keys())],
@@ -224,10 +307,10 @@ class InductionEngine:
         
         # Identify confidence-based patterns
         high_confidence_vars = [var for var in variables if var.confidence > 0.8]
-        if len(high_confidence_vars) >= 2:
+        if len(high_confidence_vars) >= 2 and not self._is_budget_exhausted(found_count + len(patterns)):
             pattern = SymbolicPattern(
                 id=f"high_confidence_{len(patterns)}",
-                pattern=[var.symbol for var in high_confidence_vars],
+                pattern=self._bound_pattern([var.symbol for var in high_confidence_vars]),
                 rule="high_confidence_clustering",
                 generalization="High-confidence variables form coherent conceptual clusters",
                 confidence=0.8
@@ -357,4 +440,4 @@ class InductionEngine:
     
     def reset(self):
         """Reset induction engine state"""
-        self.pattern_cache = {}
\ No newline at end of file
+        self.pattern_cache.clear()
\ No newline at end of file
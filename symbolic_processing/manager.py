@@ -8,13 +8,21 @@ in Princeton ICML research on emergent symbolic mechanisms.
 
 import asyncio
 import logging
-from typing import Dict, List, Any, Optional
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List, Any, Optional, Sequence
 from dataclasses import dataclass
 
+import numpy as np
+
 from ..core.base import BaseContextProcessor, ProcessingResult
+from ..core.features import ContextFeatures
 from .abstraction import AbstractionEngine
 from .induction import InductionEngine
 from .retrieval import RetrievalEngine
+from ..utils.logger import SampledLogger
 
 @dataclass
 class SymbolicVariable:
@@ -53,6 +61,20 @@ class SymbolicProcessor(BaseContextProcessor):
     3. Retrieval: Generate concrete solutions from abstract reasoning
     """
     
+    LIVE_CONFIG_KEYS = frozenset({
+        "abstraction_depth", "induction_method", "retrieval_strategy", "symbolic_validation",
+        "generalization_enabled", "cache_size", "bounded_induction", "max_pattern_length",
+        "max_candidate_patterns", "min_pattern_confidence", "batch_parallel_threshold",
+        "batch_max_workers", "batch_cooccurrence_terms", "batch_patterns_per_input",
+        "retrieval_cache_ttl", "log_sample_rate", "log_rate_limit"
+    })
+    
+    # Fields that only affect scheduling or logging, never cached results
+    _CACHE_NEUTRAL_KEYS = frozenset({
+        "cache_size", "retrieval_cache_ttl", "batch_parallel_threshold", "batch_max_workers",
+        "log_sample_rate", "log_rate_limit"
+    })
+    
     def __init__(self, config):
         super().__init__(config)
         
@@ -61,7 +83,14 @@ class SymbolicProcessor(BaseContextProcessor):
         self.induction_engine = InductionEngine(config)
         self.retrieval_engine = RetrievalEngine(config)
         
+        # Worker processes for large batches, started on first use and kept across batches
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_workers = 0
+        
         self.logger = logging.getLogger("SymbolicProcessor")
+        self.sampled_logger = SampledLogger(
+            self.logger, config.log_sample_rate, config.log_rate_limit
+        )
         self.logger.info("Princeton ICML symbolic processing framework initialized")
     
     async def process(self, content: str, context: Dict[str, Any]) -> ProcessingResult:
@@ -95,27 +124,250 @@ class SymbolicProcessor(BaseContextProcessor):
         content: str, 
         context: Dict[str, Any],
         abstraction_focus: str = "relationships",
-        induction_method: str = "pattern_recognition"
+        induction_method: str = "pattern_recognition",
+        context_features: Optional[ContextFeatures] = None
     ) -> SymbolicResult:
         """Execute three-stage symbolic processing"""
-        self.logger.debug("Starting three-stage symbolic processing")
+        self.sampled_logger.debug("Starting three-stage symbolic processing")
+        
+        symbolic_result = await self._run_stages(
+            content, context, abstraction_focus, induction_method,
+            context_features=context_features
+        )
+        
+        self.sampled_logger.info("✓ Three-stage symbolic processing completed")
+        
+        return symbolic_result
+    
+    async def three_stage_process_batch(
+        self,
+        contents: Sequence[str],
+        contexts: Optional[Sequence[Dict[str, Any]]] = None,
+        abstraction_focus: str = "relationships",
+        induction_method: str = "pattern_recognition"
+    ) -> List[SymbolicResult]:
+        """
+        Execute three-stage symbolic processing over a batch of inputs.
+        
+        All inputs are tokenized once against a shared vocabulary, and
+        co-occurrence across the batch is counted in a single vectorized
+        pass. Abstraction, induction and retrieval still run per input,
+        with no variable table shared across the batch. Batches at or
+        above batch_parallel_threshold are distributed across a process pool.
+        
+        Args:
+            contents: Content strings to process
+            contexts: Optional context per content item
+            abstraction_focus: Focus mode for symbol abstraction
+            induction_method: Method for symbolic induction
+            
+        Returns:
+            One SymbolicResult per content item, in input order
+        """
+        if contexts is None:
+            contexts = [{} for _ in contents]
+        if len(contexts) != len(contents):
+            raise ValueError(
+                f"Contexts length ({len(contexts)}) must match contents length ({len(contents)})"
+            )
+        
+        if not contents:
+            return []
+        
+        self.sampled_logger.debug("Starting batch symbolic processing of %d inputs", len(contents))
+        
+        # Shared tokenization and batch-level co-occurrence induction
+        token_lists = [self.abstraction_engine._tokenize_content(content) for content in contents]
+        batch_patterns = self._induce_batch_patterns(token_lists)
+        
+        items = [
+            (content, context, tokens, patterns)
+            for content, context, tokens, patterns in zip(contents, contexts, token_lists, batch_patterns)
+        ]
+        
+        results = None
+        if len(items) >= self.config.batch_parallel_threshold:
+            results = await self._process_items_in_pool(items, abstraction_focus, induction_method)
+        
+        if results is None:
+            results = await self._process_items(items, abstraction_focus, induction_method)
+        
+        self.sampled_logger.info("✓ Batch symbolic processing completed for %d inputs", len(results))
+        
+        return results
+    
+    async def _process_items(
+        self,
+        items: List[tuple],
+        abstraction_focus: str,
+        induction_method: str
+    ) -> List[SymbolicResult]:
+        """Run the three stages for prepared batch items in this process"""
+        results = []
+        for content, context, tokens, batch_patterns in items:
+            result = await self._run_stages(
+                content, context, abstraction_focus, induction_method,
+                tokens=tokens, batch_patterns=batch_patterns
+            )
+            results.append(result)
+        return results
+    
+    async def _process_items_in_pool(
+        self,
+        items: List[tuple],
+        abstraction_focus: str,
+        induction_method: str
+    ) -> Optional[List[SymbolicResult]]:
+        """Distribute prepared batch items across a process pool"""
+        max_workers = min(self._pool_size(), len(items))
+        if max_workers <= 1:
+            return None
+        
+        # Contiguous chunks keep results in input order when concatenated
+        chunk_size = -(-len(items) // max_workers)
+        chunks = [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+        
+        loop = asyncio.get_event_loop()
+        try:
+            pool = self._get_pool()
+            chunk_results = await asyncio.gather(*[
+                loop.run_in_executor(
+                    pool, _process_batch_chunk,
+                    self.config, chunk, abstraction_focus, induction_method
+                )
+                for chunk in chunks
+            ])
+        except Exception as e:
+            # Unpicklable contexts or a broken pool fall back to in-process execution
+            self.logger.warning(f"Process pool unavailable for batch processing: {e}")
+            if isinstance(e, BrokenProcessPool):
+                self._shutdown_pool()
+            return None
+        
+        return [result for chunk_result in chunk_results for result in chunk_result]
+    
+    def _pool_size(self) -> int:
+        """Number of worker processes for batch processing"""
+        return self.config.batch_max_workers or os.cpu_count() or 1
+    
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """Get the batch process pool, starting it on first use"""
+        if self._pool is None:
+            self._pool_workers = self._pool_size()
+            # Spawned workers do not inherit the event loop or logging threads, which fork would copy mid-state
+            self._pool = ProcessPoolExecutor(
+                max_workers=self._pool_workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._pool
+    
+    def _shutdown_pool(self):
+        """Stop the batch process pool; the next large batch starts a new one"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
+            self._pool_workers = 0
+    
+    def _induce_batch_patterns(self, token_lists: List[List[str]]) -> List[List[SymbolicPattern]]:
+        """Identify term co-occurrence patterns shared across the batch"""
+        batch_patterns = [[] for _ in token_lists]
+        batch_size = len(token_lists)
+        if batch_size < 2:
+            return batch_patterns
+        
+        # Encode every input against a shared vocabulary
+        vocabulary = {}
+        document_terms = [
+            np.unique(np.fromiter(
+                (vocabulary.setdefault(token, len(vocabulary)) for token in tokens),
+                dtype=np.int64, count=len(tokens)
+            ))
+            for tokens in token_lists
+        ]
+        if not vocabulary:
+            return batch_patterns
+        
+        rows = np.repeat(np.arange(batch_size), [len(terms) for terms in document_terms])
+        cols = np.concatenate(document_terms)
+        document_frequency = np.bincount(cols, minlength=len(vocabulary))
+        
+        # Restrict co-occurrence counting to the most widely shared terms
+        top_terms = np.argsort(-document_frequency, kind="stable")[:self.config.batch_cooccurrence_terms]
+        top_terms = top_terms[document_frequency[top_terms] >= 2]
+        if len(top_terms) < 2:
+            return batch_patterns
+        
+        term_columns = np.full(len(vocabulary), -1, dtype=np.int64)
+        term_columns[top_terms] = np.arange(len(top_terms))
+        selected = term_columns[cols] >= 0
+        
+        presence = np.zeros((batch_size, len(top_terms)), dtype=np.int32)
+        presence[rows[selected], term_columns[cols[selected]]] = 1
+        
+        # Term-by-term co-occurrence counts over the whole batch
+        cooccurrence = presence.T @ presence
+        first, second = np.triu_indices(len(top_terms), k=1)
+        pair_counts = cooccurrence[first, second]
+        
+        supported = pair_counts >= 2
+        first, second, pair_counts = first[supported], second[supported], pair_counts[supported]
+        if len(pair_counts) == 0:
+            return batch_patterns
+        
+        # Strongest pairs first, then fan back out to the inputs containing them
+        order = np.argsort(-pair_counts, kind="stable")
+        first, second, pair_counts = first[order], second[order], pair_counts[order]
+        pair_presence = (presence[:, first] & presence[:, second]).astype(bool)
+        
+        index_to_term = {index: term for term, index in vocabulary.items()}
+        
+        for batch_index in range(batch_size):
+            for pair_index in np.flatnonzero(pair_presence[batch_index])[:self.config.batch_patterns_per_input]:
+                term_a = index_to_term[int(top_terms[first[pair_index]])]
+                term_b = index_to_term[int(top_terms[second[pair_index]])]
+                support = int(pair_counts[pair_index])
+                
+                batch_patterns[batch_index].append(SymbolicPattern(
+                    id=f"batch_cooccurrence_{len(batch_patterns[batch_index])}",
+                    pattern=[term_a, term_b],
+                    rule="batch_cooccurrence",
+                    generalization=f"'{term_a}' and '{term_b}' co-occur across {support} batch inputs",
+                    confidence=min(0.9, 0.6 + 0.3 * support / batch_size)
+                ))
+        
+        return batch_patterns
+    
+    async def _run_stages(
+        self,
+        content: str,
+        context: Dict[str, Any],
+        abstraction_focus: str,
+        induction_method: str,
+        context_features: Optional[ContextFeatures] = None,
+        tokens: Optional[List[str]] = None,
+        batch_patterns: Optional[List[SymbolicPattern]] = None
+    ) -> SymbolicResult:
+        """Run abstraction, induction and retrieval for a single input"""
         
         # Stage 1: Symbol Abstraction
-        self.logger.debug("Stage 1: Symbol Abstraction")
+        self.sampled_logger.debug("Stage 1: Symbol Abstraction")
         abstraction_result = await self.abstraction_engine.abstract_symbols(
-            content, context, focus=abstraction_focus
+            content, context, focus=abstraction_focus,
+            context_features=context_features, tokens=tokens
         )
         
         # Stage 2: Symbolic Induction
-        self.logger.debug("Stage 2: Symbolic Induction")
+        self.sampled_logger.debug("Stage 2: Symbolic Induction")
         induction_result = await self.induction_engine.induce_patterns(
             abstraction_result.variables, content, method=induction_method
         )
+        if batch_patterns:
+            induction_result.patterns.extend(batch_patterns)
         
         # Stage 3: Retrieval and Concretization
-        self.logger.debug("Stage 3: Retrieval and Concretization")
+        self.sampled_logger.debug("Stage 3: Retrieval and Concretization")
         retrieval_result = await self.retrieval_engine.retrieve_concrete_solution(
-            induction_result.patterns, abstraction_result.variables, content, context
+            induction_result.patterns, abstraction_result.variables, content, context,
+            context_features=context_features
         )
         
         # Calculate overall confidence
@@ -126,8 +378,6 @@ class SymbolicProcessor(BaseContextProcessor):
         ]
         overall_confidence = sum(stage_confidences) / len(stage_confidences)
         
-        self.logger.info("✓ Three-stage symbolic processing completed")
-        
         return SymbolicResult(
             variables=abstraction_result.variables,
             patterns=induction_result.patterns,
@@ -136,14 +386,67 @@ class SymbolicProcessor(BaseContextProcessor):
             confidence=overall_confidence
         )
     
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get processing metrics including stage cache statistics"""
+        metrics = super().get_metrics()
+        metrics["cache_metrics"] = {
+            "abstraction_cache": self.abstraction_engine.abstraction_cache.get_stats(),
+            "pattern_cache": self.induction_engine.pattern_cache.get_stats(),
+            **self.retrieval_engine.get_cache_metrics()
+        }
+        return metrics
+    
+    def _on_config_change(self, key: str, value: Any):
+        """Update state derived from a changed config field"""
+        caches = [
+            self.abstraction_engine.abstraction_cache,
+            self.induction_engine.pattern_cache,
+            self.retrieval_engine.retrieval_cache,
+            self.retrieval_engine.strategy_cache
+        ]
+        
+        if key == "cache_size":
+            for cache in caches:
+                cache.resize(value)
+        elif key == "retrieval_cache_ttl":
+            self.retrieval_engine.retrieval_cache.ttl = value
+        elif key == "log_sample_rate":
+            self.sampled_logger.sample_rate = value
+        elif key == "log_rate_limit":
+            self.sampled_logger.rate_limit = value
+        elif key == "batch_max_workers":
+            if self._pool is not None and self._pool_size() != self._pool_workers:
+                self._shutdown_pool()
+        elif key not in self._CACHE_NEUTRAL_KEYS:
+            # Cached results were computed under the old settings
+            for cache in caches:
+                cache.clear()
+    
     def reset(self):
         """Reset symbolic processor state"""
         self.abstraction_engine.reset()
         self.induction_engine.reset()
         self.retrieval_engine.reset()
+        self._shutdown_pool()
         
         self.processing_count = 0
         self.total_processing_time = 0.0
         self.last_processing_time = 0.0
         
-        self.logger.info("Symbolic processor state reset")
\ No newline at end of file
+        self.logger.info("Symbolic processor state reset")
+
+_worker_processor: Optional[SymbolicProcessor] = None  # Per worker process
+
+def _process_batch_chunk(
+    config,
+    items: List[tuple],
+    abstraction_focus: str,
+    induction_method: str
+) -> List[SymbolicResult]:
+    """Process a chunk of prepared batch items in a worker process"""
+    global _worker_processor
+    # Pool workers outlive a batch, so keep their processor while the config is unchanged
+    if _worker_processor is None or _worker_processor.config != config:
+        _worker_processor = SymbolicProcessor(config)
+    processor = _worker_processor
+    return asyncio.run(processor._process_items(items, abstraction_focus, induction_method))
\ No newline at end of file
@@ -10,6 +10,9 @@ import asyncio
 from typing import Dict, List, Any, Optional, TYPE_CHECKING
 from dataclasses import dataclass
 
+from ..core.features import ContextFeatures
+from ..utils.cache import LRUCache, content_digest
+
 if TYPE_CHECKING:
     from .manager import SymbolicVariable, SymbolicPattern
 
@@ -26,27 +29,40 @@ class RetrievalEngine:
     
     def __init__(self, config):
         self.config = config
-        self.retrieval_cache = {}  # Cache for retrieval mappings
+        
+        # Cache for retrieval mappings keyed by (pattern signature, variable symbol, content key)
+        self.retrieval_cache = LRUCache(config.cache_size, ttl=config.retrieval_cache_ttl)
+        
+        # Cache for strategy selection keyed by pattern rules and variable count
+        self.strategy_cache = LRUCache(config.cache_size)
         
     async def retrieve_concrete_solution(
         self, 
         patterns: List['SymbolicPattern'], 
         variables: List['SymbolicVariable'],
         original_content: str,
-        context: Dict[str, Any]
+        context: Dict[str, Any],
+        context_features: Optional[ContextFeatures] = None
     ) -> RetrievalResult:
         """Retrieve concrete solution from symbolic patterns and variables"""
+        retrieval_scope = self._build_retrieval_scope(
+            variables, original_content, context, context_features
+        )
         
         # Determine optimal retrieval strategy
-        strategy = self._determine_retrieval_strategy(patterns, variables)
+        strategy_key = (tuple(pattern.rule for pattern in patterns), min(len(variables), 4))
+        strategy = self.strategy_cache.get(strategy_key)
+        if strategy is None:
+            strategy = self._determine_retrieval_strategy(patterns, variables)
+            self.strategy_cache.put(strategy_key, strategy)
         
         if strategy == "pattern_instantiation":
             return await self._pattern_instantiation_retrieval(
-                patterns, variables, original_content, context
+                patterns, variables, original_content, context, retrieval_scope
             )
         elif strategy == "variable_substitution":
             return await self._variable_substitution_retrieval(
-                patterns, variables, original_content, context
+                patterns, variables, original_content, context, retrieval_scope
             )
         elif strategy == "rule_application":
             return await self._rule_application_retrieval(
@@ -58,6 +74,35 @@ class RetrievalEngine:
                 patterns, variables, original_content, context
             )
     
+    def _build_retrieval_scope(
+        self, 
+        variables: List['SymbolicVariable'],
+        original_content: str,
+        context: Dict[str, Any],
+        context_features: Optional[ContextFeatures]
+    ) -> Dict[str, Any]:
+        """Build lookups shared by every mapping resolved for one retrieval"""
+        context_features = ContextFeatures.resolve(context, context_features)
+        
+        variables_by_symbol = {}
+        for variable in variables:
+            variables_by_symbol.setdefault(variable.symbol, variable)
+        
+        # Variables depend on abstraction focus, so they are part of the content key
+        variables_signature = [
+            (var.symbol, var.id, var.abstraction_level, var.relationships)
+            for var in variables
+        ]
+        
+        return {
+            "content_key": content_digest(
+                original_content, context_features.digest, variables_signature
+            ),
+            "content_tokens": set(original_content.lower().split()),
+            "context_features": context_features,
+            "variables_by_symbol": variables_by_symbol
+        }
+    
     def _determine_retrieval_strategy(
         self, 
         patterns: List['SymbolicPattern'], 
@@ -83,7 +128,8 @@ class RetrievalEngine:
         patterns: List['SymbolicPattern'], 
         variables: List['SymbolicVariable'],
         original_content: str,
-        context: Dict[str, Any]
+        context: Dict[str, Any],
+        retrieval_scope: Dict[str, Any]
     ) -> RetrievalResult:
         """Retrieve solution by instantiating patterns with concrete values"""
         
@@ -94,7 +140,7 @@ class RetrievalEngine:
         for pattern in patterns:
             # Create concrete instantiation of the pattern
             concrete_instance = await self._instantiate_pattern(
-                pattern, variables, original_content, context
+                pattern, variables, original_content, context, retrieval_scope
             )
             instantiated_patterns.append(concrete_instance)
             
@@ -125,7 +171,8 @@ class RetrievalEngine:
         patterns: List['SymbolicPattern'], 
         variables: List['SymbolicVariable'],
         original_content: str,
-        context: Dict[str, Any]
+        context: Dict[str, Any],
+        retrieval_scope: Dict[str, Any]
     ) -> RetrievalResult:
         """Retrieve solution by substituting variables with concrete values"""
         
@@ -134,7 +181,7 @@ class RetrievalEngine:
         
         for variable in variables:
             concrete_value = await self._resolve_variable_to_concrete(
-                variable, original_content, context
+                variable, original_content, context, retrieval_scope
             )
             variable_mappings[variable.symbol] = concrete_value
         
@@ -228,10 +275,19 @@ class RetrievalEngine:
         pattern: 'SymbolicPattern', 
         variables: List['SymbolicVariable'],
         original_content: str,
-        context: Dict[str, Any]
+        context: Dict[str, Any],
+        retrieval_scope: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Instantiate a symbolic pattern with concrete values"""
         
+        pattern_signature = (
+            pattern.id, pattern.rule, pattern.generalization, tuple(pattern.pattern)
+        )
+        cache_key = (pattern_signature, None, retrieval_scope["content_key"])
+        cached_instantiation = self.retrieval_cache.get(cache_key)
+        if cached_instantiation is not None:
+            return {**cached_instantiation, "mapping": dict(cached_instantiation["mapping"])}
+        
         instantiation = {
             "pattern_id": pattern.id,
             "rule": pattern.rule,
@@ -242,29 +298,48 @@ class RetrievalEngine:
         # Map symbolic elements to concrete elements
         for symbol in pattern.pattern:
             # Find corresponding variable
-            matching_var = next((v for v in variables if v.symbol == symbol), None)
+            matching_var = retrieval_scope["variables_by_symbol"].get(symbol)
             
             if matching_var:
                 # Get concrete representation of the variable
                 concrete_value = await self._resolve_variable_to_concrete(
-                    matching_var, original_content, context
+                    matching_var, original_content, context, retrieval_scope
                 )
                 instantiation["mapping"][symbol] = concrete_value
             else:
                 instantiation["mapping"][symbol] = symbol  # Keep as-is if no mapping
         
-        return instantiation
+        self.retrieval_cache.put(cache_key, instantiation)
+        
+        return {**instantiation, "mapping": dict(instantiation["mapping"])}
     
     async def _resolve_variable_to_concrete(
         self, 
         variable: 'SymbolicVariable',
         original_content: str,
-        context: Dict[str, Any]
+        context: Dict[str, Any],
+        retrieval_scope: Dict[str, Any]
     ) -> str:
         """Resolve an abstract variable to its concrete value"""
         
+        cache_key = (None, variable.symbol, retrieval_scope["content_key"])
+        concrete_value = self.retrieval_cache.get(cache_key)
+        if concrete_value is None:
+            concrete_value = self._compute_concrete_value(variable, context, retrieval_scope)
+            self.retrieval_cache.put(cache_key, concrete_value)
+        
+        return concrete_value
+    
+    def _compute_concrete_value(
+        self, 
+        variable: 'SymbolicVariable',
+        context: Dict[str, Any],
+        retrieval_scope: Dict[str, Any]
+    ) -> str:
+        """Compute the concrete value of a variable from content and context tokens"""
+        
         # Strategy 1: Look for concrete terms in original content that match variable relationships
-        content_tokens = original_content.lower().split()
+        content_tokens = retrieval_scope["content_tokens"]
         
         # Find tokens that might correspond to this variable
         for relationship in variable.relationships:
@@ -275,8 +350,7 @@ class RetrievalEngine:
         
         # Strategy 2: Use context information
         if context:
-            context_text = ' '.join(str(v) for v in context.values()).lower()
-            context_tokens = context_text.split()
+            context_tokens = retrieval_scope["context_features"].tokens
             
             for relationship in variable.relationships:
                 rel_terms = relationship.split('_')
@@ -464,4 +538,12 @@ class RetrievalEngine:
     
     def reset(self):
         """Reset retrieval engine state"""
-        self.retrieval_cache = {}
\ No newline at end of file
+        self.retrieval_cache.clear()
+        self.strategy_cache.clear()
+    
+    def get_cache_metrics(self) -> Dict[str, Any]:
+        """Get retrieval and strategy cache statistics"""
+        return {
+            "retrieval_cache": self.retrieval_cache.get_stats(),
+            "strategy_cache": self.strategy_cache.get_stats()
+        }
\ No newline at end of file
@@ -6,14 +6,22 @@ Common utilities and helpers for the contextual engine including
 logging, performance monitoring, configuration management, and validation.
 """
 
-from .logger import ContextualLogger
+from .logger import ContextualLogger, LoggingPipeline, SampledLogger
 from .monitor import PerformanceMonitor
-from .config import ConfigManager
-from .validation import ValidationUtils
+from .config import ConfigManager, ConfigFileWatcher
+from .validation import ValidationUtils, ContextValidator
+from .cache import LRUCache
+from .static import StaticAsset
 
 __all__ = [
     'ContextualLogger',
+    'LoggingPipeline',
+    'SampledLogger',
     'PerformanceMonitor',
     'ConfigManager', 
-    'ValidationUtils'
+    'ConfigFileWatcher',
+    'ValidationUtils',
+    'ContextValidator',
+    'LRUCache',
+    'StaticAsset'
 ]
\ No newline at end of file
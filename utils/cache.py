@@ -0,0 +1,119 @@
+"""
+Cache Utilities - Bounded Caches for Context Engineering
+========================================================
+
+Provides bounded, least-recently-used caches and stable content digests
+used by components to memoize repeated processing work.
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+def content_digest(*parts: Any) -> str:
+    """Create a stable digest from one or more content parts"""
+    hasher = hashlib.sha1()
+    for part in parts:
+        hasher.update(str(part).encode("utf-8", "surrogatepass"))
+        hasher.update(b"\x1f")  # Separator so ("ab", "c") != ("a", "bc")
+    return hasher.hexdigest()
+
+class LRUCache:
+    """Bounded mapping that evicts the least recently used entries"""
+
+    def __init__(
+        self,
+        max_size: int = 128,
+        ttl: Optional[float] = None,
+        max_bytes: Optional[int] = None,
+        sizeof: Optional[Callable[[Any], int]] = None
+    ):
+        self.max_size = max(1, max_size)
+        self.ttl = ttl  # Seconds before an entry expires, None for no expiry
+        self.max_bytes = max_bytes  # Total size budget, None for no budget
+        self.sizeof = sizeof or (lambda value: 0)
+        self.total_bytes = 0
+        self._entries = OrderedDict()  # key -> (value, expiry time, size)
+
+        # Counters
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Get a cached value and mark it as recently used"""
+        entry = self._entries.get(key)
+        if entry is not None:
+            value, expires_at, size = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                self.total_bytes -= size
+                self.expirations += 1
+            else:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+
+        self.misses += 1
+        return default
+
+    def put(self, key: Hashable, value: Any):
+        """Store a value, evicting the oldest entries beyond capacity"""
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        size = self.sizeof(value) if self.max_bytes is not None else 0
+        if self.max_bytes is not None and size > self.max_bytes:
+            return  # Never admit an entry larger than the whole budget
+
+        if key in self._entries:
+            self.total_bytes -= self._entries[key][2]
+            self._entries.move_to_end(key)
+        self._entries[key] = (value, expires_at, size)
+        self.total_bytes += size
+        self._evict_overflow()
+
+    def resize(self, max_size: int):
+        """Change capacity, evicting the oldest entries if it shrinks"""
+        self.max_size = max(1, max_size)
+        self._evict_overflow()
+
+    def _evict_overflow(self):
+        """Evict least recently used entries until within capacity"""
+        while len(self._entries) > self.max_size or (
+            self.max_bytes is not None and self.total_bytes > self.max_bytes
+        ):
+            _, (_, _, evicted_size) = self._entries.popitem(last=False)
+            self.total_bytes -= evicted_size
+            self.evictions += 1
+
+    def clear(self):
+        """Remove all entries and reset counters"""
+        self._entries.clear()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache usage statistics"""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl": self.ttl,
+            "bytes": self.total_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_rate": self.hits / lookups if lookups > 0 else 0.0
+        }
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
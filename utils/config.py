@@ -7,9 +7,12 @@ for all context engineering components.
 """
 
 import os
+import copy
 import json
 import yaml
-from typing import Dict, List, Any, Optional, Union
+import asyncio
+import logging
+from typing import Dict, List, Any, Optional, Union, Callable, Tuple
 from pathlib import Path
 
 class ConfigManager:
@@ -18,7 +21,7 @@ class ConfigManager:
     def __init__(self, config_path: Optional[str] = None):
         self.config_path = config_path
         self._config = {}
-        self._config_watchers = []
+        self._config_watchers: List[Tuple[Callable, Optional[str]]] = []
         
         # Load default configuration
         self._load_default_config()
@@ -47,7 +50,23 @@ class ConfigManager:
                     "understand", "extract", "highlight", "apply", "validate"
                 ],
                 "max_tool_depth": 5,
-                "parallel_processing": True
+                "parallel_processing": True,
+                "max_parallel_tools": 4,
+                "batch_max_size": 16,
+                "batch_max_wait_ms": 5.0,
+                "max_concurrent_batches": 8,
+                "backend_pool_size": 8,
+                "retry_backoff": 0.2,
+                "tool_timeout": 30.0,
+                "hedged_execution": True,
+                "hedge_percentile": 0.95,
+                "hedge_min_samples": 20,
+                "result_cache_enabled": True,
+                "result_cache_size": 512,
+                "result_cache_max_bytes": 16 * 1024 * 1024,
+                "result_cache_path": None,
+                "prompt_max_tokens": 2000,
+                "prompt_max_field_chars": 1000
             },
             "neural_fields": {
                 "enabled": True,
@@ -57,7 +76,9 @@ class ConfigManager:
                 "resonance_bandwidth": 0.6,
                 "attractor_formation_threshold": 0.7,
                 "max_attractors": 10,
-                "field_dimensions": 512
+                "field_dimensions": 512,
+                "log_sample_rate": 1.0,
+                "log_rate_limit": 20.0
             },
             "memory": {
                 "enabled": True,
@@ -66,7 +87,9 @@ class ConfigManager:
                 "efficiency_target": 0.8,
                 "retention_strategy": "reasoning_value",
                 "compression_method": "semantic_similarity",
-                "persistence_enabled": True
+                "persistence_enabled": True,
+                "log_sample_rate": 1.0,
+                "log_rate_limit": 20.0
             },
             "symbolic_processing": {
                 "enabled": True,
@@ -74,7 +97,19 @@ class ConfigManager:
                 "induction_method": "pattern_recognition",
                 "retrieval_strategy": "best_match",
                 "symbolic_validation": True,
-                "generalization_enabled": True
+                "generalization_enabled": True,
+                "cache_size": 256,
+                "bounded_induction": False,
+                "max_pattern_length": 32,
+                "max_candidate_patterns": 64,
+                "min_pattern_confidence": 0.75,
+                "batch_parallel_threshold": 64,
+                "batch_max_workers": 0,
+                "batch_cooccurrence_terms": 32,
+                "batch_patterns_per_input": 5,
+                "retrieval_cache_ttl": 300.0,
+                "log_sample_rate": 1.0,
+                "log_rate_limit": 20.0
             },
             "quantum_semantics": {
                 "enabled": True,
@@ -82,7 +117,14 @@ class ConfigManager:
                 "uncertainty_handling": "bayesian",
                 "superposition_threshold": 0.3,
                 "measurement_strategy": "context_collapse",
-                "degeneracy_management": True
+                "degeneracy_management": True,
+                "semantic_perspectives": [
+                    "literal_meaning", "metaphorical_meaning", "contextual_meaning",
+                    "inferential_meaning", "pragmatic_meaning"
+                ],
+                "superposition_cache_size": 256,
+                "measurement_seed": 0,
+                "measurement_history_size": 1000
             },
             "progressive_complexity": {
                 "enabled": True,
@@ -92,7 +134,29 @@ class ConfigManager:
                     "atom", "molecule", "cell", "organ", "neural_system", "neural_field"
                 ],
                 "scaling_strategy": "adaptive",
-                "efficiency_monitoring": True
+                "efficiency_monitoring": True,
+                "assessment_cache_size": 512,
+                "adaptive_routing": False,
+                "routing_exploration": 0.1,
+                "routing_latency_weight": 0.1,
+                "routing_coverage_weight": 0.3,
+                "phase_plans": {
+                    "atom": ["memory_consolidation", "field_updates"],
+                    "molecule": ["memory_retrieval", "memory_consolidation", "field_updates"],
+                    "cell": ["memory_retrieval", "symbolic_processing", "memory_consolidation", "field_updates"],
+                    "organ": [
+                        "memory_retrieval", "quantum_semantic_interpretation", "symbolic_processing",
+                        "memory_consolidation", "field_updates"
+                    ],
+                    "neural_system": [
+                        "memory_retrieval", "neural_field_processing", "quantum_semantic_interpretation",
+                        "symbolic_processing", "memory_consolidation", "field_updates"
+                    ],
+                    "neural_field": [
+                        "memory_retrieval", "neural_field_processing", "quantum_semantic_interpretation",
+                        "symbolic_processing", "memory_consolidation", "field_updates"
+                    ]
+                }
             },
             "logging": {
                 "level": "INFO",
@@ -114,6 +178,14 @@ class ConfigManager:
     
     def load_config_from_file(self, config_path: str):
         """Load configuration from file"""
+        file_config = self.read_config_file(config_path)
+        
+        # Merge file config with default config
+        self._deep_merge_config(self._config, file_config)
+    
+    @staticmethod
+    def read_config_file(config_path: str) -> Dict[str, Any]:
+        """Parse a JSON or YAML configuration file"""
         config_file = Path(config_path)
         
         if not config_file.exists():
@@ -127,12 +199,14 @@ class ConfigManager:
                     file_config = yaml.safe_load(f)
                 else:
                     raise ValueError(f"Unsupported configuration file format: {config_file.suffix}")
-            
-            # Merge file config with default config
-            self._deep_merge_config(self._config, file_config)
-            
         except Exception as e:
             raise ValueError(f"Error loading configuration file: {e}")
+        
+        if file_config is None:
+            return {}
+        if not isinstance(file_config, dict):
+            raise ValueError(f"Configuration file must contain a mapping: {config_path}")
+        return file_config
     
     def load_config_from_env(self, prefix: str = "CONTEXTUAL_"):
         """Load configuration from environment variables"""
@@ -232,28 +306,69 @@ class ConfigManager:
         # Notify watchers
         self._notify_config_change(key_path, value)
     
-    def validate_config(self) -> Dict[str, List[str]]:
-        """Validate current configuration"""
+    def merged_config(self, overrides: Dict[str, Any]) -> Dict[str, Any]:
+        """Get a copy of the current configuration with overrides deep-merged in"""
+        candidate = copy.deepcopy(self._config)
+        self._deep_merge_config(candidate, copy.deepcopy(overrides))
+        return candidate
+    
+    def replace_config(
+        self,
+        new_config: Dict[str, Any],
+        notify: bool = True,
+        validate: bool = True
+    ) -> List[str]:
+        """Swap in a complete configuration, notifying watchers once per changed key"""
+        candidate = copy.deepcopy(new_config)
+        if validate:
+            errors = self.validate_config(candidate)
+            if errors:
+                raise ValueError(f"Invalid configuration: {errors}")
+        
+        changes = self._diff_config(self._config, candidate)
+        self._config = candidate
+        
+        if notify:
+            for key_path, value in changes:
+                self._notify_config_change(key_path, value)
+        
+        return [key_path for key_path, _ in changes]
+    
+    def _diff_config(self, old: Dict, new: Dict, prefix: str = "") -> List[Tuple[str, Any]]:
+        """List changed keys down to section.key depth"""
+        changes = []
+        for key in list(old) + [key for key in new if key not in old]:
+            key_path = f"{prefix}{key}"
+            old_value, new_value = old.get(key), new.get(key)
+            if not prefix and isinstance(old_value, dict) and isinstance(new_value, dict):
+                changes.extend(self._diff_config(old_value, new_value, f"{key_path}."))
+            elif old_value != new_value or (key in old) != (key in new):
+                changes.append((key_path, new_value))
+        return changes
+    
+    def validate_config(self, config: Optional[Dict[str, Any]] = None) -> Dict[str, List[str]]:
+        """Validate current configuration, or a candidate configuration if given"""
+        config = self._config if config is None else config
         errors = {}
         
         # Validate engine config
-        engine_errors = self._validate_engine_config()
+        engine_errors = self._validate_engine_config(config)
         if engine_errors:
             errors["engine"] = engine_errors
         
         # Validate component configs
         for component in ["cognitive_tools", "neural_fields", "memory", 
                          "symbolic_processing", "quantum_semantics", "progressive_complexity"]:
-            component_errors = self._validate_component_config(component)
+            component_errors = self._validate_component_config(component, config)
             if component_errors:
                 errors[component] = component_errors
         
         return errors
     
-    def _validate_engine_config(self) -> List[str]:
+    def _validate_engine_config(self, config: Dict[str, Any]) -> List[str]:
         """Validate engine configuration"""
         errors = []
-        engine_config = self._config.get("engine", {})
+        engine_config = config.get("engine", {})
         
         # Validate model provider
         valid_providers = ["openai", "anthropic", "local"]
@@ -272,10 +387,12 @@ class ConfigManager:
         
         return errors
     
-    def _validate_component_config(self, component: str) -> List[str]:
+    def _validate_component_config(self, component: str, config: Dict[str, Any]) -> List[str]:
         """Validate component configuration"""
         errors = []
-        component_config = self._config.get(component, {})
+        component_config = config.get(component, {})
+        if not isinstance(component_config, dict):
+            return [f"{component} must be a mapping"]
         
         # Check if enabled is boolean
         if "enabled" in component_config:
@@ -293,25 +410,44 @@ class ConfigManager:
             if not isinstance(memory_budget, int) or memory_budget <= 0:
                 errors.append("memory.memory_budget must be a positive integer")
         
+        elif component == "symbolic_processing":
+            cache_size = component_config.get("cache_size", 256)
+            if not isinstance(cache_size, int) or cache_size <= 0:
+                errors.append("symbolic_processing.cache_size must be a positive integer")
+        
+        elif component == "quantum_semantics":
+            for key in ("superposition_cache_size", "measurement_history_size"):
+                size = component_config.get(key, 1)
+                if not isinstance(size, int) or size <= 0:
+                    errors.append(f"quantum_semantics.{key} must be a positive integer")
+        
         elif component == "progressive_complexity":
             performance_threshold = component_config.get("performance_threshold", 0.85)
             if not isinstance(performance_threshold, (int, float)) or not 0 <= performance_threshold <= 1:
                 errors.append("progressive_complexity.performance_threshold must be between 0 and 1")
+            
+            assessment_cache_size = component_config.get("assessment_cache_size", 512)
+            if not isinstance(assessment_cache_size, int) or assessment_cache_size <= 0:
+                errors.append("progressive_complexity.assessment_cache_size must be a positive integer")
         
         return errors
     
-    def add_config_watcher(self, callback):
-        """Add configuration change watcher"""
-        self._config_watchers.append(callback)
+    def add_config_watcher(self, callback, key_prefix: Optional[str] = None):
+        """Add configuration change watcher, optionally only for keys under a prefix"""
+        self._config_watchers.append((callback, key_prefix))
     
     def remove_config_watcher(self, callback):
         """Remove configuration change watcher"""
-        if callback in self._config_watchers:
-            self._config_watchers.remove(callback)
+        self._config_watchers = [
+            (watcher, key_prefix) for watcher, key_prefix in self._config_watchers
+            if watcher != callback
+        ]
     
     def _notify_config_change(self, key_path: str, value: Any):
         """Notify watchers of configuration change"""
-        for watcher in self._config_watchers:
+        for watcher, key_prefix in list(self._config_watchers):
+            if key_prefix and not key_path.startswith(key_prefix):
+                continue
             try:
                 watcher(key_path, value)
             except Exception as e:
@@ -339,8 +475,10 @@ class ConfigManager:
         self._config.clear()
         self._load_default_config()
         
-        # Notify watchers
-        for watcher in self._config_watchers:
+        # Notify watchers; prefixed watchers only follow individual keys
+        for watcher, key_prefix in list(self._config_watchers):
+            if key_prefix:
+                continue
             try:
                 watcher("*", self._config)  # Special key for full reset
             except Exception as e:
@@ -358,4 +496,70 @@ class ConfigManager:
         self._deep_merge_config(self._config[component], updates)
         
         # Notify watchers
-        self._notify_config_change(f"{component}.*", updates)
\ No newline at end of file
+        self._notify_config_change(f"{component}.*", updates)
+
+
+class ConfigFileWatcher:
+    """Polls a JSON or YAML configuration file and reloads it when it changes"""
+    
+    def __init__(
+        self,
+        config_path: str,
+        on_reload: Callable[[Dict[str, Any]], Any],
+        interval: float = 1.0,
+        initial_load: bool = False
+    ):
+        self.config_path = Path(config_path)
+        self.on_reload = on_reload  # Raises to reject a configuration
+        self.interval = interval
+        self.reload_count = 0
+        self.error_count = 0
+        self._signature = None if initial_load else self._get_signature()
+        self._task: Optional[asyncio.Task] = None
+        self.logger = logging.getLogger("ConfigFileWatcher")
+    
+    def _get_signature(self) -> Optional[Tuple[int, int]]:
+        """Get the modification time and size of the watched file"""
+        try:
+            stat = os.stat(self.config_path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+    
+    def check(self) -> bool:
+        """Reload the file if it changed since the last check"""
+        signature = self._get_signature()
+        if signature is None or signature == self._signature:
+            return False
+        self._signature = signature
+        
+        # A half-written or invalid file leaves the running configuration
+        # untouched; the next write changes the signature and is retried
+        try:
+            file_config = ConfigManager.read_config_file(str(self.config_path))
+            self.on_reload(file_config)
+        except Exception as e:
+            self.error_count += 1
+            self.logger.warning(f"Configuration reload failed, keeping current configuration: {e}")
+            return False
+        
+        self.reload_count += 1
+        self.logger.info(f"Configuration reloaded from {self.config_path}")
+        return True
+    
+    def start(self):
+        """Start polling in the running event loop"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._poll())
+    
+    def stop(self):
+        """Stop polling"""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+    
+    async def _poll(self):
+        """Check the file every interval"""
+        while True:
+            await asyncio.sleep(self.interval)
+            self.check()
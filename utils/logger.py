@@ -3,15 +3,199 @@ Contextual Logger - Enhanced Logging for Context Engineering
 ============================================================
 
 Provides structured logging capabilities with context-aware features
-and integration with all context engineering components.
+and integration with all context engineering components. Records are
+handed to a shared queue and formatted and written by a background
+listener thread, so logging never blocks request processing.
 """
 
+import atexit
 import logging
+import logging.handlers
 import json
+import queue
+import random
+import threading
 import time
+from collections import Counter, deque
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from .cache import LRUCache
+
+PERFORMANCE_LOG_LIMIT = 1000
+
+def serialize_context(context: Dict[str, Any]) -> str:
+    """Serialize a log context compactly, using orjson when available"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(context, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits; fall back to the stdlib encoder
+    return json.dumps(context, default=str, separators=(',', ':'))
+
+class ContextMessage:
+    """Log message with a serialized context, joined only when the record is formatted"""
+    
+    __slots__ = ("message", "serialized_context")
+    
+    def __init__(self, message: str, serialized_context: str):
+        self.message = message
+        self.serialized_context = serialized_context
+    
+    def __str__(self) -> str:
+        return f"{self.message} | Context: {self.serialized_context}"
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that leaves message formatting to the listener thread"""
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+class LoggingPipeline:
+    """Shared queue and listener thread that write log records off the caller's thread"""
+    
+    _lock = threading.Lock()
+    _handler: Optional[DeferredQueueHandler] = None
+    _listener: Optional[logging.handlers.QueueListener] = None
+    
+    @classmethod
+    def get_handler(cls) -> DeferredQueueHandler:
+        """Get the shared queue handler, starting the listener on first use"""
+        with cls._lock:
+            if cls._handler is None:
+                # An unbounded queue keeps put() from ever blocking the caller
+                record_queue = queue.SimpleQueue()
+                stream_handler = logging.StreamHandler()
+                stream_handler.setFormatter(logging.Formatter(
+                    '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+                ))
+                
+                cls._handler = DeferredQueueHandler(record_queue)
+                cls._listener = logging.handlers.QueueListener(
+                    record_queue, stream_handler, respect_handler_level=True
+                )
+                cls._listener.start()
+                atexit.register(cls.shutdown)
+            return cls._handler
+    
+    @classmethod
+    def shutdown(cls):
+        """Flush queued records and stop the listener thread"""
+        with cls._lock:
+            if cls._listener is not None:
+                cls._listener.stop()
+                cls._listener = None
+                cls._handler = None
+
+class SampledLogger:
+    """
+    Logger for hot paths that samples and rate limits debug and info lines.
+    
+    Messages take %-style arguments so formatting is deferred until a line
+    is emitted, and the message format identifies the call site for rate
+    limiting. Warnings and errors are always emitted.
+    """
+    
+    def __init__(
+        self,
+        logger: logging.Logger,
+        sample_rate: float = 1.0,
+        rate_limit: float = 0.0,
+        seed: Optional[int] = None,
+        max_sites: int = 1024
+    ):
+        self.logger = logger
+        self.sample_rate = sample_rate
+        self.rate_limit = rate_limit  # Lines per second per call site, 0 for unlimited
+        self.max_sites = max_sites
+        self._random = random.Random(seed)
+        self._buckets = LRUCache(max_sites)  # call site -> [tokens, last refill time]
+        
+        # Drop metrics
+        self.emitted = 0
+        self.sampled_out = 0
+        self.rate_limited = 0
+        self.dropped_by_site = Counter()
+    
+    def debug(self, message: str, *args, **kwargs):
+        """Debug level logging, sampled and rate limited"""
+        self.log(logging.DEBUG, message, *args, **kwargs)
+    
+    def info(self, message: str, *args, **kwargs):
+        """Info level logging, sampled and rate limited"""
+        self.log(logging.INFO, message, *args, **kwargs)
+    
+    def warning(self, message: str, *args, **kwargs):
+        """Warning level logging"""
+        self.log(logging.WARNING, message, *args, **kwargs)
+    
+    def error(self, message: str, *args, **kwargs):
+        """Error level logging"""
+        self.log(logging.ERROR, message, *args, **kwargs)
+    
+    def log(self, level: int, message: str, *args, **kwargs):
+        """Log a line unless the level is disabled or it is sampled or rate limited out"""
+        if not self.logger.isEnabledFor(level):
+            return
+        
+        if level < logging.WARNING:
+            if self.sample_rate < 1.0 and self._random.random() >= self.sample_rate:
+                self.sampled_out += 1
+                self._record_drop(message)
+                return
+            
+            if self.rate_limit > 0 and not self._acquire(message):
+                self.rate_limited += 1
+                self._record_drop(message)
+                return
+        
+        self.emitted += 1
+        self.logger.log(level, message, *args, **kwargs)
+    
+    def _acquire(self, site: str) -> bool:
+        """Take a token from the call site's bucket"""
+        now = time.monotonic()
+        capacity = max(1.0, self.rate_limit)
+        bucket = self._buckets.get(site)
+        if bucket is None:
+            bucket = [capacity, now]
+            self._buckets.put(site, bucket)
+        
+        tokens = min(capacity, bucket[0] + (now - bucket[1]) * self.rate_limit)
+        bucket[1] = now
+        if tokens < 1.0:
+            bucket[0] = tokens
+            return False
+        
+        bucket[0] = tokens - 1.0
+        return True
+    
+    def _record_drop(self, site: str):
+        """Count a dropped line, folding sites beyond max_sites together"""
+        if site not in self.dropped_by_site and len(self.dropped_by_site) >= self.max_sites:
+            site = "<other>"
+        self.dropped_by_site[site] += 1
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get emitted and dropped line counts"""
+        return {
+            "emitted": self.emitted,
+            "sampled_out": self.sampled_out,
+            "rate_limited": self.rate_limited,
+            "dropped_by_site": dict(self.dropped_by_site.most_common(20))
+        }
+    
+    def __getattr__(self, name: str) -> Any:
+        # Delegate the rest of the logging.Logger interface, e.g. setLevel
+        if name.startswith("_") or name == "logger":
+            raise AttributeError(name)
+        return getattr(self.logger, name)
+
 class ContextualLogger:
     """Enhanced logger with contextual awareness and structured logging"""
     
@@ -20,19 +204,12 @@ class ContextualLogger:
         self.logger = logging.getLogger(f"ContextualEngine.{name}")
         self.logger.setLevel(getattr(logging, level.upper()))
         
-        # Create formatter for structured logging
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-        
-        # Add console handler if not already present
+        # Route records through the shared non-blocking pipeline
         if not self.logger.handlers:
-            handler = logging.StreamHandler()
-            handler.setFormatter(formatter)
-            self.logger.addHandler(handler)
+            self.logger.addHandler(LoggingPipeline.get_handler())
         
         self.context_stack = []
-        self.performance_logs = []
+        self.performance_logs = deque(maxlen=PERFORMANCE_LOG_LIMIT)
     
     def push_context(self, context: Dict[str, Any]):
         """Push a context onto the context stack"""
@@ -75,19 +252,20 @@ class ContextualLogger:
     
     def _log_with_context(self, level: int, message: str, context: Optional[Dict[str, Any]]):
         """Internal method to log with context"""
+        if not self.logger.isEnabledFor(level):
+            return
+        
         # Combine provided context with current context
         full_context = self.get_current_context().copy()
         if context:
             full_context.update(context)
         
-        # Format message with context
+        # Snapshot the context now: the caller may mutate nested values before
+        # the listener thread formats the record
         if full_context:
-            context_str = json.dumps(full_context, default=str, separators=(',', ':'))
-            formatted_message = f"{message} | Context: {context_str}"
+            self.logger.log(level, ContextMessage(message, serialize_context(full_context)))
         else:
-            formatted_message = message
-        
-        self.logger.log(level, formatted_message)
+            self.logger.log(level, message)
     
     def log_performance(
         self, 
@@ -103,12 +281,11 @@ class ContextualLogger:
             "metadata": metadata or {}
         }
         
+        # The bounded deque keeps only recent performance logs
         self.performance_logs.append(performance_record)
         
-        # Keep only recent performance logs
-        if len(self.performance_logs) > 1000:
-            self.performance_logs = self.performance_logs[-1000:]
-        
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         self.info(
             f"Performance: {operation} completed in {duration:.3f}s",
             {"performance_data": performance_record}
@@ -123,6 +300,9 @@ class ContextualLogger:
         metadata: Optional[Dict[str, Any]] = None
     ):
         """Log reasoning steps for traceability"""
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+        
         reasoning_record = {
             "step": step,
             "input_preview": str(input_data)[:100] + "..." if len(str(input_data)) > 100 else str(input_data),
@@ -145,6 +325,9 @@ class ContextualLogger:
         data_summary: str
     ):
         """Log interactions between components"""
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+        
         interaction_record = {
             "from_component": component_from,
             "to_component": component_to,
@@ -212,6 +395,6 @@ class ContextualLogger:
     
     def clear_logs(self):
         """Clear performance logs"""
-        self.performance_logs = []
+        self.performance_logs.clear()
         self.context_stack = []
         self.info("Logs cleared")
\ No newline at end of file
@@ -0,0 +1,133 @@
+"""
+Static Assets - Precompressed, Cacheable Pages
+==============================================
+
+Holds pages that are rendered once at startup together with their gzip
+and (when the brotli package is installed) brotli encodings, and answers
+requests for them with strong ETags, Cache-Control and 304 revalidation.
+"""
+
+import gzip
+import hashlib
+from typing import Dict, List, Any, Optional, Tuple, Union
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+DEFAULT_CACHE_CONTROL = "public, max-age=300"
+
+def parse_accept_encoding(header: Optional[str]) -> Dict[str, float]:
+    """Map each coding in an Accept-Encoding header to its q-value"""
+    codings = {}
+    for item in (header or "").split(","):
+        coding, _, params = item.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        codings[coding] = quality
+    return codings
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    return False
+
+class StaticAsset:
+    """An in-memory page with precomputed encodings and validators"""
+
+    # Preferred encodings, best first; identity is always available
+    ENCODINGS = ("br", "gzip")
+
+    def __init__(
+        self,
+        content: Union[str, bytes],
+        content_type: str = "text/html; charset=utf-8",
+        cache_control: str = DEFAULT_CACHE_CONTROL,
+        min_compress_size: int = 512
+    ):
+        body = content.encode("utf-8") if isinstance(content, str) else content
+        self.content_type = content_type
+        self.cache_control = cache_control
+
+        digest = hashlib.sha256(body).hexdigest()[:32]
+        self.variants: Dict[str, Tuple[bytes, str]] = {"identity": (body, f'"{digest}"')}
+
+        if len(body) >= min_compress_size:
+            encoded = {"gzip": gzip.compress(body, compresslevel=9, mtime=0)}
+            if brotli is not None:
+                encoded["br"] = brotli.compress(body, quality=11)
+
+            for encoding, data in encoded.items():
+                # Each encoding is a distinct representation, so it gets its own strong ETag
+                if len(data) < len(body):
+                    self.variants[encoding] = (data, f'"{digest}-{encoding}"')
+
+    @property
+    def size(self) -> int:
+        """Uncompressed size in bytes"""
+        return len(self.variants["identity"][0])
+
+    def select_encoding(self, accept_encoding: Optional[str]) -> str:
+        """Choose the best available encoding the client accepts"""
+        accepted = parse_accept_encoding(accept_encoding)
+        wildcard = accepted.get("*", 0.0)
+
+        best, best_quality = "identity", 0.0
+        for encoding in self.ENCODINGS:
+            if encoding not in self.variants:
+                continue
+            quality = accepted.get(encoding, wildcard)
+            if quality > best_quality:
+                best, best_quality = encoding, quality
+        return best
+
+    def respond(
+        self,
+        method: str = "GET",
+        accept_encoding: Optional[str] = None,
+        if_none_match: Optional[str] = None
+    ) -> Tuple[int, List[Tuple[str, str]], bytes]:
+        """Get the status, headers and body answering a GET or HEAD request"""
+        encoding = self.select_encoding(accept_encoding)
+        body, etag = self.variants[encoding]
+
+        headers = [
+            ("ETag", etag),
+            ("Cache-Control", self.cache_control),
+            ("Vary", "Accept-Encoding")
+        ]
+        if etag_matches(if_none_match, etag):
+            return 304, headers, b""
+
+        headers.append(("Content-Type", self.content_type))
+        headers.append(("Content-Length", str(len(body))))
+        if encoding != "identity":
+            headers.append(("Content-Encoding", encoding))
+        return 200, headers, (b"" if method.upper() == "HEAD" else body)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get the size of each stored encoding"""
+        return {
+            "content_type": self.content_type,
+            "encodings": {encoding: len(data) for encoding, (data, _) in self.variants.items()}
+        }
@@ -8,84 +8,272 @@ and internal data structures.
 
 import re
 import json
+import math
+import time
+from json.encoder import encode_basestring_ascii
 from typing import Dict, List, Any, Optional, Union, Tuple
 from dataclasses import is_dataclass
 
+from .cache import LRUCache
+
 class ValidationError(Exception):
     """Custom exception for validation errors"""
     pass
 
-class ValidationUtils:
-    """Validation utilities for context engineering"""
+def _scalar_json_length(value: Any) -> int:
+    """Length of a JSON scalar as json.dumps writes it"""
+    if value is None or value is True:
+        return 4  # null, true
+    if value is False:
+        return 5
+    if isinstance(value, float) and not math.isfinite(value):
+        return 3 if math.isnan(value) else len(repr(value)) + 5  # NaN, Infinity, -Infinity
+    return len(int.__repr__(value) if isinstance(value, int) else float.__repr__(value))
+
+def _is_immutable_text(value: Any) -> bool:
+    """Check for a str, bytes, or a tuple of them"""
+    if isinstance(value, tuple):
+        return all(type(item) in (str, bytes) for item in value)
+    return type(value) in (str, bytes)
+
+def estimate_json_size(value: Any, limit: int) -> int:
+    """
+    Measure the length of json.dumps(value, default=str) without building it.
     
-    @staticmethod
-    def validate_content_input(content: Any) -> Tuple[bool, List[str]]:
+    The walk stops as soon as the running size exceeds limit and returns that
+    partial size, so oversized values cost at most about limit characters of
+    work. Raises ValueError or TypeError where json.dumps would.
+    """
+    size = 0
+    stack = [(value, False)]
+    path = set()  # ids of containers being walked, for cycle detection
+    
+    while stack:
+        item, leaving = stack.pop()
+        if leaving:
+            path.discard(item)
+            continue
+        
+        if isinstance(item, str):
+            # Escaping only lengthens a string, so skip encoding hopeless ones
+            size += len(item) + 2
+            if size <= limit:
+                size += len(encode_basestring_ascii(item)) - len(item) - 2
+        elif item is None or isinstance(item, (bool, int, float)):
+            size += _scalar_json_length(item)
+        elif isinstance(item, (list, tuple, dict)):
+            if id(item) in path:
+                raise ValueError("Circular reference detected")
+            path.add(id(item))
+            stack.append((id(item), True))
+            
+            size += 2 + 2 * max(0, len(item) - 1)  # Brackets and ", " separators
+            if isinstance(item, dict):
+                for key, nested in item.items():
+                    if isinstance(key, str):
+                        key_text = key
+                    elif key is None or isinstance(key, (bool, int, float)):
+                        key_text = json.dumps(key)
+                    else:
+                        raise TypeError(f"keys must be str, int, float, bool or None, not {type(key).__name__}")
+                    size += len(encode_basestring_ascii(key_text)) + 2  # Key and ": "
+                    stack.append((nested, False))
+                    if size > limit:
+                        break
+            else:
+                stack.extend((nested, False) for nested in reversed(item))
+        else:
+            # json.dumps falls back to str() for other objects
+            stack.append((str(item), False))
+        
+        if size > limit:
+            return size
+    
+    return size
+
+class ContextValidator:
+    """
+    Context validator compiled from size limits.
+    
+    Value sizes are measured with a bounded walk and cached per value
+    object, so values shared across requests are measured once.
+    """
+    
+    def __init__(
+        self,
+        max_items: int = 100,
+        max_key_length: int = 100,
+        max_value_size: int = 10000,
+        max_content_length: int = 100000,
+        max_batch_size: int = 100,
+        cache_size: int = 1024
+    ):
+        self.max_items = max_items
+        self.max_key_length = max_key_length
+        self.max_value_size = max_value_size
+        self.max_content_length = max_content_length
+        self.max_batch_size = max_batch_size
+        self._value_sizes = LRUCache(cache_size)  # (type, length, hash) of an immutable value -> exceeds limit
+        
+        # Timing metrics
+        self.validations = 0
+        self.total_validation_time = 0.0
+    
+    def validate_content(self, content: Any) -> Tuple[bool, List[str]]:
         """Validate content input for processing"""
+        start_time = time.perf_counter()
+        errors = self._content_errors(content)
+        self._record_validation(start_time)
+        return len(errors) == 0, errors
+    
+    def validate_context(self, context: Any) -> Tuple[bool, List[str]]:
+        """Validate context input for processing"""
+        start_time = time.perf_counter()
+        errors = self._context_errors(context)
+        self._record_validation(start_time)
+        return len(errors) == 0, errors
+    
+    def validate_batch(
+        self, 
+        contents: List[Any], 
+        contexts: Optional[List[Any]] = None
+    ) -> Tuple[bool, List[str]]:
+        """Validate batch processing inputs in a single pass"""
+        start_time = time.perf_counter()
         errors = []
         
-        # Check if content exists
-        if content is None:
-            errors.append("Content cannot be None")
+        if not isinstance(contents, list):
+            errors.append(f"Contents must be list, got: {type(contents)}")
+        elif len(contents) == 0:
+            errors.append("Contents list cannot be empty")
+        
+        if errors:
+            self._record_validation(start_time)
             return False, errors
         
-        # Convert to string if not already
+        if len(contents) > self.max_batch_size:
+            errors.append(f"Batch size exceeds maximum of {self.max_batch_size} items")
+        
+        check_contexts = False
+        context_errors = []
+        if contexts is not None:
+            if not isinstance(contexts, list):
+                context_errors.append(f"Contexts must be list, got: {type(contexts)}")
+            elif len(contexts) != len(contents):
+                context_errors.append(f"Contexts length ({len(contexts)}) must match contents length ({len(contents)})")
+            else:
+                check_contexts = True
+        
+        # Content errors are reported before context errors
+        for i, content in enumerate(contents):
+            errors.extend(f"Content {i}: {error}" for error in self._content_errors(content))
+            if check_contexts:
+                context_errors.extend(f"Context {i}: {error}" for error in self._context_errors(contexts[i]))
+        
+        errors.extend(context_errors)
+        self._record_validation(start_time)
+        return len(errors) == 0, errors
+    
+    def _content_errors(self, content: Any) -> List[str]:
+        """Get validation errors for one content input"""
+        if content is None:
+            return ["Content cannot be None"]
+        
         if not isinstance(content, str):
             content = str(content)
         
-        # Check content length
+        errors = []
         if len(content) == 0:
             errors.append("Content cannot be empty")
-        elif len(content) > 100000:  # 100K character limit
-            errors.append("Content exceeds maximum length of 100,000 characters")
+        elif len(content) > self.max_content_length:
+            errors.append(f"Content exceeds maximum length of {self.max_content_length:,} characters")
         
-        # Check for reasonable content
         if len(content.strip()) == 0:
             errors.append("Content cannot be only whitespace")
         
-        return len(errors) == 0, errors
+        return errors
     
-    @staticmethod
-    def validate_context_input(context: Any) -> Tuple[bool, List[str]]:
-        """Validate context input for processing"""
-        errors = []
-        
+    def _context_errors(self, context: Any) -> List[str]:
+        """Get validation errors for one context input"""
         # Context can be None (empty context is valid)
         if context is None:
-            return True, errors
+            return []
         
-        # Check if context is dictionary
         if not isinstance(context, dict):
-            errors.append("Context must be a dictionary")
-            return False, errors
+            return ["Context must be a dictionary"]
         
-        # Validate context size
-        if len(context) > 100:  # Max 100 context items
-            errors.append("Context exceeds maximum of 100 items")
+        errors = []
+        if len(context) > self.max_items:
+            errors.append(f"Context exceeds maximum of {self.max_items} items")
         
-        # Validate context keys and values
         for key, value in context.items():
-            # Validate key
             if not isinstance(key, str):
                 errors.append(f"Context key must be string, got: {type(key)}")
             elif len(key) == 0:
                 errors.append("Context key cannot be empty")
-            elif len(key) > 100:
-                errors.append(f"Context key '{key}' exceeds maximum length of 100 characters")
+            elif len(key) > self.max_key_length:
+                errors.append(f"Context key '{key}' exceeds maximum length of {self.max_key_length} characters")
             
-            # Validate value
+            # None values are acceptable
             if value is None:
-                continue  # None values are acceptable
+                continue
             
-            # Check value size (approximate)
-            try:
-                value_str = json.dumps(value, default=str)
-                if len(value_str) > 10000:  # 10K character limit per value
-                    errors.append(f"Context value for key '{key}' exceeds maximum size")
-            except Exception:
-                # If we can't serialize it, it might be too complex
+            exceeds_limit = self._value_exceeds_limit(value)
+            if exceeds_limit is None:
                 errors.append(f"Context value for key '{key}' is too complex")
+            elif exceeds_limit:
+                errors.append(f"Context value for key '{key}' exceeds maximum size")
         
-        return len(errors) == 0, errors
+        return errors
+    
+    def _value_exceeds_limit(self, value: Any) -> Optional[bool]:
+        """Check a value's serialized size, None if it cannot be serialized"""
+        # Only immutable values are memoized, by content hash so they are not kept alive;
+        # mutable containers are re-walked, which the bounded walk keeps cheap
+        cache_key = None
+        if _is_immutable_text(value):
+            cache_key = (type(value).__name__, len(value), hash(value))
+            cached = self._value_sizes.get(cache_key)
+            if cached is not None:
+                return cached
+        
+        try:
+            exceeds_limit = estimate_json_size(value, self.max_value_size) > self.max_value_size
+        except Exception:
+            exceeds_limit = None
+        
+        if cache_key is not None and exceeds_limit is not None:
+            self._value_sizes.put(cache_key, exceeds_limit)
+        return exceeds_limit
+    
+    def _record_validation(self, start_time: float):
+        """Record the time spent in one validation call"""
+        self.validations += 1
+        self.total_validation_time += time.perf_counter() - start_time
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get validation timing and size cache metrics"""
+        return {
+            "validations": self.validations,
+            "total_validation_time": self.total_validation_time,
+            "average_validation_time": self.total_validation_time / self.validations if self.validations else 0.0,
+            "value_size_cache": self._value_sizes.get_stats()
+        }
+
+default_context_validator = ContextValidator()
+
+class ValidationUtils:
+    """Validation utilities for context engineering"""
+    
+    @staticmethod
+    def validate_content_input(content: Any) -> Tuple[bool, List[str]]:
+        """Validate content input for processing"""
+        return default_context_validator.validate_content(content)
+    
+    @staticmethod
+    def validate_context_input(context: Any) -> Tuple[bool, List[str]]:
+        """Validate context input for processing"""
+        return default_context_validator.validate_context(context)
     
     @staticmethod
     def validate_confidence_score(confidence: Any) -> Tuple[bool, List[str]]:
@@ -310,35 +498,4 @@ class ValidationUtils:
         contexts: Optional[List[Any]] = None
     ) -> Tuple[bool, List[str]]:
         """Validate batch processing inputs"""
-        errors = []
-        
-        if not isinstance(contents, list):
-            errors.append(f"Contents must be list, got: {type(contents)}")
-            return False, errors
-        
-        if len(contents) == 0:
-            errors.append("Contents list cannot be empty")
-            return False, errors
-        
-        if len(contents) > 100:  # Reasonable batch size limit
-            errors.append("Batch size exceeds maximum of 100 items")
-        
-        # Validate each content item
-        for i, content in enumerate(contents):
-            content_valid, content_errors = ValidationUtils.validate_content_input(content)
-            if not content_valid:
-                errors.extend([f"Content {i}: {error}" for error in content_errors])
-        
-        # Validate contexts if provided
-        if contexts is not None:
-            if not isinstance(contexts, list):
-                errors.append(f"Contexts must be list, got: {type(contexts)}")
-            elif len(contexts) != len(contents):
-                errors.append(f"Contexts length ({len(contexts)}) must match contents length ({len(contents)})")
-            else:
-                for i, context in enumerate(contexts):
-                    context_valid, context_errors = ValidationUtils.validate_context_input(context)
-                    if not context_valid:
-                        errors.extend([f"Context {i}: {error}" for error in context_errors])
-        
-        return len(errors) == 0, errors
\ No newline at end of file
+        return default_context_validator.validate_batch(contents, contexts)
\ No newline at end of file